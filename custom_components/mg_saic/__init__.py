@@ -2,14 +2,19 @@
 
 import asyncio
 from contextlib import suppress
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady
 from homeassistant.core import HomeAssistant
 
 from .api import SAICMGAPIClient
 from .coordinator import SAICMGDataUpdateCoordinator
-from .message_poller import SAICMGAccountPoller
-from .const import DOMAIN, LOGGER, PLATFORMS
+from .message_poller import SAICMGAccountPoller, async_remove_message_watermark
+from .refresh_scheduler import SAICMGAccountRefreshScheduler
+from .session_store import SAICMGSessionStore
+from .snapshot_store import SAICMGSnapshotStore
+from .usage_store import SAICMGUsageStore
+from .const import DOMAIN, LOGGER, PLATFORMS, VEHICLE_LIST_CACHE_TTL
 from .services import async_setup_services, async_unload_services
 
 # ── Domain-level hass.data structure ─────────────────────────────────────────
@@ -26,6 +31,7 @@ from .services import async_setup_services, async_unload_services
 #   # Account-level singletons keyed by (username, region)
 #   "account_clients":        { account_key: SAICMGAPIClient }   ← THE shared client
 #   "account_pollers":        { account_key: SAICMGAccountPoller }
+#   "account_schedulers":     { account_key: SAICMGAccountRefreshScheduler }
 #   "account_locks":          { account_key: asyncio.Lock }
 #   "account_login_locks":    { account_key: asyncio.Lock }
 #
@@ -46,6 +52,9 @@ from .services import async_setup_services, async_unload_services
 # The account_login_lock serialises the initial login so that if two entries
 # for the same account start simultaneously (HA startup), only one login
 # attempt is made.
+#
+# The account scheduler batches the data fetches of all VINs on the account
+# that fall due together into one lock hold (see refresh_scheduler.py).
 
 
 def _account_key(entry: ConfigEntry) -> tuple[str, str]:
@@ -53,6 +62,16 @@ def _account_key(entry: ConfigEntry) -> tuple[str, str]:
     return (entry.data["username"], entry.data.get("region", ""))
 
 
+def _vehicle_list_ttl(entry: ConfigEntry) -> timedelta:
+    """Return the vehicle list cache lifetime configured on *entry*."""
+    return timedelta(
+        minutes=entry.options.get(
+            "vehicle_list_cache_ttl",
+            int(VEHICLE_LIST_CACHE_TTL.total_seconds() / 60),
+        )
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MG SAIC from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -61,6 +80,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     domain.setdefault("coordinators_by_vin", {})
     domain.setdefault("account_clients", {})
     domain.setdefault("account_pollers", {})
+    domain.setdefault("account_schedulers", {})
     domain.setdefault("account_locks", {})
     domain.setdefault("account_login_locks", {})
     domain.setdefault("services_registered", False)
@@ -81,6 +101,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api_lock = domain["account_locks"][acct_key]
     login_lock = domain["account_login_locks"][acct_key]
 
+    # ── Last-known snapshot for this VIN ─────────────────────────────────────
+    # With a snapshot the entry sets up from it at once (marked stale) and the
+    # first real refresh runs in the background, so neither the login nor the
+    # VIN check below has to wait on the SAIC backend.
+    snapshot_store = SAICMGSnapshotStore(hass, vin) if vin else None
+    snapshot = await snapshot_store.async_load() if snapshot_store else None
+    usage_store = SAICMGUsageStore(hass, vin) if vin else None
+    usage = await usage_store.async_load() if usage_store else None
+
     # ── Get or create the shared account client ───────────────────────────────
     # One SAICMGAPIClient per (username, region).  The SAIC backend maintains a
     # single session per account — two concurrent client instances logging in
@@ -101,9 +130,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 username_is_email,
                 region,
                 entry.data.get("country_code"),
+                vehicle_list_ttl=_vehicle_list_ttl(entry),
             )
+            # Background token renewal takes the account lock so it never
+            # replaces the session under an in-flight request.
+            client.set_api_lock(api_lock)
+            # Restore the session saved before the restart if there is one;
+            # it is validated by the first real API call.  Only log in when
+            # there is nothing usable to restore — and not even then if we
+            # have a snapshot: the background refresh logs in on demand.
+            client.set_session_store(SAICMGSessionStore(hass, acct_key, password))
             try:
-                await client.login()
+                if not await client.async_restore_session() and snapshot is None:
+                    await client.login()
             except Exception as exc:
                 LOGGER.error(
                     "Failed to log in to MG SAIC for account %s (VIN %s): %s",
@@ -127,7 +166,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
     try:
-        vehicles = await client.get_vehicle_info()
+        # A snapshot was only ever saved for a VIN found on this account.
+        vehicles = (
+            snapshot["info"] if snapshot else await client.get_vehicle_info()
+        )
         # A transient SAIC server error (e.g. HTTP 500 on /vehicle/list) can
         # return None or an empty list rather than raising. Treat that as
         # "not ready yet" and let HA retry with backoff, rather than a
@@ -162,31 +204,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # ── Build and wire up the coordinator ────────────────────────────────────
     coordinator = SAICMGDataUpdateCoordinator(hass, client, entry)
     coordinator.set_api_lock(api_lock)
-
-    # If this is a second (or later) VIN on the same account, stagger startup
-    # by a few seconds so both coordinators don't race to hit the SAIC API
-    # simultaneously through the shared client at HA boot time.  Without this,
-    # the second coordinator's async_config_entry_first_refresh frequently times
-    # out waiting for the api_lock while the first coordinator holds it.
-    if acct_key in domain["coordinators_by_vin"] or any(
-        _account_key(e) == acct_key
-        for e in hass.config_entries.async_entries(DOMAIN)
-        if e.entry_id != entry.entry_id and e.entry_id in domain
-    ):
-        LOGGER.debug(
-            "VIN %s is a secondary VIN on account %s — staggering startup by 5s",
-            vin,
-            acct_key,
+    coordinator.set_snapshot_store(snapshot_store, snapshot)
+    coordinator.set_usage_store(usage_store, usage)
+
+    # ── Account-level fused refresh scheduler ───────────────────────────────
+    # All coordinators on the account fetch through one scheduler, which
+    # batches VINs that fall due together into a single lock hold.  This is
+    # also what keeps secondary VINs from timing out at HA startup: their
+    # first refreshes join the same batch instead of queueing for the lock
+    # behind the first VIN (previously papered over with a fixed 5 s sleep).
+    if acct_key not in domain["account_schedulers"]:
+        domain["account_schedulers"][acct_key] = SAICMGAccountRefreshScheduler(
+            hass, client, acct_key, api_lock
         )
-        await asyncio.sleep(5)
+    scheduler = domain["account_schedulers"][acct_key]
+    scheduler.register_coordinator(vin, coordinator)
+    coordinator.set_refresh_scheduler(scheduler)
 
     try:
         await coordinator.async_setup()
     except ConfigEntryNotReady:
         # Propagate so HA marks the entry as "Retrying" and retries automatically.
+        scheduler.unregister_coordinator(vin)
         raise
     except Exception as exc:
         LOGGER.error("Coordinator setup failed for VIN %s: %s", vin, exc)
+        scheduler.unregister_coordinator(vin)
         return False
 
     domain[f"{entry.entry_id}_coordinator"] = coordinator
@@ -222,6 +265,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Tells the SAIC server to queue event messages for us.  Each VIN needs its
     # own registration.  Calls are serialised under the api_lock so they cannot
     # race against concurrent data fetches or each other on multi-VIN accounts.
+    # Runs in the background so a slow SAIC backend doesn't hold up setup.
+    entry.async_create_background_task(
+        hass,
+        _async_register_alarm_switches(client, api_lock, vin),
+        f"mg_saic_alarm_switches_{vin}",
+    )
+
+    # ── Finalise ─────────────────────────────────────────────────────────────
+    entry.async_on_unload(entry.add_update_listener(update_listener))
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if not domain["services_registered"]:
+        await async_setup_services(hass)
+        domain["services_registered"] = True
+
+    LOGGER.info(
+        "MG SAIC integration setup completed for VIN %s (account %s, %d VIN(s) on poller)",
+        vin,
+        acct_key,
+        len(poller._coordinators),
+    )
+    return True
+
+
+async def _async_register_alarm_switches(
+    client: SAICMGAPIClient, api_lock: asyncio.Lock, vin: str
+) -> None:
+    """Register the SAIC alarm switches for *vin* (message-driven updates)."""
     try:
         async with api_lock:
             await asyncio.wait_for(
@@ -242,27 +313,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             exc,
         )
 
-    # ── Finalise ─────────────────────────────────────────────────────────────
-    entry.async_on_unload(entry.add_update_listener(update_listener))
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    if not domain["services_registered"]:
-        await async_setup_services(hass)
-        domain["services_registered"] = True
-
-    LOGGER.info(
-        "MG SAIC integration setup completed for VIN %s (account %s, %d VIN(s) on poller)",
-        vin,
-        acct_key,
-        len(poller._coordinators),
-    )
-    return True
-
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     await coordinator.async_update_options(entry.options)
+    # The vehicle list cache lives on the shared account client, so the most
+    # recently saved options of any VIN on the account win.
+    coordinator.client.vehicle_list_ttl = _vehicle_list_ttl(entry)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -287,6 +345,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if coordinator is not None:
         await coordinator.async_shutdown()
 
+    # ── Scheduler VIN deregistration ──────────────────────────────────────────
+    scheduler = domain.get("account_schedulers", {}).get(acct_key)
+    if scheduler is not None and vin:
+        scheduler.unregister_coordinator(vin)
+        if not scheduler.has_coordinators:
+            await scheduler.async_stop()
+            domain["account_schedulers"].pop(acct_key, None)
+
     # ── Poller VIN deregistration ─────────────────────────────────────────────
     poller = domain.get("account_pollers", {}).get(acct_key)
     if poller is not None and vin:
@@ -321,6 +387,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "coordinators_by_vin",
             "account_clients",
             "account_pollers",
+            "account_schedulers",
             "account_locks",
             "account_login_locks",
             "services_registered",
@@ -331,3 +398,27 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data.pop(DOMAIN, None)
 
     return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete what was stored on disk for a config entry being removed."""
+    acct_key = _account_key(entry)
+    others = [
+        other
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ]
+
+    # ── Account-level stores ──────────────────────────────────────────────────
+    # Shared by every VIN on the account: only removed with its last entry.
+    if not any(_account_key(other) == acct_key for other in others):
+        LOGGER.debug("Removing stored session and watermark for account %s", acct_key)
+        await SAICMGSessionStore(hass, acct_key, entry.data["password"]).async_remove()
+        await async_remove_message_watermark(hass, acct_key)
+
+    # ── Per-VIN stores ────────────────────────────────────────────────────────
+    vin = entry.data.get("vin")
+    if vin and not any(other.data.get("vin") == vin for other in others):
+        LOGGER.debug("Removing stored snapshot and usage profile for VIN %s", vin)
+        await SAICMGSnapshotStore(hass, vin).async_remove()
+        await SAICMGUsageStore(hass, vin).async_remove()
@@ -1,14 +1,29 @@
 # File: api.py
 
 import asyncio
+import time
+from datetime import datetime, timedelta
 from saic_ismart_client_ng import SaicApi
+from saic_ismart_client_ng.exceptions import SaicLogoutException
 from saic_ismart_client_ng.model import SaicApiConfiguration
 from saic_ismart_client_ng.api.vehicle_charging import (
     TargetBatteryCode,
     ChargeCurrentLimitCode as ExternalChargeCurrentLimitCode,
 )
-from .const import LOGGER, REGION_BASE_URIS, BatterySoc, ChargeCurrentLimitOption
-from .logic import normalize_sunroof_action
+from .const import (
+    LOGGER,
+    REGION_BASE_URIS,
+    TOKEN_REFRESH_MARGIN,
+    VEHICLE_LIST_CACHE_TTL,
+    BatterySoc,
+    ChargeCurrentLimitOption,
+)
+from .logic import (
+    SessionGeneration,
+    is_auth_error_message,
+    normalize_sunroof_action,
+    token_refresh_delay,
+)
 
 
 class CommandsLimitReachedException(Exception):
@@ -29,6 +44,7 @@ class SAICMGAPIClient:
         username_is_email=True,
         region=None,
         country_code=None,
+        vehicle_list_ttl: timedelta = VEHICLE_LIST_CACHE_TTL,
     ):
         self.username = username
         self.password = password
@@ -37,36 +53,101 @@ class SAICMGAPIClient:
         self.username_is_email = username_is_email
         self.country_code = country_code
         self._login_lock = asyncio.Lock()
+        # Bumped on every successful login; lets concurrent callers that hit
+        # an auth failure share one re-login (see async_reauthenticate).
+        self._session = SessionGeneration(self._login_lock)
         if region is None:
             LOGGER.debug("No region specified, defaulting to Europe.")
         self.region_name = region if region is not None else "Europe"
 
+        # Account-level vehicle list cache (see get_vehicle_info).  The client
+        # is shared by every VIN on the account, so one cached list serves all
+        # coordinators; _vehicle_list_task lets concurrent callers share a
+        # single in-flight /vehicle/list request instead of issuing one each.
+        self.vehicle_list_ttl = vehicle_list_ttl
+        self._vehicle_list = None
+        self._vehicle_list_fetched_at: float | None = None
+        self._vehicle_list_task: asyncio.Task | None = None
+
+        # Session token lifetime, tracked on the monotonic clock so the token
+        # can be renewed in the background before it expires (see
+        # _schedule_token_refresh).  The account api_lock is injected by
+        # __init__ via set_api_lock so a renewal never swaps the session out
+        # from under an in-flight request.
+        self._api_lock: asyncio.Lock | None = None
+        self._token_issued_at: float | None = None
+        self._token_lifetime: float | None = None
+        self._token_refresh_handle: asyncio.TimerHandle | None = None
+        self._token_refresh_task: asyncio.Task | None = None
+
+        # Optional encrypted persistence of the session across HA restarts
+        # (see session_store.py and async_restore_session).
+        self._session_store = None
+        self._session_save_task: asyncio.Task | None = None
+
+    def set_api_lock(self, lock: asyncio.Lock) -> None:
+        """Inject the account-level api_lock shared with the coordinators."""
+        self._api_lock = lock
+
+    def set_session_store(self, store) -> None:
+        """Inject the SAICMGSessionStore used to persist the session token."""
+        self._session_store = store
+
     # GENERAL API HANDLING
     async def _ensure_initialized(self):
-        """Ensure that the APIs are initialized and logged in."""
-        if not self.saic_api or not self.saic_api.is_logged_in:
+        """Ensure that the APIs are initialized and logged in.
+
+        Also renews the token if it is about to expire — normally the
+        background renewal has already done so, but its timer may have been
+        delayed (e.g. the host was suspended).
+        """
+        if self._needs_login():
             async with self._login_lock:
-                if not self.saic_api or not self.saic_api.is_logged_in:
+                if self._needs_login():
                     await self.login()
 
+    def _needs_login(self) -> bool:
+        """Return True if there is no usable session for the next call."""
+        if not self.saic_api or not self.saic_api.is_logged_in:
+            return True
+        return self._token_refresh_due()
+
+    async def ensure_logged_in(self):
+        """Log in if there is no live session yet (no-op otherwise)."""
+        await self._ensure_initialized()
+
+    @property
+    def session_generation(self) -> int:
+        """Return the generation of the current session (bumped per login)."""
+        return self._session.generation
+
+    @staticmethod
+    def is_auth_error(exc: Exception) -> bool:
+        """Return True if *exc* means the server rejected our session."""
+        return isinstance(exc, SaicLogoutException) or is_auth_error_message(exc)
+
+    async def async_reauthenticate(self, generation: int) -> None:
+        """Re-login after an auth failure seen on session *generation*.
+
+        At most one login happens per generation: callers that fail on the
+        same session share a single re-login, and a caller whose generation is
+        already stale returns immediately and simply retries on the new one.
+        """
+        await self._session.async_renew(generation, self.login)
+
     async def _make_api_call(self, api_call, *args, **kwargs):
         """Wrap API calls to handle token expiration, re-login, and command limits."""
         await self._ensure_initialized()
+        generation = self.session_generation
         try:
             return await api_call(*args, **kwargs)
         except Exception as e:
             error_message = str(e).lower()
-            if (
-                "invalid session" in error_message
-                or "token expired" in error_message
-                or "not logged in" in error_message
-            ):
+            if self.is_auth_error(e):
                 LOGGER.warning(
                     "Token expired or session invalid, attempting to re-login."
                 )
-                async with self._login_lock:
-                    if not self.saic_api.is_logged_in:
-                        await self.login()
+                await self.async_reauthenticate(generation)
                 try:
                     return await api_call(*args, **kwargs)
                 except Exception as retry_e:
@@ -82,8 +163,17 @@ class SAICMGAPIClient:
                 LOGGER.error(f"API call failed: {e}")
                 raise
 
-    async def login(self):
-        """Authenticate with the API."""
+    async def _get_saic_api(self):
+        """Return the client's SaicApi instance, creating it on first use.
+
+        One SaicApi (and with it one HTTP connection pool) is kept for the
+        whole life of the client.  Re-authentication logs in again on the same
+        instance, so keep-alive connections and TLS sessions survive token
+        renewal instead of being rebuilt on every login.
+        """
+        if self.saic_api is not None:
+            return self.saic_api
+
         # Get the base_url for this region
         base_uri = REGION_BASE_URIS.get(self.region_name)
         if not base_uri:
@@ -98,21 +188,216 @@ class SAICMGAPIClient:
             else None,
             username_is_email=self.username_is_email,
         )
-        LOGGER.debug(
-            "Logging in with base URL: %s for region: %s", base_uri, self.region_name
-        )
-
+        # SaicApi builds its SSL context on construction, which blocks.
         self.saic_api = await asyncio.to_thread(SaicApi, config)
+        return self.saic_api
+
+    async def login(self):
+        """Authenticate with the API (re-using the existing SaicApi instance)."""
+        saic_api = await self._get_saic_api()
+        LOGGER.debug("Logging in for region: %s", self.region_name)
 
         try:
-            await self.saic_api.login()
-            if not self.saic_api.is_logged_in:
+            login_resp = await saic_api.login()
+            if not saic_api.is_logged_in:
                 raise Exception("Login failed")
             LOGGER.debug("Login successful, initializing vehicle APIs.")
+            # A new session may see a different vehicle list (car added to or
+            # removed from the account) — don't keep serving the old one.
+            self.invalidate_vehicle_list()
         except Exception as e:
             LOGGER.error("Failed to log in to MG SAIC API: %s", e)
-            self.saic_api = None
+            # Keep the instance (and its connections).  If the previous token
+            # is still valid the library keeps using it until it expires.
+            self._clear_token_tracking()
+            raise
+
+        self._session.advance()
+        self._record_token(login_resp)
+        self._save_session(getattr(login_resp, "access_token", None))
+
+    # SESSION PERSISTENCE
+
+    async def async_restore_session(self) -> bool:
+        """Restore the session saved before the last restart, if still usable.
+
+        The restored token is not checked here — that would cost a request.
+        It is validated lazily by the first real API call: if the server
+        rejects it, the normal auth-failure path (async_reauthenticate) logs
+        in afresh.  Returns False if there is nothing usable to restore, in
+        which case the caller should log in.
+        """
+        if self._session_store is None:
+            return False
+        session = await self._session_store.async_load()
+        if not session:
+            return False
+
+        try:
+            token = session["token"]
+            lifetime = float(session["lifetime"])
+            elapsed = time.time() - float(session["issued_at"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if not token or elapsed < 0:
+            return False
+        if token_refresh_delay(lifetime, elapsed, TOKEN_REFRESH_MARGIN.total_seconds()) <= 0:
+            LOGGER.debug("Stored session is due for renewal; logging in instead.")
+            return False
+
+        saic_api = await self._get_saic_api()
+        # The library has no public way to set a token; these are the
+        # attributes AbstractSaicApi.login() itself fills in on the
+        # saic-ismart-client-ng version pinned in manifest.json.  Check all of
+        # them first: assigning to a renamed one would silently create a new
+        # attribute and leave a half-injected session on the client.
+        api_client = getattr(saic_api, "_AbstractSaicApi__api_client", None)
+        if (
+            api_client is None
+            or not hasattr(api_client, "user_token")
+            or not hasattr(saic_api, "_AbstractSaicApi__token_expiration")
+        ):
+            LOGGER.debug("Cannot restore session on this library version.")
+            return False
+        previous_token = api_client.user_token
+        previous_expiration = saic_api._AbstractSaicApi__token_expiration
+        api_client.user_token = token
+        saic_api._AbstractSaicApi__token_expiration = datetime.now() + timedelta(
+            seconds=lifetime - elapsed
+        )
+        if not saic_api.is_logged_in:
+            # Don't leave the rejected token on the client for the login
+            # that follows.
+            api_client.user_token = previous_token
+            saic_api._AbstractSaicApi__token_expiration = previous_expiration
+            return False
+
+        self._session.advance()
+        self._token_issued_at = time.monotonic() - elapsed
+        self._token_lifetime = lifetime
+        self._schedule_token_refresh()
+        LOGGER.debug(
+            "Restored stored session for region %s (%.0f s left).",
+            self.region_name,
+            lifetime - elapsed,
+        )
+        return True
+
+    def _save_session(self, token) -> None:
+        """Persist the current token in the background (if a store is set)."""
+        if self._session_store is None or not token or self._token_lifetime is None:
+            return
+        session = {
+            "token": token,
+            "issued_at": time.time(),
+            "lifetime": self._token_lifetime,
+        }
+        self._session_save_task = asyncio.ensure_future(
+            self._async_save_session(session)
+        )
+
+    async def _async_save_session(self, session: dict) -> None:
+        try:
+            await self._session_store.async_save(session)
+        except Exception as e:
+            LOGGER.warning("Could not store MG SAIC session: %s", e)
+
+    # TOKEN RENEWAL
+
+    def _record_token(self, login_resp) -> None:
+        """Remember when the new token was issued and how long it lives.
+
+        The lifetime comes from the login response's expires_in (seconds),
+        falling back to the library's token_expiration.  If neither is
+        available the token is only renewed reactively, as before.
+        """
+        lifetime = getattr(login_resp, "expires_in", None)
+        if not lifetime:
+            expiration = getattr(self.saic_api, "token_expiration", None)
+            if isinstance(expiration, datetime):
+                now = datetime.now(expiration.tzinfo)
+                lifetime = (expiration - now).total_seconds()
+
+        try:
+            lifetime = float(lifetime)
+        except (TypeError, ValueError):
+            lifetime = 0.0
+        if lifetime <= 0:
+            LOGGER.debug("Token lifetime unknown; proactive renewal disabled.")
+            self._clear_token_tracking()
+            return
+
+        self._token_issued_at = time.monotonic()
+        self._token_lifetime = lifetime
+        self._schedule_token_refresh()
+
+    def _clear_token_tracking(self) -> None:
+        """Forget the token lifetime and cancel any pending renewal timer."""
+        self._token_issued_at = None
+        self._token_lifetime = None
+        if self._token_refresh_handle is not None:
+            self._token_refresh_handle.cancel()
+            self._token_refresh_handle = None
+
+    def _token_refresh_delay(self) -> float | None:
+        """Return seconds until the token should be renewed (None if unknown)."""
+        if self._token_issued_at is None or self._token_lifetime is None:
+            return None
+        return token_refresh_delay(
+            self._token_lifetime,
+            time.monotonic() - self._token_issued_at,
+            TOKEN_REFRESH_MARGIN.total_seconds(),
+        )
+
+    def _token_refresh_due(self) -> bool:
+        """Return True if the current token is within its renewal margin."""
+        delay = self._token_refresh_delay()
+        return delay is not None and delay <= 0
+
+    def _schedule_token_refresh(self) -> None:
+        """(Re)arm the background renewal timer for the current token."""
+        if self._token_refresh_handle is not None:
+            self._token_refresh_handle.cancel()
+            self._token_refresh_handle = None
+
+        delay = self._token_refresh_delay()
+        if delay is None:
+            return
+
+        LOGGER.debug("Session token renewal scheduled in %.0f s.", delay)
+        self._token_refresh_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_token_refresh
+        )
+
+    def _start_token_refresh(self) -> None:
+        """Timer callback: renew the token in a background task."""
+        self._token_refresh_handle = None
+        if self._token_refresh_task is not None and not self._token_refresh_task.done():
+            return
+        self._token_refresh_task = asyncio.ensure_future(self._async_refresh_token())
+
+    async def _async_refresh_token(self) -> None:
+        """Renew the session token before it expires.
+
+        Takes the account api_lock first (same order as the data path, which
+        reaches _login_lock while holding it), so no request is in flight on
+        the old session while it is replaced.
+        """
+        api_lock = self._api_lock or asyncio.Lock()
+        try:
+            async with api_lock, self._login_lock:
+                if not self._token_refresh_due():
+                    # Someone logged in meanwhile; login() re-armed the timer.
+                    return
+                LOGGER.debug("Renewing MG SAIC session token before it expires.")
+                await self.login()
+        except asyncio.CancelledError:
             raise
+        except Exception as e:
+            # The old token stays on the SaicApi instance and is used until it
+            # actually expires; after that the next API call logs in again
+            # through _ensure_initialized.
+            LOGGER.warning("Background session renewal failed: %s", e)
 
     # GET VEHICLE DATA
 
@@ -136,15 +421,61 @@ class SAICMGAPIClient:
             LOGGER.error("Error retrieving charging information for VIN %s: %s", target_vin, e)
             return None
 
-    async def get_vehicle_info(self):
-        """Retrieve vehicle information."""
+    async def get_vehicle_info(self, force_refresh: bool = False):
+        """Retrieve the account's vehicle list, served from the account cache.
+
+        The list is cached for vehicle_list_ttl and shared by every VIN on the
+        account, so a normal coordinator refresh only costs status + charging.
+        Concurrent callers share one in-flight fetch rather than each issuing
+        their own /vehicle/list request.  force_refresh=True drops the cached
+        copy first — coordinators use it when their own VIN is missing from
+        the cached list.
+
+        Returns None on error (nothing is cached in that case).
+        """
+        if force_refresh:
+            self.invalidate_vehicle_list()
+        elif self._vehicle_list_is_fresh():
+            return self._vehicle_list
+
+        task = self._vehicle_list_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch_vehicle_list())
+            self._vehicle_list_task = task
+
+        # Shield the shared fetch so that one caller being cancelled (e.g. a
+        # startup timeout) doesn't cancel it for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    async def _fetch_vehicle_list(self):
+        """Fetch /vehicle/list from the API and store it in the cache."""
         try:
             vehicle_list_resp = await self._make_api_call(self.saic_api.vehicle_list)
-            return vehicle_list_resp.vinList
+            vehicles = vehicle_list_resp.vinList
         except Exception as e:
             LOGGER.error("Error retrieving vehicle info: %s", e)
             return None
 
+        # Only cache a usable list — an empty list is usually a transient
+        # SAIC-side error (see __init__.async_setup_entry) and must not be
+        # served to other VINs for the whole TTL.
+        if vehicles:
+            self._vehicle_list = vehicles
+            self._vehicle_list_fetched_at = time.monotonic()
+        return vehicles
+
+    def _vehicle_list_is_fresh(self) -> bool:
+        """Return True if the cached vehicle list is within its TTL."""
+        if self._vehicle_list is None or self._vehicle_list_fetched_at is None:
+            return False
+        age = time.monotonic() - self._vehicle_list_fetched_at
+        return age < self.vehicle_list_ttl.total_seconds()
+
+    def invalidate_vehicle_list(self) -> None:
+        """Drop the cached vehicle list so the next caller re-fetches it."""
+        self._vehicle_list = None
+        self._vehicle_list_fetched_at = None
+
     async def get_vehicle_status(self, vin: str | None = None):
         """Retrieve vehicle status for *vin* (defaults to self.vin).
 
@@ -577,6 +908,20 @@ class SAICMGAPIClient:
     # SESSION MANAGEMENT
     async def close(self):
         """Close the client session."""
+        self._clear_token_tracking()
+        if self._token_refresh_task is not None and not self._token_refresh_task.done():
+            self._token_refresh_task.cancel()
+        self._token_refresh_task = None
+
+        if self._vehicle_list_task is not None and not self._vehicle_list_task.done():
+            self._vehicle_list_task.cancel()
+        self._vehicle_list_task = None
+        self.invalidate_vehicle_list()
+
+        if self._session_save_task is not None and not self._session_save_task.done():
+            self._session_save_task.cancel()
+        self._session_save_task = None
+
         if self.saic_api is None:
             return
 
@@ -6,7 +6,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, LOGGER
-from .utils import create_device_info
+from .snapshot import fields_context
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -14,7 +14,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
 
     try:
-        if not coordinator.data.get("info"):
+        if coordinator.vin_info is None:
             LOGGER.error("Failed to retrieve vehicle info.")
             return
 
@@ -254,16 +254,17 @@ class SAICMGBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     def __init__(self, coordinator, entry, name, field, device_class, icon, data_type):
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._name = name
+        super().__init__(
+            coordinator, context=fields_context(field, data_type=data_type)
+        )
+        self._name = coordinator.identity.name(name)
         self._field = field
         self._device_class = device_class
         self._icon = icon
         self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}_binary_sensor"
+        self._unique_id = coordinator.identity.unique_id(f"{field}_binary_sensor")
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def unique_id(self):
@@ -272,33 +273,22 @@ class SAICMGBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
+        return self._name
 
     @property
     def available(self):
         """Return True if the entity is available."""
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
+        return self.coordinator.last_update_success and self.coordinator.data.has_data(
+            self._data_type
+        )
 
     @property
     def is_on(self):
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            if self._data_type == "status":
-                status_data = getattr(data, "basicVehicleStatus", None)
-                if status_data:
-                    value = getattr(status_data, self._field, None)
-                    if value is not None:
-                        if self._field == "lockStatus":
-                            return value == 0
-                        return bool(value)
-            elif self._data_type == "charging":
-                charging_status_data = getattr(data, "rvsChargeStatus", None)
-                if charging_status_data:
-                    value = getattr(charging_status_data, self._field, None)
-                    if value is not None:
-                        return bool(value)
+        value = getattr(self.coordinator.data, self._field)
+        if value is not None:
+            if self._field == "lockStatus":
+                return value == 0
+            return bool(value)
         return False
 
     @property
@@ -333,17 +323,17 @@ class SAICMGChargingBinarySensor(CoordinatorEntity, BinarySensorEntity):
         data_type,
     ):
         """Initialize the charging binary sensor."""
-        super().__init__(coordinator)
-        self._name = name
+        super().__init__(
+            coordinator, context=fields_context(field, data_type=data_type)
+        )
+        self._name = coordinator.identity.name(name)
         self._field = field
         self._device_class = device_class
         self._icon = icon
-        self._data_source = data_source
         self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}_binary_sensor"
+        self._unique_id = coordinator.identity.unique_id(f"{field}_binary_sensor")
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def unique_id(self):
@@ -353,25 +343,21 @@ class SAICMGChargingBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def name(self):
         """Return the name of the binary sensor."""
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
+        return self._name
 
     @property
     def available(self):
         """Return True if the entity is available."""
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
+        return self.coordinator.last_update_success and self.coordinator.data.has_data(
+            self._data_type
+        )
 
     @property
     def is_on(self):
         """Return true if the charging gun is connected."""
-        charging_data = self.coordinator.data.get(self._data_type)
-        if charging_data:
-            data_source = getattr(charging_data, self._data_source, None)
-            if data_source:
-                value = getattr(data_source, self._field, None)
-                if value is not None:
-                    return bool(value)
+        value = getattr(self.coordinator.data, self._field)
+        if value is not None:
+            return bool(value)
         return None
 
     @property
@@ -8,7 +8,6 @@ from .const import (
     DOMAIN,
     LOGGER,
 )
-from .utils import create_device_info
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -16,7 +15,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     client = hass.data[DOMAIN][entry.entry_id]
 
-    if not coordinator.data.get("info"):
+    if coordinator.vin_info is None:
         LOGGER.error("Vehicle info is not available. Buttons cannot be set up.")
         return
 
@@ -41,13 +40,13 @@ class SAICMGButton(CoordinatorEntity, ButtonEntity):
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} {name}"
-        self._attr_unique_id = (
-            f"{entry.entry_id}_{vin}_{name.replace(' ', '_').lower()}_button"
+        self._attr_name = coordinator.identity.name(name)
+        self._attr_unique_id = coordinator.identity.unique_id(
+            f"{name.replace(' ', '_').lower()}_button"
         )
         self._attr_icon = icon
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -78,10 +77,10 @@ class SAICMGTriggerAlarmButton(CoordinatorEntity, ButtonEntity):
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Trigger Alarm"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_trigger_alarm_button"
+        self._attr_name = coordinator.identity.name("Trigger Alarm")
+        self._attr_unique_id = coordinator.identity.unique_id("trigger_alarm_button")
         self._attr_icon = "mdi:alarm-light"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     async def async_press(self):
         """Handle the button press."""
@@ -117,12 +116,12 @@ class SAICMGUpdateDataButton(CoordinatorEntity, ButtonEntity):
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = (
-            f"{vin_info.brandName} {vin_info.modelName} Update Vehicle Data"
+        self._attr_name = coordinator.identity.name("Update Vehicle Data")
+        self._attr_unique_id = coordinator.identity.unique_id(
+            "update_vehicle_data_button"
         )
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_update_vehicle_data_button"
         self._attr_icon = "mdi:update"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     async def async_press(self):
         """Handle the button press."""
@@ -154,10 +153,10 @@ class SAICMGOpenBootButton(CoordinatorEntity, ButtonEntity):
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Open Boot"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_open_boot_button"
+        self._attr_name = coordinator.identity.name("Open Boot")
+        self._attr_unique_id = coordinator.identity.unique_id("open_boot_button")
         self._attr_icon = "mdi:car-back"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
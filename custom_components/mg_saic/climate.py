@@ -20,7 +20,6 @@ from .const import (
     DOMAIN,
     LOGGER,
 )
-from .utils import create_device_info
 
 # Preset names used by the "mode_select" climate scheme (e.g. IS31P / MG S9 PHEV).
 # These are exposed as HA preset_modes for modes that don't map cleanly onto a
@@ -35,7 +34,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     client = hass.data[DOMAIN][entry.entry_id]
 
-    if not coordinator.data.get("info"):
+    if coordinator.vin_info is None:
         LOGGER.error("Vehicle info is not available. Climate cannot be set up.")
         return
 
@@ -74,11 +73,11 @@ class SAICMGClimateEntity(CoordinatorEntity, ClimateEntity):
         self._series = vin_info.series
         self._scheme = coordinator.climate_control_scheme
 
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Climate"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_climate"
+        self._attr_name = coordinator.identity.name("Climate")
+        self._attr_unique_id = coordinator.identity.unique_id("climate")
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
         # Common initial state
         self._attr_min_temp = self.min_temp
@@ -147,21 +146,13 @@ class SAICMGClimateEntity(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self):
         """Return the current interior temperature."""
-        status = self.coordinator.data.get("status")
-        if status:
-            interior_temp = getattr(
-                status.basicVehicleStatus, "interiorTemperature", None
-            )
-            if interior_temp is not None and interior_temp != -128:
-                return interior_temp
-        return None
+        return self.coordinator.data.interiorTemperature
 
     def _current_climate_status(self):
         """Return the car's current remoteClimateStatus, or None if unavailable."""
-        status = self.coordinator.data.get("status")
-        if status and status.basicVehicleStatus:
-            return getattr(status.basicVehicleStatus, "remoteClimateStatus", 0)
-        return None
+        if not self.coordinator.data.has_status:
+            return None
+        return self.coordinator.data.remoteClimateStatus or 0
 
     @property
     def hvac_mode(self):
@@ -419,7 +410,7 @@ class SAICMGClimateEntity(CoordinatorEntity, ClimateEntity):
         """Return True if the climate entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("status") is not None
+            and self.coordinator.data.has_status
         )
 
     def _fan_speed_to_int(self):
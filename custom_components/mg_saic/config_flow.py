@@ -1,5 +1,6 @@
 # File: config_flow.py
 
+import asyncio
 import logging
 import voluptuous as vol
 from homeassistant import config_entries
@@ -25,17 +26,19 @@ from .const import (
     DEFAULT_TARGET_SOC_LONG_INTERVAL,
     DOMAIN,
     LOGGER,
-    REGION_BASE_URIS,
+    REFRESH_COALESCE_WINDOW,
     REGION_CHOICES,
+    SENSOR_DEADBANDS,
+    TRACKER_MIN_DISTANCE,
     UPDATE_INTERVAL,
     UPDATE_INTERVAL_AFTER_SHUTDOWN,
     UPDATE_INTERVAL_CHARGING,
     UPDATE_INTERVAL_DC_CHARGING,
     UPDATE_INTERVAL_GRACE_PERIOD,
     UPDATE_INTERVAL_POWERED,
+    VEHICLE_LIST_CACHE_TTL,
 )
-from saic_ismart_client_ng import SaicApi
-from saic_ismart_client_ng.model import SaicApiConfiguration
+from .api import SAICMGAPIClient
 
 
 @callback
@@ -199,50 +202,62 @@ class SAICMGConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def fetch_vehicle_data(self, username_is_email):
-        """Authenticate and fetch vehicle data."""
-
-        # Get the base_url for the selected region
-        base_uri = REGION_BASE_URIS.get(self.region)
-        if not base_uri:
-            raise ValueError(f"Base URL not defined for region: {self.region}")
-
-        config = SaicApiConfiguration(
-            username=self.username,
-            password=self.password,
-            base_uri=base_uri,
-            phone_country_code=self.country_code if not username_is_email else None,
-            username_is_email=username_is_email,
-        )
+        """Authenticate and fetch vehicle data.
 
+        If the account is already set up (adding a second car), the shared
+        account client is reused: logging in with a separate client would
+        invalidate the session every configured VIN is using.  Otherwise a
+        temporary client is created for the flow and closed afterwards.
+        """
         LOGGER.debug(
-            "Logging in with Username: %s, Country Code: %s, Email: %s, Region: %s, Base URL: %s",
+            "Logging in with Username: %s, Country Code: %s, Email: %s, Region: %s",
             self.username,
             self.country_code,
             username_is_email,
             self.region,
-            base_uri,
         )
 
-        # Initialize SaicApi in the executor to avoid blocking the event loop
-        saic_api = await self.hass.async_add_executor_job(SaicApi, config)
+        domain = self.hass.data.get(DOMAIN, {})
+        acct_key = (self.username, self.region or "")
+        client = domain.get("account_clients", {}).get(acct_key)
+        if client is not None and client.password != self.password:
+            client = None
+        owns_client = client is None
+        if owns_client:
+            client = SAICMGAPIClient(
+                self.username,
+                self.password,
+                username_is_email=username_is_email,
+                region=self.region,
+                country_code=self.country_code if not username_is_email else None,
+            )
 
         try:
-            await saic_api.login()
-            vehicle_list_resp = await saic_api.vehicle_list()
-            LOGGER.debug("Vehicle list response: %s", vehicle_list_resp)
-
-            if (
-                not hasattr(vehicle_list_resp, "vinList")
-                or not vehicle_list_resp.vinList
-            ):
+            # A shared client is only used under its account lock.
+            api_lock = None if owns_client else domain["account_locks"].get(acct_key)
+            async with api_lock or asyncio.Lock():
+                vehicles = await self._fetch_vehicle_list(client)
+            LOGGER.debug("Vehicle list response: %s", vehicles)
+
+            if not vehicles:
                 raise Exception("Vehicle list API returned no vehicles")
 
-            # Now safely iterate over vinList
-            self.vehicles = [car.vin for car in vehicle_list_resp.vinList]
+            self.vehicles = [car.vin for car in vehicles]
             LOGGER.info("Fetched vehicle data successfully.")
         except Exception as e:
             LOGGER.error("Error fetching vehicle data: %s", e)
             raise
+        finally:
+            if owns_client:
+                await client.close()
+
+    @staticmethod
+    async def _fetch_vehicle_list(client):
+        """Log in if needed and fetch an up-to-date vehicle list."""
+        # ensure_logged_in raises on bad credentials, which get_vehicle_info
+        # would otherwise swallow.
+        await client.ensure_logged_in()
+        return await client.get_vehicle_info(force_refresh=True)
 
     @staticmethod
     @callback
@@ -354,6 +369,15 @@ class SAICMGOptionsFlowHandler(config_entries.OptionsFlow):
                         self.get_seconds(AFTER_ACTION_UPDATE_INTERVAL_DELAY),
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                # Window in seconds after a refresh that absorbs other pending
+                # refresh requests
+                vol.Optional(
+                    "refresh_coalesce_window",
+                    default=self.options.get(
+                        "refresh_coalesce_window",
+                        self.get_seconds(REFRESH_COALESCE_WINDOW),
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
                 # Long-interval updates after actions in minutes
                 vol.Optional(
                     "alarm_long_interval",
@@ -445,6 +469,28 @@ class SAICMGOptionsFlowHandler(config_entries.OptionsFlow):
                         self.get_minutes(DEFAULT_CHARGING_CURRENT_LONG_INTERVAL),
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                # Account-level caches
+                vol.Optional(
+                    "vehicle_list_cache_ttl",
+                    default=self.options.get(
+                        "vehicle_list_cache_ttl",
+                        self.get_minutes(VEHICLE_LIST_CACHE_TTL),
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                # Movement in metres below which GPS fixes are not written
+                vol.Optional(
+                    "tracker_min_distance",
+                    default=self.options.get(
+                        "tracker_min_distance", TRACKER_MIN_DISTANCE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                # Sensor deadbands in the sensor's unit (0 disables)
+                **{
+                    vol.Optional(key, default=self.options.get(key, default)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    )
+                    for key, default in SENSOR_DEADBANDS.items()
+                },
             }
         )
 
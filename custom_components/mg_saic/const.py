@@ -371,6 +371,11 @@ UPDATE_INTERVAL_CHARGING = timedelta(minutes=5)
 UPDATE_INTERVAL_DC_CHARGING = timedelta(minutes=5)
 UPDATE_INTERVAL_POWERED = timedelta(minutes=15)
 
+# Longest poll interval while charging with a predicted finish: far from the
+# finish polls stretch from the charging interval up to this
+# (logic.charging_poll_interval).
+UPDATE_INTERVAL_CHARGING_MAX = timedelta(minutes=30)
+
 # Additional Update Intervals
 UPDATE_INTERVAL_AFTER_SHUTDOWN = timedelta(minutes=2)
 UPDATE_INTERVAL_GRACE_PERIOD = timedelta(minutes=10)
@@ -378,6 +383,33 @@ UPDATE_INTERVAL_GRACE_PERIOD = timedelta(minutes=10)
 # After action immediate and refresh intervals
 AFTER_ACTION_UPDATE_INTERVAL_DELAY = timedelta(seconds=15)
 
+# Refresh requests (interval, action follow-ups, post-shutdown steps, message
+# events) due within this window after a fetch are absorbed into it.
+# Kept below AFTER_ACTION_UPDATE_INTERVAL_DELAY so an action's confirming
+# refresh is not folded into the one fired right after the command.
+# Users can override this via the integration options; the coordinator
+# clamps it below the configured after-action delay
+# (logic.coalesce_window_limit).
+REFRESH_COALESCE_WINDOW = timedelta(seconds=10)
+
+# Sensor deadbands (option key → default threshold, in the sensor's unit).
+# A reading within the deadband of a sensor's published value does not
+# change its state, so one-step jitter between polls is not written to the
+# state machine and the recorder.  Defaults sit between one and two steps of
+# the API's resolution.  Users can override these via the integration
+# options; 0 disables the filter.
+SENSOR_DEADBANDS = {
+    "deadband_battery_voltage": 0.15,  # V, 0.1 V steps
+    "deadband_temperature": 1.5,  # °C, 1 °C steps
+    "deadband_tyre_pressure": 0.06,  # bar, 0.04 bar steps
+    "deadband_power": 0.1,  # kW
+}
+
+# GPS location updates that moved the car less than this many metres are not
+# written: a parked car's fix wanders by a few metres from poll to poll.
+# Users can override this via the integration options; 0 writes every fix.
+TRACKER_MIN_DISTANCE = 20
+
 # Default additional long-interval updates after actions
 DEFAULT_ALARM_LONG_INTERVAL = timedelta(minutes=5)
 DEFAULT_AC_LONG_INTERVAL = timedelta(minutes=15)
@@ -411,10 +443,29 @@ GENERIC_RESPONSE_EXTREME_TEMPERATURE = -128
 STATUS_TIMESTAMP_FUTURE_TOLERANCE = timedelta(minutes=5)
 STATUS_TIMESTAMP_MAX_AGE = timedelta(hours=24)
 
+# Account-level vehicle list cache lifetime. The vehicle list (brand, model,
+# series, model configuration) is effectively static, so every VIN on an
+# account shares one cached copy instead of re-fetching /vehicle/list on each
+# refresh. The cache is also dropped on re-login and when a coordinator can't
+# find its own VIN in it. Users can override this via the integration options.
+VEHICLE_LIST_CACHE_TTL = timedelta(hours=6)
+
 # Retry configuration
 RETRY_LIMIT = 5
 RETRY_BACKOFF_FACTOR = 15
 
+# Total time budget for one coordinator update cycle (vehicle info + status +
+# charging, including every retry). Retries stop once the next backoff would
+# overrun it. The account lock is released while a retry backs off (see
+# SAICMGDataUpdateCoordinator._fetch_with_retries), so this bounds how stale a
+# flaky VIN's own data can get without holding up its account siblings.
+UPDATE_CYCLE_DEADLINE = 90
+
+# Session token renewal (see SAICMGAPIClient._schedule_token_refresh). The
+# client renews its token in the background this long before it expires, so
+# expiry never surfaces as a failed data fetch or command.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=10)
+
 # Maximum seconds to wait for the very first API fetch during HA startup.
 # If the SAIC server is unreachable and we exceed this, we raise
 # ConfigEntryNotReady so HA can finish booting and retry in the background
@@ -434,6 +485,9 @@ STARTUP_API_TIMEOUT = 15
 # frequent refresh cadence as AC/DC charging sessions.
 CHARGING_STATUS_CODES = {1, 3, 10, 12, 13}
 
+# bmsOnBdChrgTrgtSOCDspCmd code → target SOC in percent.
+TARGET_SOC_PERCENT = {1: 40, 2: 50, 3: 60, 4: 70, 5: 80, 6: 90, 7: 100}
+
 # Charging Current Limit options
 CHARGING_CURRENT_OPTIONS = ["0A (Ignore)", "6A", "8A", "16A", "Max"]
 
@@ -2,13 +2,23 @@
 
 from datetime import datetime, timedelta, timezone
 import asyncio
-from contextlib import suppress
 from homeassistant.config_entries import ConfigEntryNotReady
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.util.dt import utcnow
+from homeassistant.util.dt import as_local, utcnow
 from .api import SAICMGAPIClient, CommandsLimitReachedException
-from .logic import select_update_interval
+from .logic import (
+    ChargeProgress,
+    PlugInHistory,
+    RefreshQueue,
+    ReleasableLockHold,
+    UsageProfile,
+    coalesce_window_limit,
+    listeners_to_notify,
+    select_update_interval,
+)
+from .snapshot import VehicleSnapshot
+from .utils import VehicleIdentity
 
 # After the car turns off, fire extra refreshes at these intervals (seconds)
 # to catch plug-in as quickly as possible.  The coordinator is still on its
@@ -16,8 +26,28 @@ from .logic import select_update_interval
 # full powered interval before detecting plug-in.
 # The sequence exits early as soon as is_charging is detected.
 # Sequence: 1 min, 3 min, 7 min, 15 min, 25 min → catches plug-in within ~1-25 min.
+# This is the default until the vehicle's own plug-in delays are known
+# (logic.PlugInHistory).
 POST_SHUTDOWN_REFRESH_SEQUENCE = [60, 120, 240, 480, 600]
 
+# Refresh queue reasons and their priorities.  Requests that share a fetch
+# are logged under the most urgent one.
+REFRESH_INTERVAL = "interval"
+REFRESH_USAGE = "usage profile"
+REFRESH_CHARGE_FINISH = "charge finish"
+REFRESH_POST_SHUTDOWN = "post-shutdown"
+REFRESH_ACTION = "action"
+REFRESH_ACTION_CONFIRM = "action confirm"
+REFRESH_ACTION_FOLLOW_UP = "action follow-up"
+REFRESH_EVENT = "message event"
+
+REFRESH_PRIORITY_INTERVAL = 0
+REFRESH_PRIORITY_USAGE = 1
+REFRESH_PRIORITY_CHARGE_FINISH = 2
+REFRESH_PRIORITY_POST_SHUTDOWN = 3
+REFRESH_PRIORITY_ACTION = 4
+REFRESH_PRIORITY_EVENT = 5
+
 from .const import (
     AFTER_ACTION_UPDATE_INTERVAL_DELAY,
     CHARGING_STATUS_CODES,
@@ -40,14 +70,20 @@ from .const import (
     GENERIC_RESPONSE_STATUS_THRESHOLD,
     GENERIC_RESPONSE_TEMPERATURE,
     LOGGER,
+    REFRESH_COALESCE_WINDOW,
     RETRY_BACKOFF_FACTOR,
     RETRY_LIMIT,
+    SENSOR_DEADBANDS,
     STARTUP_API_TIMEOUT,
     STATUS_TIMESTAMP_FUTURE_TOLERANCE,
     STATUS_TIMESTAMP_MAX_AGE,
+    TARGET_SOC_PERCENT,
+    TRACKER_MIN_DISTANCE,
+    UPDATE_CYCLE_DEADLINE,
     UPDATE_INTERVAL,
     UPDATE_INTERVAL_AFTER_SHUTDOWN,
     UPDATE_INTERVAL_CHARGING,
+    UPDATE_INTERVAL_CHARGING_MAX,
     UPDATE_INTERVAL_DC_CHARGING,
     UPDATE_INTERVAL_GRACE_PERIOD,
     UPDATE_INTERVAL_POWERED,
@@ -70,6 +106,28 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         self.client = client
         self.config_entry = config_entry
         self.vin = config_entry.data.get("vin")
+        # Vehicle info (brand, model, series …) for this VIN, set from the
+        # account's vehicle list on every fetch.  coordinator.data holds the
+        # decoded VehicleSnapshot of the latest refresh (snapshot.py).
+        self.vin_info = None
+        self._identity: VehicleIdentity | None = None
+        # Last valid value of every snapshot field across refreshes (and, via
+        # the snapshot store, restarts).  Entities read this rather than each
+        # keeping its own last-known-good copy.
+        self.retained = VehicleSnapshot()
+
+        # Fields changed by the refresh being published, consumed by the next
+        # async_update_listeners so only entities reading them are woken.
+        # None means "notify everyone".
+        self._changed_fields: set[str] | None = None
+        self._notified_update_success: bool | None = None
+        # Bumped on every listener notification — a published refresh, a
+        # failed one, a scheduling change — so entities can compute their
+        # state once per version and answer repeated property reads from it.
+        self.data_version = 0
+        # (status, charging) fingerprints of the last fully processed refresh
+        # (VehicleSnapshot.fingerprints); None forces the full pipeline.
+        self._last_fingerprints: tuple | None = None
 
         # State Variables
         self.is_charging = False
@@ -83,10 +141,26 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         self.last_powered_off_time = None
         self.last_vehicle_activity = None
 
-        # Next Update Time
-        self.next_update_time = None
-        self._action_refresh_task = None
-        self._action_refresh_generation = 0
+        # Learned weekly pattern of starts, parks and plug-ins, persisted by
+        # the usage store (usage_store.py) injected by __init__.
+        self.usage_profile = UsageProfile()
+        self._usage_store = None
+
+        # Learned plug-in delays after stopping, and when and where the
+        # current stop began (power-off or locking) until it ends in a
+        # plug-in or the car is driven again.
+        self.plug_in_history = PlugInHistory()
+        self._stop_started_at: datetime | None = None
+        self._stop_place: str | None = None
+
+        # Every refresh this coordinator wants — the interval, action
+        # follow-ups, post-shutdown steps, message events — is a request in
+        # this queue.  One timer fires at the earliest deadline and a single
+        # fetch serves every request due within REFRESH_COALESCE_WINDOW.
+        self._refresh_queue = RefreshQueue(REFRESH_COALESCE_WINDOW)
+        # When the latest fetch started: the coalescing window is measured
+        # from there, not from when a slow fetch finished.
+        self._fetch_started_at: datetime | None = None
 
         # Account-level API lock — shared with all coordinators on the same
         # account and the SAICMGAccountPoller.  Serialises concurrent API calls
@@ -95,8 +169,28 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         # Injected by __init__.async_setup_entry after construction.
         self._api_lock: asyncio.Lock | None = None
 
-        # Post-shutdown rapid refresh state
-        self._shutdown_refresh_task: asyncio.Task | None = None
+        # Account-level fused refresh scheduler (refresh_scheduler.py), shared
+        # with all coordinators on the same account.  Injected by
+        # __init__.async_setup_entry; None means fetch on our own.
+        self._refresh_scheduler = None
+
+        # Persisted last-known snapshot (snapshot_store.py).  Injected by
+        # __init__.async_setup_entry together with the snapshot it loaded, if
+        # any.  is_stale is True while entities show restored data that has
+        # not been confirmed by a real refresh yet.
+        self._snapshot_store = None
+        self._restored_snapshot: dict | None = None
+        self.is_stale = False
+        self.last_update_time = None
+
+        # Predicts when a charging session reaches its target SOC, so polls
+        # can be sparse early in a long charge and dense near its end.
+        self._charge_progress = ChargeProgress()
+
+        # Delays of the running post-shutdown sequence and the index of its
+        # pending step, or None when no sequence is running.
+        self._shutdown_refresh_sequence: list[float] = POST_SHUTDOWN_REFRESH_SEQUENCE
+        self._shutdown_refresh_step: int | None = None
 
         # Track previous powered-on state so we detect the transition even
         # when status_data is None (generic response during power-down)
@@ -197,6 +291,16 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         self.after_action_delay = get_delay(
             "after_action_delay", AFTER_ACTION_UPDATE_INTERVAL_DELAY
         )
+        self._refresh_queue.window = coalesce_window_limit(
+            get_delay("refresh_coalesce_window", REFRESH_COALESCE_WINDOW),
+            self.after_action_delay,
+        )
+        self.deadbands = {
+            key: options.get(key, default) for key, default in SENSOR_DEADBANDS.items()
+        }
+        self.tracker_min_distance = options.get(
+            "tracker_min_distance", TRACKER_MIN_DISTANCE
+        )
 
         # Long-interval updates after actions
         self.alarm_long_interval = get_interval(
@@ -300,6 +404,110 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         """
         self._api_lock = lock
 
+    def set_refresh_scheduler(self, scheduler) -> None:
+        """Inject the account-level SAICMGAccountRefreshScheduler.
+
+        Once set, every data fetch is served through the scheduler's fused
+        per-account batches instead of this coordinator taking the account
+        lock on its own (see refresh_scheduler.py).
+        """
+        self._refresh_scheduler = scheduler
+
+    def set_usage_store(self, store, usage: dict | None = None) -> None:
+        """Inject the usage store and what it loaded (if anything)."""
+        self._usage_store = store
+        if usage is not None:
+            self.usage_profile = usage["profile"]
+            self.plug_in_history = usage["plug_in"]
+
+    def set_snapshot_store(self, store, snapshot: dict | None = None) -> None:
+        """Inject the snapshot store and the snapshot it restored (if any).
+
+        With a snapshot, async_setup sets up from it immediately and runs the
+        first real refresh in the background instead of waiting for it.
+        """
+        self._snapshot_store = store
+        self._restored_snapshot = snapshot
+
+    @property
+    def next_update_time(self) -> datetime | None:
+        """Return when the next refresh is due, whatever requested it."""
+        return self._refresh_queue.next_deadline()
+
+    @property
+    def pending_refreshes(self) -> list[dict]:
+        """Return the pending refresh requests, earliest first, for diagnostics."""
+        return [
+            {
+                "reason": request.reason,
+                "due": request.deadline.isoformat(),
+                "priority": request.priority,
+            }
+            for request in self._refresh_queue.pending()
+        ]
+
+    @property
+    def identity(self) -> VehicleIdentity | None:
+        """Return the entity identity shared by all platforms for this VIN.
+
+        Built once in async_setup (or on first use, if the vehicle info only
+        arrived later) and kept: the brand and model in later vehicle lists
+        do not change.  None while there is no vehicle info yet.
+        """
+        if self._identity is None and self.vin_info is not None:
+            self._identity = VehicleIdentity.from_coordinator(
+                self, self.config_entry.entry_id
+            )
+        return self._identity
+
+    def is_refresh_due_within(self, window: timedelta) -> bool:
+        """Return True if the next interval refresh is within *window*.
+
+        Used by the account refresh scheduler to pull siblings that are about
+        to refresh anyway into the current fused batch.  Only the interval
+        request is pulled forward: action follow-ups and post-shutdown steps
+        are timed on purpose.  Coordinators that haven't completed their
+        first refresh are never pulled in.
+        """
+        if self.data is None:
+            return False
+        request = next(
+            (
+                r
+                for r in self._refresh_queue.pending()
+                if r.reason == REFRESH_INTERVAL
+            ),
+            None,
+        )
+        if request is None:
+            return False
+        return request.deadline - utcnow() <= window
+
+    def async_apply_fused_refresh(self, data: dict) -> None:
+        """Apply data fetched for this VIN as part of a sibling's fused batch."""
+        self.async_set_updated_data(self._process_vehicle_data(data))
+
+    def async_update_listeners(self) -> None:
+        """Update the entities affected by the latest change.
+
+        Entities register with a context: the set of snapshot fields they
+        read (snapshot.fields_context).  When the notification publishes a
+        refresh, only entities whose fields changed — or that registered
+        without a context — are updated, so a parked car's unchanged poll
+        wakes next to nothing.  Every other notification (a failed refresh,
+        availability changing, interval or hint updates) reaches everyone.
+        """
+        self.data_version += 1
+        changed = self._changed_fields
+        self._changed_fields = None
+        if self.last_update_success != self._notified_update_success:
+            changed = None
+        self._notified_update_success = self.last_update_success
+        for update_callback in listeners_to_notify(
+            list(self._listeners.values()), changed
+        ):
+            update_callback()
+
     # ── Event-driven refresh (called by SAICMGAccountPoller) ─────────────────
 
     async def async_trigger_refresh(self, reason: str = "message event") -> None:
@@ -307,8 +515,11 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
 
         Called by SAICMGAccountPoller when it detects a significant event
         (engine start, shutdown, charging) for this coordinator's VIN.
-        Uses async_request_refresh so HA's built-in deduplication prevents
-        a pile-up if multiple messages arrive in the same poll cycle.
+        The request goes through the refresh queue, so several messages in
+        the same poll cycle cost a single fetch, and that fetch restarts the
+        interval (_adjust_update_interval) and absorbs every other request
+        due within the coalescing window after it — the scheduled poll no
+        longer repeats it seconds later.
 
         Args:
             reason: short human-readable description for log output.
@@ -318,7 +529,24 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
             self.vin,
             reason,
         )
-        await self.async_request_refresh()
+        self.request_refresh(REFRESH_EVENT, priority=REFRESH_PRIORITY_EVENT)
+
+    def request_refresh(
+        self,
+        reason: str,
+        when: datetime | None = None,
+        priority: int = REFRESH_PRIORITY_INTERVAL,
+    ) -> None:
+        """Queue a refresh for *reason* at *when* (default: now).
+
+        Asking again for the same reason moves its deadline; requests that
+        fall within REFRESH_COALESCE_WINDOW of each other share one fetch.
+        """
+        self._refresh_queue.request(reason, when or utcnow(), priority)
+        self._arm_refresh_timer()
+        # Only entities without a field context (next update) read the queue.
+        self._changed_fields = set()
+        self.async_update_listeners()
 
     def hint_vehicle_started(self, started_at: datetime) -> None:
         """Pre-apply powered-on state from a vehicle-start alarm message timestamp.
@@ -344,8 +572,6 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         - If ``is_powered_on`` is already ``True`` and ``last_powered_on_time``
           is *newer* than ``started_at``, the hint is a no-op (a confirmed poll
           already has more accurate data).
-        - If an action-interval sequence is active, ``_adjust_update_interval``
-          will skip the reschedule as usual.
 
         Args:
             started_at: timezone-aware datetime derived from the vehicle-start
@@ -377,12 +603,17 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
 
         self.is_powered_on = True
         self.last_powered_on_time = started_at
+        self._record_usage("start", started_at)
+        self._end_stop(plugged_in=False)
+        # The confirming poll must run the full state pipeline even if the
+        # car's status has not changed yet, so a spurious hint gets corrected.
+        self._last_fingerprints = None
 
         # Immediately switch to the powered interval so the next scheduled
         # poll fires at the rapid powered-on cadence, not the slow idle cadence.
         # _adjust_update_interval is the single source of truth for interval
         # selection and scheduling — call it rather than setting update_interval
-        # directly, so all action-interval / grace-period guards apply correctly.
+        # directly, so the grace-period rules apply correctly.
         self._adjust_update_interval()
 
         # Notify listeners so the last_powered_on sensor updates immediately
@@ -431,6 +662,16 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         self.after_action_delay = get_delay(
             "after_action_delay", AFTER_ACTION_UPDATE_INTERVAL_DELAY
         )
+        self._refresh_queue.window = coalesce_window_limit(
+            get_delay("refresh_coalesce_window", REFRESH_COALESCE_WINDOW),
+            self.after_action_delay,
+        )
+        self.deadbands = {
+            key: options.get(key, default) for key, default in SENSOR_DEADBANDS.items()
+        }
+        self.tracker_min_distance = options.get(
+            "tracker_min_distance", TRACKER_MIN_DISTANCE
+        )
 
         # Long-interval updates after actions
         self.alarm_long_interval = get_interval(
@@ -509,11 +750,7 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
             f"Charging Current: {self.charging_current_long_interval}"
         )
 
-        if not getattr(self, "_action_interval_active", False):
-            self._adjust_update_interval()
-        else:
-            self.next_update_time = utcnow() + self.update_interval
-            self.async_update_listeners()
+        self._adjust_update_interval()
 
     async def async_setup(self):
         """Set up the coordinator."""
@@ -578,35 +815,33 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         else:
             self.last_powered_on_time = datetime.now(timezone.utc) - timedelta(hours=24)
 
-        try:
-            await asyncio.wait_for(
-                self.async_config_entry_first_refresh(),
-                timeout=STARTUP_API_TIMEOUT,
-            )
-        except asyncio.TimeoutError:
-            raise ConfigEntryNotReady(
-                f"MG SAIC API did not respond within {STARTUP_API_TIMEOUT}s at "
-                f"startup for VIN {vin} — HA will retry automatically in the background."
+        snapshot = self._restored_snapshot
+        self._restored_snapshot = None
+        if snapshot is not None:
+            # Set up from the last-known snapshot at once; the first real
+            # refresh runs in the background (started at the end of setup).
+            LOGGER.debug(
+                "Setting up VIN %s from snapshot saved at %s",
+                vin,
+                snapshot["saved_at"],
             )
-        except Exception as e:
-            raise ConfigEntryNotReady(
-                f"MG SAIC API unavailable at startup for VIN {vin}: {e} "
-                f"— HA will retry automatically in the background."
+            self.vin_info = next(
+                (v for v in snapshot.get("info") or [] if v.vin == vin), None
             )
+            self.retained = snapshot["vehicle"]
+            self.data = VehicleSnapshot.from_dict(self.retained.as_dict())
+            self.last_update_success = True
+            self.last_update_time = snapshot["saved_at"]
+            self.is_stale = True
+        else:
+            await self._async_first_refresh()
 
-        if "info" in self.data and self.data["info"]:
-            # Find the vehicle info matching the current VIN
-            vin_info = next(
-                (v for v in self.data.get("info", []) if v.vin == vin), None
+        if self.vin_info is not None:
+            vin_info = self.vin_info
+            self._identity = VehicleIdentity.from_coordinator(
+                self, self.config_entry.entry_id
             )
 
-            if not vin_info:
-                LOGGER.error(f"No vehicle data found for VIN: {vin}")
-                raise UpdateFailed("No matching vehicle data found.")
-
-            # Store the matching vehicle info
-            self.vin_info = vin_info
-
             # Get vehicle series from API response
             self.vehicle_series = getattr(vin_info, "series", "").upper()
 
@@ -720,125 +955,241 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         # the shared api_lock, and the SAICMGAccountPoller owns the poll loop
         # for the whole account.  See __init__.py and message_poller.py.
 
+        if self.is_stale:
+            # Set up from the snapshot: fetch real data without holding up
+            # platform setup.  Until it lands, entities show the snapshot.
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_refresh(),
+                f"mg_saic_startup_refresh_{vin}",
+            )
+
         return True
 
+    async def _async_first_refresh(self):
+        """Run the first refresh, bounded by STARTUP_API_TIMEOUT."""
+        vin = self.vin
+        try:
+            await asyncio.wait_for(
+                self.async_config_entry_first_refresh(),
+                timeout=STARTUP_API_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            raise ConfigEntryNotReady(
+                f"MG SAIC API did not respond within {STARTUP_API_TIMEOUT}s at "
+                f"startup for VIN {vin} — HA will retry automatically in the background."
+            )
+        except Exception as e:
+            raise ConfigEntryNotReady(
+                f"MG SAIC API unavailable at startup for VIN {vin}: {e} "
+                f"— HA will retry automatically in the background."
+            )
+
     async def _async_update_data(self):
         """Fetch data from the API.
 
         All network calls are made while holding the account-level _api_lock.
-        This serialises concurrent fetches across coordinators sharing the same
-        SAIC account, preventing session token invalidation when two VINs try
-        to refresh simultaneously (the #147 startup race).
-
-        The lock is acquired once for the entire update cycle (info + status +
-        charging) rather than per-call, so the three sequential fetches for one
-        VIN are never interleaved with fetches for another VIN on the same
-        account.
+        When an account refresh scheduler is attached (the normal case, see
+        refresh_scheduler.py), the fetch is served as part of a fused batch
+        for every VIN on the account — one lock hold, one login check and one
+        vehicle list for the whole batch.  Without one, this coordinator takes
+        the lock for its own fetch.
+        """
+        if self._refresh_scheduler is not None:
+            # Events and command follow-ups don't wait for siblings to batch.
+            urgent = any(
+                r.priority >= REFRESH_PRIORITY_ACTION
+                for r in self._refresh_queue.due(utcnow())
+            )
+            data = await self._refresh_scheduler.async_request_refresh(
+                self.vin, urgent
+            )
+        else:
+            # _api_lock is injected by __init__ before async_setup is called.
+            # Fall back to a private lock if somehow not set (belt-and-braces).
+            lock = self._api_lock or asyncio.Lock()
+            async with ReleasableLockHold(lock) as hold:
+                data = await self.async_fetch_vehicle_data(hold)
+
+        return self._process_vehicle_data(data)
+
+    async def async_fetch_vehicle_data(
+        self, hold, budget: float = UPDATE_CYCLE_DEADLINE
+    ) -> dict:
+        """Fetch info, status and charging for this VIN.
+
+        The caller must already hold the account-level lock through *hold*
+        (a ReleasableLockHold) — either _async_update_data or the account
+        refresh scheduler.  The lock is held for the entire fetch (info +
+        status + charging) rather than per-call, so the sequential fetches for
+        one VIN are never interleaved with API calls for another VIN on the
+        same account.  Vehicle info is read from the client's shared vehicle
+        list cache, so a normal cycle only hits the API for status and
+        charging.  The one exception to holding the lock throughout is retry
+        backoff: _fetch_with_retries gives the lock up while it waits, so a
+        stalled car never holds up its account siblings or the message
+        poller.  The whole fetch is bounded by *budget* seconds
+        (UPDATE_CYCLE_DEADLINE unless the scheduler passes a shorter one).
         """
         data = {}
-
-        # _api_lock is injected by __init__ before async_setup is called.
-        # Fall back to a no-op context if somehow not set (single-entry case
-        # where __init__ predates this change — belt-and-braces only).
-        lock = self._api_lock or asyncio.Lock()
-
-        async with lock:
-            # Fetch vehicle info with retries
-            data["info"] = (
-                await self._fetch_with_retries(
-                    self.client.get_vehicle_info,
-                    self._is_generic_response_vehicle_info,
-                    "vehicle info",
-                )
-                or []
+        deadline = asyncio.get_running_loop().time() + budget
+        self._fetch_started_at = utcnow()
+
+        # Vehicle info comes from the client's account-level vehicle list
+        # cache, so on a normal cycle this costs no API call at all — the
+        # list is shared by every VIN on the account and only re-fetched
+        # once its TTL expires or after a re-login.
+        vehicles = (
+            await self._fetch_with_retries(
+                self.client.get_vehicle_info,
+                self._is_generic_response_vehicle_info,
+                "vehicle info",
+                hold,
+                deadline,
             )
+            or []
+        )
 
-            if not data["info"]:
-                raise UpdateFailed("Cannot proceed without vehicle info.")
-
-            vin = self.config_entry.data.get("vin")
-            filtered_info = [v for v in data["info"] if v.vin == vin]
-            if not filtered_info:
-                raise UpdateFailed(f"No data found for VIN: {vin}")
+        if not vehicles:
+            raise UpdateFailed("Cannot proceed without vehicle info.")
 
-            # Overwrite info with the filtered result and store it in an attribute
-            data["info"] = filtered_info
-            self.vin_info = filtered_info[0]
+        vin = self.config_entry.data.get("vin")
+        filtered_info = [v for v in vehicles if v.vin == vin]
+        if not filtered_info:
+            # The cached list may predate a change on the account — drop
+            # it and fetch a fresh one once before giving up.
+            LOGGER.debug(
+                "VIN %s not in cached vehicle list — re-fetching the list", vin
+            )
+            vehicles = await self.client.get_vehicle_info(force_refresh=True) or []
+            filtered_info = [v for v in vehicles if v.vin == vin]
+        if not filtered_info:
+            raise UpdateFailed(f"No data found for VIN: {vin}")
+
+        # Overwrite info with the filtered result and store it in an attribute
+        data["info"] = filtered_info
+        self.vin_info = filtered_info[0]
+
+        # Fetch vehicle status with retries.
+        # Pass self.vin explicitly — the client is shared across all VINs
+        # on the same account, so without an explicit vin it would always
+        # fetch status for whichever VIN the client was first constructed
+        # with, causing all cars on the account to show the same data.
+        vin = self.vin
+        try:
+            data["status"] = await self._fetch_with_retries(
+                lambda: self.client.get_vehicle_status(vin),
+                self._is_generic_response_vehicle_status,
+                "vehicle status",
+                hold,
+                deadline,
+            )
+            if data["status"] is not None and not self._is_status_timestamp_valid(
+                data["status"]
+            ):
+                # Timestamp failed the sanity check — discard the response.
+                # Entities read the coordinator's retained values, so this
+                # degrades gracefully rather than showing stale/wrong data as
+                # if it were current.
+                data["status"] = None
+        except Exception as e:
+            # During first setup, a vehicle status failure must not prevent
+            # the integration from loading.
+            if self.is_initial_setup:
+                LOGGER.warning(
+                    "Vehicle status unavailable during setup for VIN %s: %s — "
+                    "will retry on next scheduled update",
+                    self.vin,
+                    e,
+                )
+                data["status"] = None
+            else:
+                raise
 
-            # Fetch vehicle status with retries.
-            # Pass self.vin explicitly — the client is shared across all VINs
-            # on the same account, so without an explicit vin it would always
-            # fetch status for whichever VIN the client was first constructed
-            # with, causing all cars on the account to show the same data.
-            vin = self.vin
+        # Fetch charging info with retries.
+        # Same explicit-vin pattern as above.
+        if self.vehicle_type in ["BEV", "PHEV"]:
             try:
-                data["status"] = await self._fetch_with_retries(
-                    lambda: self.client.get_vehicle_status(vin),
-                    self._is_generic_response_vehicle_status,
-                    "vehicle status",
+                data["charging"] = await self._fetch_with_retries(
+                    lambda: self.client.get_charging_info(vin),
+                    self._is_generic_response_charging,
+                    "charging info",
+                    hold,
+                    deadline,
                 )
-                if data["status"] is not None and not self._is_status_timestamp_valid(
-                    data["status"]
-                ):
-                    # Timestamp failed the sanity check — discard the response.
-                    # Downstream sensors already retain their last known valid
-                    # values, so this degrades gracefully rather than showing
-                    # stale/wrong data as if it were current.
-                    data["status"] = None
             except Exception as e:
-                # During first setup, a vehicle status failure must not prevent
-                # the integration from loading.
+                # During first setup, a charging info failure must not prevent
+                # the integration from loading — entities will show unavailable
+                # until the next successful poll.
                 if self.is_initial_setup:
                     LOGGER.warning(
-                        "Vehicle status unavailable during setup for VIN %s: %s — "
+                        "Charging info unavailable during setup for VIN %s: %s — "
                         "will retry on next scheduled update",
                         self.vin,
                         e,
                     )
-                    data["status"] = None
+                    data["charging"] = None
                 else:
                     raise
 
-            # Fetch charging info with retries.
-            # Same explicit-vin pattern as above.
-            if self.vehicle_type in ["BEV", "PHEV"]:
-                try:
-                    data["charging"] = await self._fetch_with_retries(
-                        lambda: self.client.get_charging_info(vin),
-                        self._is_generic_response_charging,
-                        "charging info",
-                    )
-                except Exception as e:
-                    # During first setup, a charging info failure must not prevent
-                    # the integration from loading — entities will show unavailable
-                    # until the next successful poll.
-                    if self.is_initial_setup:
-                        LOGGER.warning(
-                            "Charging info unavailable during setup for VIN %s: %s — "
-                            "will retry on next scheduled update",
-                            self.vin,
-                            e,
-                        )
-                        data["charging"] = None
-                    else:
-                        raise
+        return data
+
+    def _process_vehicle_data(self, data: dict) -> VehicleSnapshot:
+        """Decode freshly fetched data, derive coordinator state and return it.
+
+        The raw responses are decoded exactly once here; the returned
+        VehicleSnapshot becomes coordinator.data for every entity.
+        """
+        snapshot = VehicleSnapshot.from_responses(
+            data.get("status"), data.get("charging")
+        )
+
+        # Fast path: the car is usually asleep and SAIC returns the same
+        # statusTime and payload poll after poll.  With both responses
+        # unchanged there is no state to derive and nothing for entities to
+        # show, so only record the update and make the scheduling decision.
+        fingerprints = snapshot.fingerprints()
+        if (
+            fingerprints == self._last_fingerprints
+            and self.data is not None
+            and not self.is_stale
+        ):
+            LOGGER.debug(
+                "VIN %s: status and charging unchanged since last refresh — "
+                "skipping state update",
+                self.vin,
+            )
+            self._complete_refresh_requests(self._fetch_started_at)
+            self._adjust_update_interval()
+            self.last_update_time = datetime.now(timezone.utc)
+            self._changed_fields = set()
+            return self.data
+        self._last_fingerprints = fingerprints
+
+        # Entities read either the latest snapshot or the retained one, so
+        # a change in either is what they need to hear about.
+        changed = snapshot.diff(self.data)
+        changed |= self.retained.retain(snapshot)
 
         # Determine charging status
-        self.is_charging = False
-        self.is_dc_charging = False
-        if data.get("charging") is not None:
-            chrg_data = getattr(data["charging"], "chrgMgmtData", None)
-            if chrg_data is not None:
-                bms_chrg_sts = getattr(chrg_data, "bmsChrgSts", None)
-                self.is_charging = bms_chrg_sts in CHARGING_STATUS_CODES
-                # bmsChrgSts 10 = DC charging, 11 = super offboard DC charging
-                self.is_dc_charging = bms_chrg_sts in {10, 11}
-        else:
+        was_charging = self.is_charging
+        bms_chrg_sts = snapshot.bmsChrgSts
+        self.is_charging = bms_chrg_sts in CHARGING_STATUS_CODES
+        # bmsChrgSts 10 = DC charging, 11 = super offboard DC charging
+        self.is_dc_charging = bms_chrg_sts in {10, 11}
+        if not snapshot.has_charging:
             LOGGER.debug("Charging data not available.")
 
         # Update internal state variables
-        self._update_state(data)
-
+        self._update_state(snapshot)
+        self._update_charge_prediction(snapshot)
+        if self.is_charging and not was_charging:
+            self._record_usage("plug", datetime.now(timezone.utc))
+            self._end_stop(plugged_in=True)
+
+        # Mark what this fetch served before the interval is re-queued, so
+        # the coalescing window can never swallow the next interval request.
+        self._complete_refresh_requests(self._fetch_started_at)
         # Adjust update intervals dynamically
         self._adjust_update_interval()
 
@@ -857,32 +1208,22 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Set the last update time
         self.last_update_time = datetime.now(timezone.utc)
+        self.is_stale = False
 
-        # Include capabilities in the returned data
-        data["capabilities"] = {
-            "has_sunroof": self.has_sunroof,
-            "has_heated_seats": self.has_heated_seats,
-            "has_battery_heating": self.has_battery_heating,
-            "has_steering_wheel_heat": self.has_steering_wheel_heat,
-        }
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_schedule_save(self.vin_info, self.retained)
 
-        return data
+        self._changed_fields = changed
+        return snapshot
 
     # Update Vehicle State
-    def _update_state(self, data):
-        """Update state variables based on fetched data."""
-        status_data = data.get("status")
-        charging_data = data.get("charging")
+    def _update_state(self, snapshot: VehicleSnapshot):
+        """Update state variables based on the decoded snapshot."""
         recent_activity = False
 
         # Vehicle status
-        if status_data:
-            basic_status = getattr(status_data, "basicVehicleStatus", None)
-            if basic_status is None:
-                LOGGER.warning("basicVehicleStatus is not available in Status Data.")
-                return
-
-            power_mode = getattr(basic_status, "powerMode", None)
+        if snapshot.has_status:
+            power_mode = snapshot.powerMode
 
             # Detect Power State
             # Track previous state so we catch the transition even if a prior
@@ -891,10 +1232,13 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
             if power_mode in [2, 3]:
                 if not self.is_powered_on:
                     self.last_powered_on_time = datetime.now(timezone.utc)
+                    self._record_usage("start", self.last_powered_on_time)
+                    self._end_stop(plugged_in=False)
                 self.is_powered_on = True
             else:
                 if self.is_powered_on:
                     self.last_powered_off_time = datetime.now(timezone.utc)
+                    self._record_usage("park", self.last_powered_off_time)
                     LOGGER.info(
                         "Vehicle powered off detected for VIN %s — "
                         "%s post-shutdown refresh sequence",
@@ -906,27 +1250,21 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                 self.is_powered_on = False
 
             # Detect vehicle activity
-            recent_activity = self._detect_activity(basic_status, charging_data)
+            recent_activity = self._detect_activity(snapshot)
 
         # Charging status
-        self.is_charging = False
-        if charging_data:
-            chrg_mgmt_data = getattr(charging_data, "chrgMgmtData", None)
-            if chrg_mgmt_data:
-                self.is_charging = (
-                    getattr(chrg_mgmt_data, "bmsChrgSts", None) in CHARGING_STATUS_CODES
-                )
+        self.is_charging = snapshot.bmsChrgSts in CHARGING_STATUS_CODES
 
         # Missed-transition guard: if vehicle status was unavailable (None) but
         # charging data confirms the car is now charging, we know the car must
         # have powered off. Fire the shutdown sequence if we haven't already.
         if (
-            not status_data
+            not snapshot.has_status
             and self.is_charging
             and self._prev_is_powered_on
             and self.is_powered_on
         ):
-            if self._shutdown_refresh_task is None or self._shutdown_refresh_task.done():
+            if self._shutdown_refresh_step is None:
                 LOGGER.info(
                     "Charging detected after status unavailable for VIN %s — "
                     "inferring shutdown, %s post-shutdown refresh sequence",
@@ -934,6 +1272,7 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                     "starting" if self.enable_shutdown_refresh_sequence else "skipping (disabled)",
                 )
                 self.last_powered_off_time = datetime.now(timezone.utc)
+                self._record_usage("park", self.last_powered_off_time)
                 self.is_powered_on = False
                 if self.enable_shutdown_refresh_sequence:
                     self._start_shutdown_refresh_sequence()
@@ -947,11 +1286,68 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                     "Updated Last Vehicle Activity: %s", self.last_vehicle_activity
                 )
 
-        # Notify listeners of data changes
-        self.async_update_listeners()
+    def _update_charge_prediction(self, snapshot: VehicleSnapshot) -> None:
+        """Feed the charge-progress model and queue a refresh at the finish."""
+        if not self.is_charging:
+            self._charge_progress.reset()
+            self._refresh_queue.cancel(REFRESH_CHARGE_FINISH)
+            return
+
+        retained = self.retained
+        now = utcnow()
+        finish = self._charge_progress.update(
+            now,
+            soc=retained.soc,
+            # Cars that report no target charge to full.
+            target_soc=TARGET_SOC_PERCENT.get(
+                retained.bmsOnBdChrgTrgtSOCDspCmd, 100
+            ),
+            current=snapshot.bmsPackCrnt,
+            voltage=snapshot.bmsPackVol,
+            capacity_kwh=self.known_battery_capacity_kwh
+            or retained.totalBatteryCapacity,
+        )
+        LOGGER.debug("VIN %s: predicted charge finish %s", self.vin, finish)
+        if finish is None or finish <= now:
+            self._refresh_queue.cancel(REFRESH_CHARGE_FINISH)
+        else:
+            self._refresh_queue.request(
+                REFRESH_CHARGE_FINISH, finish, REFRESH_PRIORITY_CHARGE_FINISH
+            )
+
+    def _record_usage(self, kind: str, when: datetime) -> None:
+        """Teach the usage profile a start, park or plug event at *when*.
+
+        Transitions seen by the first refresh after a restart only reflect
+        the state the car was already in, so they are not learned.
+        """
+        if self.data is None or self.is_stale:
+            return
+        local = as_local(when)
+        self.usage_profile.record(kind, local.weekday(), local.hour)
+        self._save_usage()
+
+    def _end_stop(self, plugged_in: bool) -> None:
+        """Record how the current stop ended in the plug-in history."""
+        if self._stop_started_at is None:
+            return
+        delay = None
+        if plugged_in:
+            delay = (utcnow() - self._stop_started_at).total_seconds()
+        self.plug_in_history.record_stop(self._stop_place, delay)
+        self._stop_started_at = None
+        self._stop_place = None
+        self._save_usage()
+
+    def _save_usage(self) -> None:
+        """Schedule a save of the usage profile and plug-in history."""
+        if self._usage_store is not None:
+            self._usage_store.async_schedule_save(
+                self.usage_profile, self.plug_in_history
+            )
 
     # Chech Vehicle Activity
-    def _detect_activity(self, basic_status, charging_data=None):
+    def _detect_activity(self, snapshot: VehicleSnapshot):
         """Detect recent activity based on changes in vehicle status and charging.
 
         Lock-to-locked transition (0 → 1) is treated as a special trigger:
@@ -986,7 +1382,7 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Check for door, lock, and other physical activity
         for key in activity_keys:
-            current_value = getattr(basic_status, key, None)
+            current_value = getattr(snapshot, key)
             last_value = getattr(self, f"_last_{key}", None)
             if current_value != last_value:
                 LOGGER.debug(
@@ -1002,7 +1398,7 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                 detected_activity = True
 
         # Check for power state changes
-        power_mode = getattr(basic_status, "powerMode", None)
+        power_mode = snapshot.powerMode
         if power_mode is not None and power_mode != getattr(
             self, "_last_power_mode", None
         ):
@@ -1015,8 +1411,8 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
             detected_activity = True
 
         # Check for charging status changes
-        if charging_data:
-            charging_status = getattr(charging_data, "bmsChrgSts", None)
+        if snapshot.has_charging:
+            charging_status = snapshot.bmsChrgSts
             if charging_status != getattr(self, "_last_charging_status", None):
                 LOGGER.debug(
                     "Detected charging status change: previous=%s, current=%s",
@@ -1035,7 +1431,7 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
             and not self.is_charging
             and self.enable_shutdown_refresh_sequence
         ):
-            if self._shutdown_refresh_task is None or self._shutdown_refresh_task.done():
+            if self._shutdown_refresh_step is None:
                 LOGGER.info(
                     "Lock engaged for VIN %s while not charging — "
                     "starting post-shutdown refresh sequence to catch plug-in",
@@ -1058,13 +1454,6 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
     # Adjust Update Intervals
     def _adjust_update_interval(self):
         """Adjust update interval dynamically based on state."""
-        if getattr(self, "_action_interval_active", False):
-            # If we're in an action interval sequence, do not override intervals.
-            LOGGER.debug(
-                "Action interval active, skipping dynamic interval adjustment."
-            )
-            return
-
         now = datetime.now(timezone.utc)
 
         # Use restored or initialized timestamps for calculations
@@ -1088,6 +1477,12 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
             activity_duration,
         )
 
+        charge_finish = self._charge_progress.finish
+        local_now = as_local(now)
+        usage_outlook = self.usage_profile.outlook(
+            local_now.weekday(), local_now.hour
+        )
+
         # Determine update interval based on state and recent activity
         self.update_interval = select_update_interval(
             is_powered_on=self.is_powered_on,
@@ -1101,6 +1496,11 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
             dc_charging_update_interval=self.dc_charging_update_interval,
             grace_period_update_interval=self.grace_period_update_interval,
             after_shutdown_update_interval=self.after_shutdown_update_interval,
+            charge_finish_in=(
+                charge_finish - now if charge_finish is not None else None
+            ),
+            max_charging_update_interval=UPDATE_INTERVAL_CHARGING_MAX,
+            usage_outlook=usage_outlook,
         )
 
         if self.is_powered_on:
@@ -1108,127 +1508,141 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         elif self.is_dc_charging:
             LOGGER.debug("Vehicle is DC charging. Using DC charging update interval.")
         elif self.is_charging:
-            LOGGER.debug("Vehicle is AC charging. Using charging update interval.")
+            LOGGER.debug(
+                "Vehicle is AC charging (predicted finish %s). Using charging "
+                "update interval.",
+                charge_finish,
+            )
         elif self.update_interval == self.grace_period_update_interval:
             LOGGER.debug("Within grace period. Using grace period interval.")
         elif self.update_interval == self.after_shutdown_update_interval:
             LOGGER.debug("Within shutdown window. Using shutdown interval.")
+        elif usage_outlook is not None:
+            LOGGER.debug(
+                "No recent activity, usage profile says %s hour. Using %s.",
+                usage_outlook,
+                self.update_interval,
+            )
         else:
             LOGGER.debug("No recent activity. Using default update interval.")
 
         # Log and schedule the next refresh
         LOGGER.debug(f"Adjusted update interval: {self.update_interval}.")
+        self._queue_usage_refresh(local_now)
         self._schedule_refresh()
 
-    # Additional Update Intervals for Actions and Confirmation
-    async def schedule_action_refresh(self, vin, immediate_interval, long_interval):
-        """Schedule non-blocking follow-up refreshes after an action."""
-        self._action_refresh_generation += 1
-        generation = self._action_refresh_generation
-
-        if self._action_refresh_task and not self._action_refresh_task.done():
-            self._action_refresh_task.cancel()
+    def _queue_usage_refresh(self, local_now: datetime) -> None:
+        """Queue a refresh as the next hour the usage profile expects begins.
 
-        self._action_refresh_task = self.hass.async_create_task(
-            self._run_action_refresh_sequence(
-                vin,
-                immediate_interval,
-                long_interval,
-                generation,
+        Without it the first poll of a likely hour could land up to a full
+        idle interval late; from there select_update_interval keeps the
+        shorter interval for the rest of the hour.
+        """
+        hours = None
+        if not self.is_powered_on and not self.is_charging:
+            hours = self.usage_profile.hours_until_likely(
+                local_now.weekday(), local_now.hour
             )
+        if hours is None:
+            self._refresh_queue.cancel(REFRESH_USAGE)
+            return
+        hour_start = local_now.replace(minute=0, second=0, microsecond=0)
+        self._refresh_queue.request(
+            REFRESH_USAGE, hour_start + timedelta(hours=hours), REFRESH_PRIORITY_USAGE
         )
 
-    async def _run_action_refresh_sequence(
-        self,
-        vin,
-        immediate_interval,
-        long_interval,
-        generation,
-    ):
-        """Run action follow-up refreshes in the background."""
-        self._action_interval_active = True
-
-        try:
-            self.update_interval = immediate_interval
-            self.next_update_time = utcnow() + self.update_interval
-            self.async_update_listeners()
-            LOGGER.debug(
-                "Scheduling immediate refresh with interval %s for VIN: %s.",
-                immediate_interval,
-                vin,
-            )
-            await self.async_request_refresh()
-
-            await asyncio.sleep(immediate_interval.total_seconds())
-
-            self.update_interval = long_interval
-            self.next_update_time = utcnow() + self.update_interval
-            self.async_update_listeners()
-            LOGGER.debug(
-                "Switching to long interval %s for VIN: %s after immediate refresh.",
-                long_interval,
-                vin,
-            )
-            await self.async_request_refresh()
-
-            await asyncio.sleep(long_interval.total_seconds())
-        except asyncio.CancelledError:
-            LOGGER.debug("Cancelled action refresh sequence for VIN: %s.", vin)
-            raise
-        finally:
-            if generation == self._action_refresh_generation:
-                self._action_interval_active = False
-                self._action_refresh_task = None
-                self._adjust_update_interval()
+    # Additional Update Intervals for Actions and Confirmation
+    async def schedule_action_refresh(self, vin, immediate_interval, long_interval):
+        """Queue the follow-up refreshes after an action.
 
+        One right away, one after *immediate_interval* to confirm the command
+        took effect and one *long_interval* later for its lasting result.  A
+        new action replaces the pending follow-ups of the previous one.
+        """
+        now = utcnow()
+        LOGGER.debug(
+            "Queueing action follow-up refreshes for VIN %s: now, in %s and in %s.",
+            vin,
+            immediate_interval,
+            immediate_interval + long_interval,
+        )
+        self._refresh_queue.request(REFRESH_ACTION, now, REFRESH_PRIORITY_ACTION)
+        self._refresh_queue.request(
+            REFRESH_ACTION_CONFIRM, now + immediate_interval, REFRESH_PRIORITY_ACTION
+        )
+        self.request_refresh(
+            REFRESH_ACTION_FOLLOW_UP,
+            now + immediate_interval + long_interval,
+            REFRESH_PRIORITY_ACTION,
+        )
 
     # ── Post-shutdown rapid refresh sequence ─────────────────────────────────
 
     def _start_shutdown_refresh_sequence(self) -> None:
-        """Kick off a background task that polls rapidly after engine-off.
+        """Start polling rapidly after engine-off.
 
         Because the SAIC REST API has no dedicated shutdown alarm type, the
         coordinator may not poll again for up to 15 minutes after the car
         turns off (it was on the powered-on interval). This sequence fires
-        a series of extra refreshes at POST_SHUTDOWN_REFRESH_SEQUENCE intervals
-        so that plug-in events are detected within ~1-5 minutes.
+        a series of extra refreshes so that plug-in events are detected
+        within ~1-5 minutes.
+
+        The refreshes follow the delays after which this vehicle actually
+        got plugged in (PlugInHistory quantiles, POST_SHUTDOWN_REFRESH_SEQUENCE
+        until enough are known), and places where it never is get none.
+        Each step is a request in the refresh queue; the next one is queued
+        once the previous has been served, unless charging was detected.
         """
-        # Cancel any existing shutdown refresh from a previous cycle
-        if self._shutdown_refresh_task and not self._shutdown_refresh_task.done():
-            self._shutdown_refresh_task.cancel()
+        if self._stop_started_at is None:
+            self._stop_started_at = utcnow()
+            self._stop_place = PlugInHistory.place(
+                self.retained.latitude, self.retained.longitude
+            )
+        if self.plug_in_history.never_plugged_in_at(self._stop_place):
+            LOGGER.info(
+                "VIN %s is never plugged in here — no post-shutdown sequence",
+                self.vin,
+            )
+            return
+        self._shutdown_refresh_sequence = self.plug_in_history.refresh_sequence(
+            POST_SHUTDOWN_REFRESH_SEQUENCE
+        )
+        LOGGER.debug(
+            "VIN %s: post-shutdown refreshes after %s s",
+            self.vin,
+            [round(delay) for delay in self._shutdown_refresh_sequence],
+        )
+        self._shutdown_refresh_step = 0
+        self._queue_shutdown_refresh()
 
-        self._shutdown_refresh_task = self.config_entry.async_create_background_task(
-            self.hass,
-            self._run_shutdown_refresh_sequence(),
-            f"mg_saic_shutdown_refresh_{self.vin}",
+    def _queue_shutdown_refresh(self) -> None:
+        """Queue the current step of the post-shutdown sequence."""
+        delay = self._shutdown_refresh_sequence[self._shutdown_refresh_step]
+        self._refresh_queue.request(
+            REFRESH_POST_SHUTDOWN,
+            utcnow() + timedelta(seconds=delay),
+            REFRESH_PRIORITY_POST_SHUTDOWN,
         )
+        self._arm_refresh_timer()
 
-    async def _run_shutdown_refresh_sequence(self) -> None:
-        """Run the post-shutdown refresh sequence."""
-        try:
-            for delay in POST_SHUTDOWN_REFRESH_SEQUENCE:
-                await asyncio.sleep(delay)
-                LOGGER.info(
-                    "Post-shutdown refresh for VIN %s (delay was %ds)",
-                    self.vin,
-                    delay,
-                )
-                await self.async_request_refresh()
-                # If the car is now charging, the coordinator interval will have
-                # already switched to charging interval — we can stop early.
-                if self.is_charging:
-                    LOGGER.info(
-                        "Charging detected for VIN %s — ending post-shutdown sequence",
-                        self.vin,
-                    )
-                    break
-        except asyncio.CancelledError:
-            LOGGER.debug(
-                "Post-shutdown refresh sequence cancelled for VIN %s", self.vin
+    def _advance_shutdown_refresh_sequence(self) -> None:
+        """Queue the next post-shutdown step after one has been served."""
+        if self._shutdown_refresh_step is None:
+            return
+        # If the car is now charging, the coordinator interval has already
+        # switched to the charging interval — we can stop early.
+        if self.is_charging:
+            LOGGER.info(
+                "Charging detected for VIN %s — ending post-shutdown sequence",
+                self.vin,
             )
-            raise
-        finally:
-            self._shutdown_refresh_task = None
+            self._shutdown_refresh_step = None
+            return
+        self._shutdown_refresh_step += 1
+        if self._shutdown_refresh_step >= len(self._shutdown_refresh_sequence):
+            self._shutdown_refresh_step = None
+            return
+        self._queue_shutdown_refresh()
 
     def register_command_error_event_entity(self, entity) -> None:
         """Register (or deregister, with entity=None) the command-error Event
@@ -1265,11 +1679,9 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         # notification is identifiable at a glance in multi-vehicle setups,
         # not just by VIN. Falls back gracefully if vin_info isn't available
         # for any reason (e.g. very early in setup).
-        vin_info = getattr(self, "vin_info", None)
-        if vin_info is not None:
-            vehicle_label = (
-                f"{vin_info.brandName} {vin_info.modelName} (VIN: {vin})"
-            )
+        identity = self.identity
+        if identity is not None:
+            vehicle_label = f"{identity.name_prefix} (VIN: {vin})"
         else:
             vehicle_label = f"VIN: {vin}"
 
@@ -1332,61 +1744,121 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
         __init__.async_unload_entry, which stops the poller only when the last
         coordinator for that account is unloaded.
         """
-        if self._shutdown_refresh_task and not self._shutdown_refresh_task.done():
-            self._shutdown_refresh_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._shutdown_refresh_task
-
-        self._action_refresh_generation += 1
-
-        if self._action_refresh_task and not self._action_refresh_task.done():
-            self._action_refresh_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._action_refresh_task
-        self._action_refresh_task = None
+        self._refresh_queue.clear()
+        self._shutdown_refresh_step = None
 
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
 
     def _schedule_refresh(self):
-        """Schedule the next refresh and update listeners."""
-        if self._unsub_refresh:
-            self._unsub_refresh()
-            self._unsub_refresh = None
+        """Queue the next interval refresh and re-arm the refresh timer.
 
+        Replaces DataUpdateCoordinator's own timer: HA calls this after every
+        refresh, and the interval becomes one request among the others in
+        the refresh queue.
+        """
         if self.update_interval and self.update_interval > timedelta(0):
-            self.next_update_time = utcnow() + self.update_interval
-            self._unsub_refresh = async_track_point_in_utc_time(
-                self.hass, self._handle_refresh_interval, self.next_update_time
+            self._refresh_queue.request(
+                REFRESH_INTERVAL,
+                utcnow() + self.update_interval,
+                REFRESH_PRIORITY_INTERVAL,
             )
             LOGGER.debug(
-                "Next update scheduled in %s.",
+                "Next interval refresh in %s.",
                 self.update_interval,
             )
         else:
-            self.next_update_time = None
-            LOGGER.debug("Update interval is None or zero; no refresh scheduled.")
+            self._refresh_queue.cancel(REFRESH_INTERVAL)
+            LOGGER.debug("Update interval is None or zero; no interval refresh queued.")
+        self._arm_refresh_timer()
+
+    def _arm_refresh_timer(self) -> None:
+        """Point the single refresh timer at the earliest pending request."""
+        if self._unsub_refresh:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+        next_update_time = self._refresh_queue.next_deadline()
+        if next_update_time is not None:
+            self._unsub_refresh = async_track_point_in_utc_time(
+                self.hass, self._handle_refresh_timer, next_update_time
+            )
 
-    async def _handle_refresh_interval(self, now):
-        """Handle a scheduled refresh."""
+    async def _handle_refresh_timer(self, now):
+        """Run the one fetch that serves every request due now."""
         self._unsub_refresh = None
+        LOGGER.debug(
+            "VIN %s: refreshing for %s",
+            self.vin,
+            ", ".join(r.reason for r in self._refresh_queue.due(utcnow())),
+        )
         await self.async_refresh()
+        if not self.last_update_success:
+            # A failed fetch still counts as the attempt: re-queueing what was
+            # due would retry it straight away.  The interval request that HA
+            # re-queued is the retry.
+            self._complete_refresh_requests()
+
+    def _complete_refresh_requests(self, started: datetime | None = None) -> None:
+        """Mark the requests served by the fetch that just completed.
+
+        Whichever mechanism asked for them, every request due within
+        REFRESH_COALESCE_WINDOW of the fetch's start (*started*, default now)
+        is satisfied by this one fetch.  Measuring from the start matters for
+        slow fetches: an action fetch finishing a few seconds late must not
+        absorb the confirming refresh, which exists because the immediate
+        fetch still shows the pre-command state.
+        """
+        served = self._refresh_queue.take_due(started or utcnow())
+        if any(r.reason == REFRESH_POST_SHUTDOWN for r in served):
+            self._advance_shutdown_refresh_sequence()
+        self._arm_refresh_timer()
 
-    async def _fetch_with_retries(self, fetch_func, is_generic_func, data_name):
+    async def _fetch_with_retries(
+        self, fetch_func, is_generic_func, data_name, hold=None, deadline=None
+    ):
         """Fetch data with retries and handle generic responses.
 
+        hold is the ReleasableLockHold on the account lock for this update
+        cycle.  The lock is released for the duration of each backoff sleep
+        and re-queued for afterwards (FIFO, so siblings that queued meanwhile
+        go first) — a flaky VIN no longer blocks every other VIN and the
+        message poller for RETRY_LIMIT × RETRY_BACKOFF_FACTOR seconds.
+
+        deadline (event loop time) bounds the whole update cycle: each API
+        call and re-login is cut off when it runs out, and once it is spent
+        (or the next backoff would overrun it) retrying stops and None is
+        returned.
+
         On a 401 (token expired/invalidated), re-login immediately and retry
         without waiting for the full RETRY_BACKOFF_FACTOR delay.  This handles
         the race where the message poller re-auths and invalidates the
         coordinator's token a fraction of a second before an event-driven
         refresh fires — previously this caused a 15-second delay and noisy
         ERROR log entries on every engine-start event for two-car accounts.
+        The re-login goes through client.async_reauthenticate with the session
+        generation the request was made on, so if the poller (or a sibling VIN)
+        already re-logged in we just retry on its session instead of logging in
+        again.
         """
+        loop = asyncio.get_running_loop()
         retries = 0
         while retries < RETRY_LIMIT:
+            # Remaining budget for this attempt; None when unbounded.
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                LOGGER.error(
+                    "Update cycle deadline reached fetching %s for VIN %s "
+                    "— giving up after %d attempt(s).",
+                    data_name,
+                    self.vin,
+                    retries,
+                )
+                return None
+            generation = self.client.session_generation
             try:
-                data = await fetch_func()
+                data = await asyncio.wait_for(fetch_func(), timeout)
                 if data is None:
                     LOGGER.warning("%s returned None.", data_name.capitalize())
                     raise UpdateFailed(f"{data_name.capitalize()} is None.")
@@ -1396,12 +1868,11 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                 return data
             except (UpdateFailed, GenericResponseException, Exception) as e:
                 retries += 1
-                exc_str = str(e)
 
                 # 401 means our token was invalidated — re-login immediately
                 # rather than waiting RETRY_BACKOFF_FACTOR seconds.  This is
                 # the common case when the poller re-auths concurrently.
-                if "401" in exc_str:
+                if self.client.is_auth_error(e):
                     LOGGER.debug(
                         "401 on %s fetch for VIN %s — re-logging in before retry "
                         "(attempt %d/%d)",
@@ -1411,7 +1882,10 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                         RETRY_LIMIT,
                     )
                     try:
-                        await self.client.login()
+                        await asyncio.wait_for(
+                            self.client.async_reauthenticate(generation),
+                            None if deadline is None else deadline - loop.time(),
+                        )
                     except Exception as login_exc:
                         LOGGER.warning(
                             "Re-login failed for VIN %s: %s", self.vin, login_exc
@@ -1419,7 +1893,24 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                     # No sleep — retry immediately after re-auth
                     continue
 
+                if retries >= RETRY_LIMIT:
+                    break
+
                 delay = RETRY_BACKOFF_FACTOR
+                if (
+                    deadline is not None
+                    and loop.time() + delay > deadline
+                ):
+                    LOGGER.error(
+                        "Error fetching %s for VIN %s: %s. Update cycle deadline "
+                        "reached — giving up after %d attempt(s).",
+                        data_name,
+                        self.vin,
+                        e,
+                        retries,
+                    )
+                    return None
+
                 LOGGER.warning(
                     "Error fetching %s: %s. Retrying in %s seconds... (Attempt %d/%d)",
                     data_name,
@@ -1428,7 +1919,10 @@ class SAICMGDataUpdateCoordinator(DataUpdateCoordinator):
                     retries,
                     RETRY_LIMIT,
                 )
-                await asyncio.sleep(delay)
+                if hold is not None:
+                    await hold.sleep_released(delay)
+                else:
+                    await asyncio.sleep(delay)
         LOGGER.error("Failed to fetch %s after %d retries.", data_name, RETRY_LIMIT)
         return None
 
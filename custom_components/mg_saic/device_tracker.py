@@ -1,9 +1,15 @@
 # File: device_tracker.py
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+
 from homeassistant.components.device_tracker import TrackerEntity
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, LOGGER
-from .utils import create_device_info
+from .logic import compass_point, haversine_distance
+from .snapshot import fields_context
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -11,7 +17,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
 
     try:
-        if not coordinator.data.get("info"):
+        if coordinator.vin_info is None:
             LOGGER.error("Failed to retrieve vehicle info or status.")
             return
 
@@ -24,23 +30,51 @@ async def async_setup_entry(hass, entry, async_add_entities):
         LOGGER.error("Error setting up MG SAIC device tracker: %s", e)
 
 
+@dataclass(frozen=True, slots=True)
+class GpsFix:
+    """One published GPS fix and the attributes derived from it."""
+
+    latitude: float | None = None
+    longitude: float | None = None
+    elevation: float | None = None
+    hdop: int | None = None
+    satellites: int | None = None
+    heading: float | None = None
+    attributes: dict | None = None
+
+
 class SAICMGDeviceTracker(CoordinatorEntity, TrackerEntity):
-    """Representation of a MG SAIC device tracker."""
+    """Representation of a MG SAIC device tracker.
+
+    Each coordinator update is decoded once into a GpsFix that every
+    property reads.  A fix less than coordinator.tracker_min_distance metres
+    from the published one is not written, so a parked car's wandering
+    position costs no state write.
+    """
 
     def __init__(self, coordinator, entry, field, name, data_type):
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=fields_context(
+                "latitude",
+                "longitude",
+                "altitude",
+                "hdop",
+                "satellites",
+                "speed",
+                "heading",
+            ),
+        )
         self._field = field
-        self._name = name
+        self._name = coordinator.identity.name(name)
         self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}_gps"
+        self._unique_id = coordinator.identity.unique_id(f"{field}_gps")
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
-        # Store last known good coordinates
-        self._last_lat = None
-        self._last_lon = None
         self._last_valid_heading = 0
+        self._fix = self._decode_fix()
+        self._written_available = None
 
     @property
     def unique_id(self):
@@ -50,126 +84,104 @@ class SAICMGDeviceTracker(CoordinatorEntity, TrackerEntity):
     @property
     def name(self):
         """Return the name of the tracker."""
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
+        return self._name
+
+    def _decode_fix(self) -> GpsFix:
+        """Decode the coordinator's latest data into a GpsFix."""
+        snapshot = self.coordinator.data
+        if snapshot is None:
+            return GpsFix()
+        retained = self.coordinator.retained
+
+        heading = None
+        if snapshot.speed is not None:
+            # The car is moving (over 0.1 km/h): its heading is meaningful.
+            if snapshot.speed > 0.1:
+                self._last_valid_heading = snapshot.heading
+            heading = self._last_valid_heading
+
+        attributes = {}
+        if snapshot.speed is not None or snapshot.hdop is not None:
+            attributes = {
+                "elevation": snapshot.altitude,
+                "HDOP": snapshot.hdop,
+                "satellites": snapshot.satellites,
+                "heading": (
+                    compass_point(heading) if heading is not None else "Unknown"
+                ),
+                "raw_heading": heading,
+            }
+
+        # The snapshot drops a 0,0 (no fix) position; the retained snapshot
+        # keeps the last known good coordinates then.
+        return GpsFix(
+            latitude=retained.latitude,
+            longitude=retained.longitude,
+            elevation=snapshot.altitude,
+            hdop=snapshot.hdop,
+            satellites=snapshot.satellites,
+            heading=heading,
+            attributes=attributes,
+        )
+
+    def _moved(self, fix: GpsFix) -> bool:
+        """Return True if *fix* is far enough from the published one."""
+        published = self._fix
+        # The snapshot only ever sets latitude and longitude together.
+        if fix.latitude is None or published.latitude is None:
+            return True
+        distance = haversine_distance(
+            published.latitude, published.longitude, fix.latitude, fix.longitude
+        )
+        return distance >= self.coordinator.tracker_min_distance
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the new fix, unless the car has not really moved."""
+        fix = self._decode_fix()
+        available = self.available
+        if available == self._written_available and (
+            fix == self._fix or not self._moved(fix)
+        ):
+            return
+        self._fix = fix
+        self._written_available = available
+        super()._handle_coordinator_update()
 
     @property
     def latitude(self):
         """Return the latitude of the device."""
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            gps_position = getattr(data, self._field, None)
-            if gps_position and gps_position.wayPoint:
-                lat = gps_position.wayPoint.position.latitude / 1e6
-                lon = gps_position.wayPoint.position.longitude / 1e6
-
-                # If the API returns 0,0 coordinates, fallback to last known valid data
-                if (lat == 0.0 and lon == 0.0) and (
-                    self._last_lat is not None and self._last_lon is not None
-                ):
-                    return self._last_lat
-                else:
-                    # Update last known good latitude if not zero
-                    if lat != 0.0:
-                        self._last_lat = lat
-                    return lat
-        # Fallback if no new data or data invalid
-        return self._last_lat
+        return self._fix.latitude
 
     @property
     def longitude(self):
         """Return the longitude of the device."""
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            gps_position = getattr(data, self._field, None)
-            if gps_position and gps_position.wayPoint:
-                lat = gps_position.wayPoint.position.latitude / 1e6
-                lon = gps_position.wayPoint.position.longitude / 1e6
-
-                # If the API returns 0,0 coordinates, fallback to last known valid data
-                if (lat == 0.0 and lon == 0.0) and (
-                    self._last_lat is not None and self._last_lon is not None
-                ):
-                    return self._last_lon
-                else:
-                    # Update last known good longitude if not zero
-                    if lon != 0.0:
-                        self._last_lon = lon
-                    return lon
-        # Fallback if no new data or data invalid
-        return self._last_lon
+        return self._fix.longitude
 
     @property
     def elevation(self):
         """Return the altitude of the device."""
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            gps_position = getattr(data, self._field, None)
-            if gps_position and gps_position.wayPoint:
-                return gps_position.wayPoint.position.altitude
-        return None
+        return self._fix.elevation
 
     @property
     def hdop(self):
         """Return the HDOP of the GPS signal."""
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            gps_position = getattr(data, self._field, None)
-            if gps_position and gps_position.wayPoint:
-                return gps_position.wayPoint.hdop
-        return None
+        return self._fix.hdop
 
     @property
     def satellites(self):
         """Return the number of satellites used for the fix."""
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            gps_position = getattr(data, self._field, None)
-            if gps_position and gps_position.wayPoint:
-                return gps_position.wayPoint.satellites
-        return None
+        return self._fix.satellites
 
     @property
     def heading(self):
-        """Return the heading as a cardinal direction."""
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            gps_position = getattr(data, self._field, None)
-            if gps_position and gps_position.wayPoint:
-                speed = gps_position.wayPoint.speed
-                heading = gps_position.wayPoint.heading
-
-                if speed > 1:
-                    self._last_valid_heading = heading
-                    return heading
-                elif self._last_valid_heading is not None:
-                    return self._last_valid_heading
-        return None
+        """Return the heading in degrees, held while the car stands still."""
+        return self._fix.heading
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the device."""
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            gps_position = getattr(data, self._field, None)
-            if gps_position and gps_position.wayPoint:
-                numeric_heading = self.heading
-                if numeric_heading is not None:
-                    directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-                    cardinal_heading = directions[
-                        int((numeric_heading + 22.5) / 45) % 8
-                    ]
-                else:
-                    cardinal_heading = "Unknown"
-
-                return {
-                    "elevation": gps_position.wayPoint.position.altitude,
-                    "HDOP": gps_position.wayPoint.hdop,
-                    "satellites": gps_position.wayPoint.satellites,
-                    "heading": cardinal_heading,
-                    "raw_heading": numeric_heading,
-                }
-        return {}
+        return self._fix.attributes
 
     @property
     def source_type(self):
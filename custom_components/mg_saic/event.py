@@ -3,7 +3,6 @@
 from homeassistant.components.event import EventEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, LOGGER
-from .utils import create_device_info
 
 # Event types this entity can fire. Only types listed here may be triggered —
 # attempting to fire any other type raises a ValueError (HA core enforces
@@ -22,7 +21,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     client = hass.data[DOMAIN][entry.entry_id]
 
-    if not coordinator.data.get("info"):
+    if coordinator.vin_info is None:
         LOGGER.error("Vehicle info is not available. Event entity cannot be set up.")
         return
 
@@ -57,11 +56,11 @@ class SAICMGCommandErrorEvent(CoordinatorEntity, EventEntity):
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Command Errors"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_command_errors_event"
+        self._attr_name = coordinator.identity.name("Command Errors")
+        self._attr_unique_id = coordinator.identity.unique_id("command_errors_event")
         self._attr_icon = "mdi:alert-circle-outline"
         self._attr_event_types = EVENT_TYPES
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -7,7 +7,7 @@ from .const import (
     DOMAIN,
     LOGGER,
 )
-from .utils import create_device_info
+from .snapshot import fields_context
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -15,7 +15,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     client = hass.data[DOMAIN][entry.entry_id]
 
-    if not coordinator.data.get("info"):
+    if coordinator.vin_info is None:
         LOGGER.error("Vehicle info is not available. Lock cannot be set up.")
         return
 
@@ -34,16 +34,18 @@ class SAICMGLockEntity(CoordinatorEntity, LockEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the lock entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context("lockStatus", "has_status")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
 
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Lock"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_lock"
+        self._attr_name = coordinator.identity.name("Lock")
+        self._attr_unique_id = coordinator.identity.unique_id("lock")
         self._attr_icon = "mdi:car-door-lock"
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -53,18 +55,16 @@ class SAICMGLockEntity(CoordinatorEntity, LockEntity):
     @property
     def is_locked(self):
         """Return true if the vehicle is locked."""
-        status = self.coordinator.data.get("status")
-        if status:
-            lock_status = getattr(status.basicVehicleStatus, "lockStatus", None)
-            return lock_status == 1
-        return None
+        if not self.coordinator.data.has_status:
+            return None
+        return self.coordinator.data.lockStatus == 1
 
     @property
     def available(self):
         """Return True if the lock entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("status") is not None
+            and self.coordinator.data.has_status
         )
 
     async def async_lock(self, **kwargs):
@@ -112,16 +112,18 @@ class SAICMGLockEntity(CoordinatorEntity, LockEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the lock entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context("lockStatus", "has_status")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
 
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Lock"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_lock"
+        self._attr_name = coordinator.identity.name("Lock")
+        self._attr_unique_id = coordinator.identity.unique_id("lock")
         self._attr_icon = "mdi:car-door-lock"
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -131,18 +133,16 @@ class SAICMGLockEntity(CoordinatorEntity, LockEntity):
     @property
     def is_locked(self):
         """Return true if the vehicle is locked."""
-        status = self.coordinator.data.get("status")
-        if status:
-            lock_status = getattr(status.basicVehicleStatus, "lockStatus", None)
-            return lock_status == 1
-        return None
+        if not self.coordinator.data.has_status:
+            return None
+        return self.coordinator.data.lockStatus == 1
 
     @property
     def available(self):
         """Return True if the lock entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("status") is not None
+            and self.coordinator.data.has_status
         )
 
     async def async_lock(self, **kwargs):
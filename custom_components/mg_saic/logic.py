@@ -4,7 +4,13 @@ These helpers deliberately avoid Home Assistant imports so they can be tested
 with the standard library only.
 """
 
+from array import array
+import asyncio
+import dataclasses
 from datetime import timedelta
+from enum import Enum
+import math
+from types import SimpleNamespace
 
 
 def normalize_sunroof_action(action):
@@ -34,6 +40,9 @@ def select_update_interval(
     dc_charging_update_interval=None,
     grace_period_update_interval,
     after_shutdown_update_interval,
+    charge_finish_in=None,
+    max_charging_update_interval=None,
+    usage_outlook=None,
 ):
     """Return the interval that should be used for the current state.
 
@@ -43,15 +52,30 @@ def select_update_interval(
     3. AC charging — use charging_update_interval
     4. Grace period — recent activity but not powered/charging
     5. After shutdown window
-    6. Default idle interval
+    6. Likely hour in the learned usage profile (*usage_outlook* "likely")
+       — grace period interval, to catch the expected start or plug-in
+    7. Default idle interval — also in hours the profile knows as quiet,
+       so the configured interval is never stretched behind the user's back
+
+    While charging with a predicted finish (*charge_finish_in*, see
+    ChargeProgress), the charging interval is only the floor: far from the
+    finish polls stretch up to *max_charging_update_interval*
+    (charging_poll_interval).
     """
     if is_powered_on:
         return powered_update_interval
 
     if is_dc_charging and dc_charging_update_interval is not None:
-        return dc_charging_update_interval
+        charging_update_interval = dc_charging_update_interval
+        is_charging = True
 
     if is_charging:
+        if charge_finish_in is not None and max_charging_update_interval is not None:
+            return charging_poll_interval(
+                charge_finish_in,
+                charging_update_interval,
+                max_charging_update_interval,
+            )
         return charging_update_interval
 
     if (
@@ -66,4 +90,697 @@ def select_update_interval(
     if not isinstance(default_update_interval, timedelta):
         raise TypeError("default_update_interval must be a timedelta")
 
+    if usage_outlook == "likely":
+        return min(grace_period_update_interval, default_update_interval)
+
     return default_update_interval
+
+
+# SOC gained in a charging session (percentage points) before ChargeProgress
+# trusts the observed rate over the one derived from pack power.
+CHARGE_OBSERVED_MIN_GAIN = 2
+
+
+def charging_poll_interval(finish_in, min_interval, max_interval):
+    """Return the poll interval for a charge predicted to finish in *finish_in*.
+
+    Polling at half the remaining time halves the gap on every poll, so a
+    long AC session costs a handful of sparse polls early on and the polls
+    bunch up around the predicted finish, down to *min_interval*.
+    """
+    return max(min_interval, min(max_interval, finish_in / 2))
+
+
+class ChargeProgress:
+    """Charge-progress model of one charging session.
+
+    Fed with every charging snapshot, it predicts when the target SOC will be
+    reached.  The charge rate comes from the pack power (current × voltage
+    over the battery capacity) until the session has gained
+    CHARGE_OBSERVED_MIN_GAIN points of SOC; from then on the SOC actually
+    gained per second is used, which also accounts for charging losses.
+    """
+
+    def __init__(self):
+        self._start = None
+        self.finish = None
+
+    def reset(self):
+        """Forget the session, e.g. once charging has stopped."""
+        self._start = None
+        self.finish = None
+
+    def update(self, now, *, soc, target_soc, current, voltage, capacity_kwh):
+        """Record one charging snapshot taken at *now*; return the new finish.
+
+        *current* is the pack current in amps (positive while charging) and
+        *voltage* the pack voltage.  Returns ``None`` — no prediction — when
+        the SOC, the target or a usable charge rate is missing.
+        """
+        self.finish = None
+        if soc is None or target_soc is None:
+            return None
+        if soc >= target_soc:
+            self.finish = now
+            return now
+
+        if self._start is None or soc < self._start[1]:
+            self._start = (now, soc)
+        start_time, start_soc = self._start
+
+        # Percentage points per second.
+        rate = None
+        gained = soc - start_soc
+        if gained >= CHARGE_OBSERVED_MIN_GAIN:
+            rate = gained / (now - start_time).total_seconds()
+        elif current and voltage and capacity_kwh and current > 0:
+            rate = current * voltage / 1000 / capacity_kwh * 100 / 3600
+        if not rate:
+            return None
+
+        self.finish = now + timedelta(seconds=(target_soc - soc) / rate)
+        return self.finish
+
+
+# Event kinds learned by UsageProfile.
+USAGE_KINDS = ("start", "park", "plug")
+
+# One bucket per weekday (Monday = 0) and local hour.
+USAGE_BUCKETS = 7 * 24
+
+# Every recorded event first scales the kind's weights by this, so old habits
+# fade out (half-life of ~35 events) and the weights stay bounded.
+USAGE_DECAY = 0.98
+
+# A kind's pattern is only trusted once its total weight reaches this.
+USAGE_MIN_WEIGHT = 10
+
+# An hour is "likely" when a trusted kind weighs at least this many times its
+# average bucket, and "quiet" when no trusted kind reaches this fraction of it.
+USAGE_LIKELY_RATIO = 3.0
+USAGE_QUIET_RATIO = 0.25
+
+
+class UsageProfile:
+    """Learned weekly pattern of when one vehicle starts, parks and plugs in.
+
+    Each kind in USAGE_KINDS is an array of 7 × 24 weights indexed by
+    ``weekday * 24 + hour``.  Recording an event decays the kind's weights
+    and adds 1 to the event's bucket, so the profile is updated
+    incrementally, follows changing habits and stays a few kilobytes.
+    """
+
+    def __init__(self):
+        self._weights = {
+            kind: array("d", [0.0]) * USAGE_BUCKETS for kind in USAGE_KINDS
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a profile from as_dict output; bad entries start empty."""
+        profile = cls()
+        for kind, weights in (data or {}).items():
+            if kind in profile._weights and len(weights) == USAGE_BUCKETS:
+                profile._weights[kind] = array("d", weights)
+        return profile
+
+    def as_dict(self):
+        """Return the weights in a JSON-ready form."""
+        return {kind: list(weights) for kind, weights in self._weights.items()}
+
+    def record(self, kind, weekday, hour):
+        """Record one *kind* event at local *weekday* and *hour*."""
+        weights = self._weights[kind]
+        for index in range(USAGE_BUCKETS):
+            weights[index] *= USAGE_DECAY
+        weights[weekday * 24 + hour] += 1.0
+
+    def _ratios(self, index):
+        """Return bucket weight / average bucket weight of every trusted kind."""
+        ratios = []
+        for weights in self._weights.values():
+            total = sum(weights)
+            if total >= USAGE_MIN_WEIGHT:
+                ratios.append(weights[index] * USAGE_BUCKETS / total)
+        return ratios
+
+    def outlook(self, weekday, hour):
+        """Return "likely", "quiet" or ``None`` (no opinion) for that hour."""
+        ratios = self._ratios(weekday * 24 + hour)
+        if not ratios:
+            return None
+        if max(ratios) >= USAGE_LIKELY_RATIO:
+            return "likely"
+        if max(ratios) <= USAGE_QUIET_RATIO:
+            return "quiet"
+        return None
+
+    def hours_until_likely(self, weekday, hour, horizon=24):
+        """Return how many hours after this one the next likely hour starts.
+
+        Looks at most *horizon* hours ahead; ``None`` when none is likely.
+        """
+        start = weekday * 24 + hour
+        for offset in range(1, horizon + 1):
+            index = (start + offset) % USAGE_BUCKETS
+            if any(ratio >= USAGE_LIKELY_RATIO for ratio in self._ratios(index)):
+                return offset
+        return None
+
+
+# Plug-in delays (seconds from power-off or locking to charging) kept per VIN.
+PLUG_IN_HISTORY_SIZE = 20
+
+# Plug-ins later than this after stopping (seconds) still count for the place
+# but say nothing about when to poll, so their delay is not kept.
+PLUG_IN_MAX_DELAY = 3600
+
+# With fewer delays than this the default post-shutdown sequence is used.
+PLUG_IN_MIN_SAMPLES = 5
+
+# Quantiles of the delay distribution at which post-shutdown refreshes fire.
+PLUG_IN_QUANTILES = (0.25, 0.5, 0.75, 0.9)
+
+# Refreshes of a learned sequence are at least this far apart (seconds).
+PLUG_IN_MIN_STEP = 60
+
+# A place (GPS fix rounded to ~100 m) gets no post-shutdown sequence once
+# this many stops there ended without a plug-in and none ever had one.
+PLUG_IN_NEVER_AFTER = 3
+
+# Most recently used places remembered.
+PLUG_IN_MAX_PLACES = 50
+
+
+class PlugInHistory:
+    """How long after stopping one vehicle gets plugged in, and where.
+
+    Fed with the outcome of every stop — plugged in after a delay, or driven
+    off again without charging — it turns the observed delays into the
+    post-shutdown refresh sequence (one refresh per quantile) and tells
+    apart places where the car is never plugged in.
+    """
+
+    def __init__(self):
+        self.delays = []
+        self._places = {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild the history from as_dict output."""
+        history = cls()
+        data = data or {}
+        history.delays = [float(delay) for delay in data.get("delays", [])]
+        history.delays = history.delays[-PLUG_IN_HISTORY_SIZE:]
+        history._places = {
+            place: list(counts) for place, counts in data.get("places", {}).items()
+        }
+        return history
+
+    def as_dict(self):
+        """Return the history in a JSON-ready form."""
+        return {"delays": list(self.delays), "places": dict(self._places)}
+
+    @staticmethod
+    def place(latitude, longitude):
+        """Return the place key of a GPS fix, or ``None`` without one."""
+        if latitude is None or longitude is None:
+            return None
+        return f"{latitude:.3f},{longitude:.3f}"
+
+    def record_stop(self, place, delay):
+        """Record a stop at *place*: plugged in after *delay* s, or ``None``."""
+        if delay is not None and delay <= PLUG_IN_MAX_DELAY:
+            self.delays = [*self.delays, delay][-PLUG_IN_HISTORY_SIZE:]
+        if place is None:
+            return
+        stops, plug_ins = self._places.pop(place, (0, 0))
+        if len(self._places) >= PLUG_IN_MAX_PLACES:
+            del self._places[next(iter(self._places))]
+        self._places[place] = [stops + 1, plug_ins + (delay is not None)]
+
+    def never_plugged_in_at(self, place):
+        """Return True if stops at *place* have never ended in a plug-in."""
+        stops, plug_ins = self._places.get(place, (0, 0))
+        return plug_ins == 0 and stops >= PLUG_IN_NEVER_AFTER
+
+    def refresh_sequence(self, default):
+        """Return the post-shutdown refresh delays (seconds between refreshes).
+
+        One refresh per PLUG_IN_QUANTILES quantile of the observed delays,
+        so most plug-ins are caught by the first refresh after them.  Falls
+        back to *default* until PLUG_IN_MIN_SAMPLES delays are known.
+        """
+        if len(self.delays) < PLUG_IN_MIN_SAMPLES:
+            return list(default)
+        delays = sorted(self.delays)
+        sequence = []
+        elapsed = 0
+        for quantile in PLUG_IN_QUANTILES:
+            at = delays[min(len(delays) - 1, int(quantile * len(delays)))]
+            step = max(PLUG_IN_MIN_STEP, at - elapsed)
+            if sequence and at - elapsed < PLUG_IN_MIN_STEP:
+                continue
+            sequence.append(step)
+            elapsed += step
+        return sequence
+
+
+def next_message_page(fetched, max_page_size):
+    """Return `(page_num, page_size)` for the next message-queue request.
+
+    The first request fetches a single message — in steady state that one
+    message is already the watermark and the poll is done in one call.  While
+    every message fetched so far is new, the page size doubles (1, 1, 2, 4,
+    8, …) up to *max_page_size*, so a backlog drains in a handful of calls.
+
+    Sizes are chosen so that *fetched* is always a whole number of pages,
+    keeping page_num aligned with what has already been read.  This holds as
+    long as *max_page_size* is a power of two and *fetched* only ever grows
+    by full pages (a short page means the queue is exhausted anyway).
+    """
+    if fetched <= 0:
+        return 1, 1
+
+    page_size = 1
+    while page_size * 2 <= min(fetched, max_page_size):
+        page_size *= 2
+    if fetched % page_size:
+        raise ValueError(
+            f"{fetched} messages is not a whole number of {page_size}-message pages"
+        )
+    return fetched // page_size + 1, page_size
+
+
+def token_refresh_delay(lifetime, elapsed, margin):
+    """Return seconds until a session token should be renewed.
+
+    The token is renewed *margin* seconds before it expires.  Short-lived
+    tokens (lifetime under twice the margin) are renewed at half their
+    lifetime instead, so a renewal never fires straight after login.
+    Returns 0 when the renewal is already due.
+    """
+    lead = min(margin, lifetime / 2)
+    return max(0.0, lifetime - lead - elapsed)
+
+
+_AUTH_ERROR_MARKERS = (
+    "401",
+    "invalid session",
+    "token expired",
+    "not logged in",
+)
+
+
+def is_auth_error_message(message):
+    """Return True if an API error message means the session was rejected."""
+    text = str(message).lower()
+    return any(marker in text for marker in _AUTH_ERROR_MARKERS)
+
+
+def compact_response(obj):
+    """Return a JSON-ready copy of an API response object.
+
+    Dataclasses (the library's response models) and restored objects become
+    dicts, enums become their value, and ``None`` fields are dropped to keep
+    the stored form small — RestoredResponse reads them back as ``None``.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        items = ((f.name, getattr(obj, f.name)) for f in dataclasses.fields(obj))
+    elif isinstance(obj, SimpleNamespace):
+        items = vars(obj).items()
+    elif isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, (list, tuple)):
+        return [compact_response(item) for item in obj]
+    elif isinstance(obj, Enum):
+        return obj.value
+    else:
+        return obj
+    return {
+        key: compact_response(value) for key, value in items if value is not None
+    }
+
+
+class RestoredResponse(SimpleNamespace):
+    """Attribute view of a response restored from its compact form.
+
+    Fields that were ``None`` (and so not stored) read back as ``None``, so
+    entity code walking ``status.basicVehicleStatus.<field>`` behaves exactly
+    as it does on a live response.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return None
+
+
+def restore_response(data):
+    """Rebuild attribute-accessible objects from compact_response output."""
+    if isinstance(data, dict):
+        return RestoredResponse(
+            **{key: restore_response(value) for key, value in data.items()}
+        )
+    if isinstance(data, list):
+        return [restore_response(item) for item in data]
+    return data
+
+
+# The SAIC API reports "no valid data" in numeric fields as -128.
+SAIC_SENTINEL = -128
+
+
+def decode_field(raw, factor=None, *, zero_valid=True):
+    """Decode one raw API value into its scaled reading.
+
+    Returns ``None`` for a missing value and for the -128 sentinel — before
+    scaling, so it never turns into -12.8 — and for 0 when *zero_valid* is
+    False (fields such as tyre pressure where 0 cannot be a real reading).
+    """
+    if raw is None or raw == SAIC_SENTINEL:
+        return None
+    if raw == 0 and not zero_valid:
+        return None
+    return raw * factor if factor is not None else raw
+
+
+def decode_fields(source, fields):
+    """Decode *fields* of one response part into ``{attribute: value}``.
+
+    *fields* is a sequence of ``(attribute, factor, zero_valid)`` tuples,
+    where the attribute is the field name on *source*.  A missing *source*
+    decodes every field to ``None``.
+    """
+    return {
+        name: decode_field(
+            getattr(source, name, None) if source is not None else None,
+            factor,
+            zero_valid=zero_valid,
+        )
+        for name, factor, zero_valid in fields
+    }
+
+
+def decode_pack_current(raw, factor):
+    """Decode bmsPackCrnt into amps, or ``None`` for a missing/sentinel value.
+
+    SAIC encodes the pack current around an offset of 20000: raw values below
+    it are charging (positive amps), above it discharging — traction or V2X
+    export (negative amps).  ``1000 - raw * factor`` gives the sign for both.
+    """
+    if raw is None or raw == SAIC_SENTINEL:
+        return None
+    return 1000 - raw * factor
+
+
+def retain_valid(retained, fresh, monotonic=()):
+    """Return the values of *fresh* that should replace those in *retained*.
+
+    Both are ``{field: value}`` mappings of decoded values.  A ``None`` (no
+    valid reading in this refresh) never replaces a retained value, and fields
+    in *monotonic* — odometer-style counters — only ever move forward, so one
+    bad response cannot wind them back.  Only values that differ from the
+    retained ones are returned.
+    """
+    updates = {}
+    for name, value in fresh.items():
+        if value is None:
+            continue
+        previous = retained.get(name)
+        if previous is not None:
+            if value == previous:
+                continue
+            if name in monotonic and value < previous:
+                continue
+        updates[name] = value
+    return updates
+
+
+def apply_deadband(published, value, deadband):
+    """Return the value a sensor should publish for a new reading.
+
+    A reading less than *deadband* away from the *published* value keeps
+    that value, so the sensor's state does not change.  Comparing with the
+    published value rather than the previous reading adds hysteresis: a
+    reading flickering between two adjacent steps publishes nothing, while a
+    slow drift publishes once it has moved a full deadband.  ``None`` on
+    either side, or a zero deadband, passes *value* through.
+    """
+    if not deadband or published is None or value is None:
+        return value
+    if abs(value - published) < deadband:
+        return published
+    return value
+
+
+EARTH_RADIUS_M = 6371008.8
+
+COMPASS_POINTS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
+def haversine_distance(lat1, lon1, lat2, lon2):
+    """Return the great-circle distance in metres between two positions."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a)))
+
+
+def compass_point(heading):
+    """Return the eight-point compass direction of *heading* in degrees."""
+    return COMPASS_POINTS[int((heading + 22.5) / 45) % 8]
+
+
+def listeners_to_notify(listeners, changed):
+    """Return the update callbacks of *listeners* concerned by *changed*.
+
+    *listeners* are ``(update_callback, context)`` pairs as registered with
+    the coordinator, where an entity's context is the set of fields it reads
+    (or ``None`` to be updated on every notification).  *changed* is the set
+    of fields changed by the latest refresh, or ``None`` to notify everyone.
+    """
+    if changed is None:
+        return [update_callback for update_callback, _context in listeners]
+    return [
+        update_callback
+        for update_callback, context in listeners
+        if context is None or not changed.isdisjoint(context)
+    ]
+
+
+def coalesce_window_limit(window, after_action_delay):
+    """Return the coalescing *window*, clamped below *after_action_delay*.
+
+    The fetch fired right after a command still shows the pre-command state.
+    A window reaching the after-action delay would let that fetch absorb the
+    confirming refresh, so the window is kept at least a second shorter.
+    """
+    return max(timedelta(0), min(window, after_action_delay - timedelta(seconds=1)))
+
+
+@dataclasses.dataclass(frozen=True)
+class RefreshRequest:
+    """One pending refresh: why it is wanted, when, and how urgent it is."""
+
+    reason: str
+    deadline: object
+    priority: int = 0
+
+
+class RefreshQueue:
+    """Pending refresh requests of one coordinator, served by single fetches.
+
+    Requests are keyed by reason, so asking again for the same reason moves
+    its deadline instead of adding a second fetch.  A fetch at *now* serves
+    every request due within *window* of it: the interval timer, an action
+    follow-up and a post-shutdown step that land seconds apart cost one API
+    round-trip instead of three.  Served requests come back most urgent
+    (highest priority) first, so the fetch is logged under the reason that
+    mattered most.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._requests = {}
+
+    def __contains__(self, reason):
+        return reason in self._requests
+
+    def __len__(self):
+        return len(self._requests)
+
+    def request(self, reason, deadline, priority=0):
+        """Queue (or move) the refresh wanted for *reason* at *deadline*."""
+        self._requests[reason] = RefreshRequest(reason, deadline, priority)
+
+    def cancel(self, reason):
+        """Drop the pending request for *reason*, if any."""
+        self._requests.pop(reason, None)
+
+    def clear(self):
+        """Drop every pending request."""
+        self._requests.clear()
+
+    def next_deadline(self):
+        """Return the earliest pending deadline, or ``None`` when idle."""
+        return min((r.deadline for r in self._requests.values()), default=None)
+
+    def pending(self):
+        """Return the pending requests in deadline order."""
+        return sorted(
+            self._requests.values(), key=lambda r: (r.deadline, -r.priority)
+        )
+
+    def due(self, now, window=None):
+        """Return the requests a fetch at *now* would serve, most urgent first.
+
+        *window* overrides the queue's coalescing window.
+        """
+        horizon = now + (self.window if window is None else window)
+        return sorted(
+            (r for r in self._requests.values() if r.deadline <= horizon),
+            key=lambda r: (-r.priority, r.deadline),
+        )
+
+    def take_due(self, now, window=None):
+        """Remove and return the requests served by a fetch started at *now*."""
+        due = self.due(now, window)
+        for r in due:
+            del self._requests[r.reason]
+        return due
+
+
+def select_message_poll_interval(
+    *,
+    any_powered_on,
+    any_charging,
+    since_last_activity,
+    local_hour,
+    active_interval,
+    charging_interval,
+    daytime_interval,
+    night_interval,
+    long_idle_interval,
+    recent_activity_window,
+    long_idle_after,
+    night_start_hour,
+    night_end_hour,
+):
+    """Return `(interval, reason)` for the account's next message-queue poll.
+
+    The message queue is how we learn about engine starts quickly, so it is
+    polled often when something is happening or likely to, and backs off hard
+    when every vehicle on the account has been idle for a while.
+
+    Priority order (highest to lowest):
+    1. Any vehicle powered on — shutdown / charging messages are imminent
+    2. Recent activity on any vehicle — the car may be about to leave again
+    3. Any vehicle charging — charge events, but the coordinator already
+       polls charging itself
+    4. Idle for longer than *long_idle_after* — parked for days
+    5. Idle at night (between *night_start_hour* and *night_end_hour*, local)
+    6. Idle during the day
+    """
+    if any_powered_on:
+        return active_interval, "vehicle powered on"
+
+    if since_last_activity is not None and since_last_activity <= recent_activity_window:
+        return active_interval, "recent vehicle activity"
+
+    if any_charging:
+        return charging_interval, "vehicle charging"
+
+    if since_last_activity is not None and since_last_activity > long_idle_after:
+        return long_idle_interval, "all vehicles idle for a long time"
+
+    if night_start_hour > night_end_hour:
+        is_night = local_hour >= night_start_hour or local_hour < night_end_hour
+    else:
+        is_night = night_start_hour <= local_hour < night_end_hour
+    if is_night:
+        return night_interval, "all vehicles idle (night)"
+
+    return daytime_interval, "all vehicles idle (daytime)"
+
+
+class ReleasableLockHold:
+    """Hold an asyncio.Lock for a unit of work that may need to wait mid-way.
+
+    Used as ``async with ReleasableLockHold(lock) as hold:``.  While held, the
+    work can call ``hold.sleep_released(delay)`` to give the lock up for the
+    duration of a wait (e.g. a retry backoff) and then queue for it again.
+    asyncio.Lock wakes waiters in FIFO order, so anyone who queued while we
+    slept goes first — a stalled job can't starve the others sharing the lock.
+
+    Unlike releasing/re-acquiring around a plain ``async with lock``, this
+    tracks whether the lock is actually held, so a cancellation that lands
+    while re-queueing never releases a lock we no longer own.
+    """
+
+    def __init__(self, lock):
+        self._lock = lock
+        self.held = False
+
+    async def __aenter__(self):
+        await self._lock.acquire()
+        self.held = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.held:
+            self.held = False
+            self._lock.release()
+
+    async def sleep_released(self, delay):
+        """Sleep *delay* seconds without holding the lock, then re-acquire it."""
+        if self.held:
+            self.held = False
+            self._lock.release()
+        await asyncio.sleep(delay)
+        await self._lock.acquire()
+        self.held = True
+
+
+class SessionGeneration:
+    """Single-flight re-login keyed on a session generation counter.
+
+    Every successful login calls ``advance()``.  A caller that sees its
+    request rejected on generation N calls ``async_renew(N, login)``: the
+    first such caller runs *login* (under *lock*) to reach N+1, callers that
+    arrive while it is in flight await that same attempt and share its
+    result, and callers that arrive afterwards with a stale N return
+    straight away — the session they need already exists.
+    """
+
+    def __init__(self, lock):
+        self._lock = lock
+        self.generation = 0
+        self._task = None
+
+    def advance(self):
+        """Record that a new session was established."""
+        self.generation += 1
+
+    async def async_renew(self, generation, login):
+        """Re-login once for *generation*; return True if this call did so."""
+        if generation != self.generation:
+            return False
+        task = self._task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._renew(generation, login))
+            self._task = task
+        # Shield so one cancelled waiter doesn't abort the login for the rest.
+        return await asyncio.shield(task)
+
+    async def _renew(self, generation, login):
+        async with self._lock:
+            if generation != self.generation:
+                return False
+            await login()
+            return True
@@ -3,8 +3,8 @@
 
 One instance of SAICMGAccountPoller exists per unique (username, region) pair,
 regardless of how many vehicles are registered under that account.  It polls
-the SAIC alarm message queue once every MESSAGE_POLL_INTERVAL_SECONDS and
-routes each message to the correct per-VIN coordinator.
+the SAIC alarm message queue on an adaptive cadence (see "Poll cadence" below)
+and routes each message to the correct per-VIN coordinator.
 
 Why one poller per account, not one per VIN?
 --------------------------------------------
@@ -13,8 +13,8 @@ filtered per vehicle at the API level.  If two coordinators (one per VIN)
 both call get_alarm_messages concurrently they get duplicate messages,
 consume each other's queue position, and can trigger session token
 conflicts.  A single poller serialises all access so:
-  - Exactly one get_alarm_messages call is made per 60-second cycle per
-    account, regardless of how many VINs are configured.
+  - Exactly one get_alarm_messages poll is made per cycle per account,
+    regardless of how many VINs are configured.
   - Messages are routed to the correct coordinator by matching the VIN
     field on each message.  Messages with no VIN, or a VIN that isn't
     registered, are logged and discarded.
@@ -40,6 +40,38 @@ the entire pagination loop.  This prevents the poller from starving
 coordinator data fetches on multi-VIN accounts during the (rare) case where
 there are many new messages to process.
 
+Adaptive page size
+------------------
+Each poll starts with a one-message page: in steady state that message is
+already the watermark, so the whole poll is one call.  While every message
+fetched is new, the page size doubles (1, 1, 2, 4, 8, 16), so a backlog of
+20 messages drains in six calls instead of twenty.
+
+Persisted watermark
+-------------------
+The watermark (newest processed message id + time) is stored per account with
+HA's Store helper and loaded when the poll loop starts.  A restart therefore
+costs one page fetch instead of re-walking the queue, and engine-start or
+charging messages that arrived while HA was down are still routed to their
+coordinator (hint + refresh) on the first poll.  Without a stored watermark
+(fresh install) the first poll only records it, as before.
+
+Poll cadence
+------------
+Polling every minute around the clock costs 1440 calls per account per day,
+almost all of them while every car is parked.  Before each sleep the poller
+asks logic.select_message_poll_interval for the next interval, based on the
+registered coordinators' state:
+
+  - any vehicle powered on, or activity in the last 30 min  → 60 s
+  - any vehicle charging                                    → 3 min
+  - all idle, daytime                                       → 2 min
+  - all idle, night (23:00–06:00 local)                     → 10 min
+  - all idle for more than 3 days                           → 15 min
+
+The current interval and the reason for it are exposed as poll_interval and
+poll_interval_reason for diagnostics.
+
 Lifecycle
 ---------
 The poller is created and started by __init__.async_setup_entry when the
@@ -52,16 +84,45 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import LOGGER
+from .logic import next_message_page, select_message_poll_interval
+from .utils import account_storage_key
 
 # ── Timing ───────────────────────────────────────────────────────────────────
 
-# How often to poll the SAIC alarm message queue per account.
-# 60 s matches the MQTT gateway default; the endpoint is lightweight.
+# How often to poll the SAIC alarm message queue per account while a vehicle
+# is in use.  60 s matches the MQTT gateway default; the endpoint is lightweight.
 MESSAGE_POLL_INTERVAL_SECONDS = 60
 
+# Slower cadences while nothing is happening (see "Poll cadence" above).
+MESSAGE_POLL_CHARGING_INTERVAL_SECONDS = 180
+MESSAGE_POLL_DAYTIME_INTERVAL_SECONDS = 120
+MESSAGE_POLL_NIGHT_INTERVAL_SECONDS = 600
+MESSAGE_POLL_LONG_IDLE_INTERVAL_SECONDS = 900
+MESSAGE_POLL_RECENT_ACTIVITY_WINDOW = timedelta(minutes=30)
+MESSAGE_POLL_LONG_IDLE_AFTER = timedelta(days=3)
+MESSAGE_POLL_NIGHT_START_HOUR = 23
+MESSAGE_POLL_NIGHT_END_HOUR = 6
+
+# Adaptive pagination (see logic.next_message_page): the first request asks
+# for one message and the page size doubles up to MESSAGE_POLL_MAX_PAGE_SIZE
+# while everything fetched is still new.  Must be a power of two.
+MESSAGE_POLL_MAX_PAGE_SIZE = 16
+
+# Persisted watermark (see _async_load_watermark).  Saves are coalesced so a
+# burst of polls with new messages costs at most one disk write per delay.
+MESSAGE_WATERMARK_STORAGE_VERSION = 1
+MESSAGE_WATERMARK_SAVE_DELAY = 30
+
+# Safety limit on messages read per poll so a huge backlog on first run does
+# not block the loop indefinitely (1 + 1 + 2 + 4 + 8 + 16 = 32, six calls).
+MESSAGE_POLL_MAX_MESSAGES = 32
+
 # ── Message classification keywords ──────────────────────────────────────────
 
 # messageType string indicating vehicle start / engine-on (confirmed from
@@ -82,8 +143,26 @@ _CHARGING_KEYWORDS = {
 }
 
 
+def _watermark_store(hass, account_key) -> Store:
+    """Return the Store holding *account_key*'s message watermark.
+
+    Keyed by a hash of the account so the file name doesn't contain the
+    login.
+    """
+    return Store(
+        hass,
+        MESSAGE_WATERMARK_STORAGE_VERSION,
+        account_storage_key("message_watermark", account_key),
+    )
+
+
+async def async_remove_message_watermark(hass, account_key) -> None:
+    """Delete the persisted watermark of an account that is no longer set up."""
+    await _watermark_store(hass, account_key).async_remove()
+
+
 class SAICMGAccountPoller:
-    """Polls the SAIC alarm message queue once per minute for a single account.
+    """Polls the SAIC alarm message queue for a single account.
 
     One instance covers all VINs on that account.  Coordinators register
     themselves via register_coordinator / unregister_coordinator.
@@ -129,8 +208,14 @@ class SAICMGAccountPoller:
         self._last_seen_message_ts: datetime | None = None
         self._first_poll_done: bool = False
 
+        # Persisted copy of the watermark above.
+        self._store = _watermark_store(hass, account_key)
+
         self._poll_task: asyncio.Task | None = None
 
+        self._poll_interval: int = MESSAGE_POLL_INTERVAL_SECONDS
+        self._poll_interval_reason: str = "startup"
+
     # ── Registration ─────────────────────────────────────────────────────────
 
     def register_coordinator(self, vin: str, coordinator) -> None:
@@ -158,6 +243,65 @@ class SAICMGAccountPoller:
         """Return True if at least one coordinator is still registered."""
         return bool(self._coordinators)
 
+    # ── Cadence ──────────────────────────────────────────────────────────────
+
+    @property
+    def poll_interval(self) -> int:
+        """Return the current message poll interval in seconds."""
+        return self._poll_interval
+
+    @property
+    def poll_interval_reason(self) -> str:
+        """Return why the current poll interval was chosen."""
+        return self._poll_interval_reason
+
+    def _update_poll_interval(self) -> int:
+        """Re-evaluate the poll interval from the coordinators' state."""
+        coordinators = list(self._coordinators.values())
+        now = datetime.now(timezone.utc)
+
+        activity_times = [
+            ts
+            for coordinator in coordinators
+            for ts in (
+                getattr(coordinator, "last_vehicle_activity", None),
+                getattr(coordinator, "last_powered_on_time", None),
+                getattr(coordinator, "last_powered_off_time", None),
+            )
+            if ts is not None
+        ]
+
+        interval, reason = select_message_poll_interval(
+            any_powered_on=any(
+                getattr(c, "is_powered_on", False) for c in coordinators
+            ),
+            any_charging=any(getattr(c, "is_charging", False) for c in coordinators),
+            since_last_activity=(
+                now - max(activity_times) if activity_times else None
+            ),
+            local_hour=dt_util.now().hour,
+            active_interval=MESSAGE_POLL_INTERVAL_SECONDS,
+            charging_interval=MESSAGE_POLL_CHARGING_INTERVAL_SECONDS,
+            daytime_interval=MESSAGE_POLL_DAYTIME_INTERVAL_SECONDS,
+            night_interval=MESSAGE_POLL_NIGHT_INTERVAL_SECONDS,
+            long_idle_interval=MESSAGE_POLL_LONG_IDLE_INTERVAL_SECONDS,
+            recent_activity_window=MESSAGE_POLL_RECENT_ACTIVITY_WINDOW,
+            long_idle_after=MESSAGE_POLL_LONG_IDLE_AFTER,
+            night_start_hour=MESSAGE_POLL_NIGHT_START_HOUR,
+            night_end_hour=MESSAGE_POLL_NIGHT_END_HOUR,
+        )
+
+        if (interval, reason) != (self._poll_interval, self._poll_interval_reason):
+            LOGGER.debug(
+                "AccountPoller %s: poll interval %ds (%s)",
+                self._account_key,
+                interval,
+                reason,
+            )
+        self._poll_interval = interval
+        self._poll_interval_reason = reason
+        return interval
+
     # ── Lifecycle ────────────────────────────────────────────────────────────
 
     def start(self, config_entry) -> None:
@@ -174,9 +318,7 @@ class SAICMGAccountPoller:
             return
 
         LOGGER.info(
-            "AccountPoller %s: starting message poll loop (interval %ds)",
-            self._account_key,
-            MESSAGE_POLL_INTERVAL_SECONDS,
+            "AccountPoller %s: starting message poll loop", self._account_key
         )
         self._poll_task = config_entry.async_create_background_task(
             self._hass,
@@ -195,10 +337,62 @@ class SAICMGAccountPoller:
                 await self._poll_task
         self._poll_task = None
 
+    # ── Watermark persistence ────────────────────────────────────────────────
+
+    async def _async_load_watermark(self) -> None:
+        """Restore the watermark saved before the last restart, if any."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as exc:
+            LOGGER.warning(
+                "AccountPoller %s: could not load stored watermark: %s",
+                self._account_key,
+                exc,
+            )
+            return
+        if not stored:
+            return
+
+        self._last_seen_message_id = stored.get("message_id")
+        message_time = stored.get("message_time")
+        if message_time:
+            with suppress(ValueError):
+                self._last_seen_message_ts = datetime.fromisoformat(message_time)
+
+        if self._last_seen_message_id is not None or self._last_seen_message_ts:
+            # Treat the stored watermark as our first poll: anything newer
+            # arrived while HA was down and is processed normally.
+            self._first_poll_done = True
+            LOGGER.debug(
+                "AccountPoller %s: restored watermark id=%s time=%s",
+                self._account_key,
+                self._last_seen_message_id,
+                self._last_seen_message_ts,
+            )
+
+    def _async_save_watermark(self) -> None:
+        """Schedule a (coalesced) write of the current watermark."""
+        self._store.async_delay_save(
+            self._watermark_data, MESSAGE_WATERMARK_SAVE_DELAY
+        )
+
+    def _watermark_data(self) -> dict:
+        """Return the watermark in its stored form."""
+        return {
+            "message_id": self._last_seen_message_id,
+            "message_time": (
+                self._last_seen_message_ts.isoformat()
+                if self._last_seen_message_ts is not None
+                else None
+            ),
+        }
+
     # ── Internal poll loop ───────────────────────────────────────────────────
 
     async def _poll_loop(self) -> None:
         """Main loop: sleep, poll, route, repeat."""
+        await self._async_load_watermark()
+
         # Stagger startup slightly so the initial coordinator refresh
         # completes before we issue our first message check.
         await asyncio.sleep(MESSAGE_POLL_INTERVAL_SECONDS)
@@ -218,14 +412,15 @@ class SAICMGAccountPoller:
                     exc,
                 )
 
-            await asyncio.sleep(MESSAGE_POLL_INTERVAL_SECONDS)
+            await asyncio.sleep(self._update_poll_interval())
 
     async def _poll_once(self) -> None:
         """Fetch new messages, route each to the correct coordinator.
 
-        Paginates through the message queue (page_size=1) until we reach a
-        message we have already seen.  Safety-limited to 20 pages so a
-        large backlog on first run does not block the loop indefinitely.
+        Paginates through the message queue with an adaptive page size (see
+        logic.next_message_page) until we reach a message we have already
+        seen.  Safety-limited to MESSAGE_POLL_MAX_MESSAGES so a large backlog
+        on first run does not block the loop indefinitely.
 
         The api_lock is acquired per-page rather than for the entire loop so
         that coordinator data fetches on the same account are not starved while
@@ -233,33 +428,36 @@ class SAICMGAccountPoller:
 
         401 handling: when the shared session token is refreshed by a concurrent
         coordinator re-auth, the next message poll may see a 401.  This is handled
-        by re-logging in via the shared client and retrying once.  Because all
-        coordinators share the same client object, the refreshed token is
-        immediately available to them too.
+        by re-authenticating via the shared client and retrying once.  The
+        re-login is keyed on the session generation the page was requested on,
+        so if a coordinator already logged in again we reuse its session rather
+        than starting another login.  Because all coordinators share the same
+        client object, the refreshed token is immediately available to them too.
         """
         new_messages: list = []
-        page = 1
-        max_pages = 20
+        fetched = 0
+        reached_seen = False
 
-        while page <= max_pages:
+        while not reached_seen and fetched < MESSAGE_POLL_MAX_MESSAGES:
+            page, page_size = next_message_page(fetched, MESSAGE_POLL_MAX_PAGE_SIZE)
             response = None
             async with self._api_lock:
+                generation = self._client.session_generation
                 try:
                     response = await self._client.get_alarm_messages(
-                        page_num=page, page_size=1
+                        page_num=page, page_size=page_size
                     )
                 except Exception as exc:
-                    exc_str = str(exc)
-                    if "401" in exc_str:
+                    if self._client.is_auth_error(exc):
                         LOGGER.debug(
                             "AccountPoller %s: 401 on message poll (token invalidated) "
                             "— re-logging in via shared client",
                             self._account_key,
                         )
                         try:
-                            await self._client.login()
+                            await self._client.async_reauthenticate(generation)
                             response = await self._client.get_alarm_messages(
-                                page_num=page, page_size=1
+                                page_num=page, page_size=page_size
                             )
                         except Exception as retry_exc:
                             LOGGER.warning(
@@ -270,35 +468,43 @@ class SAICMGAccountPoller:
                             break
                     else:
                         LOGGER.warning(
-                            "AccountPoller %s: failed to fetch messages (page %d): %s",
+                            "AccountPoller %s: failed to fetch messages "
+                            "(page %d, size %d): %s",
                             self._account_key,
                             page,
+                            page_size,
                             exc,
                         )
                         break
 
-            if not response or not getattr(response, "messages", None):
+            messages = getattr(response, "messages", None) if response else None
+            if not messages:
                 break
 
-            msg = response.messages[0]
-
-            # Stop on a message we have already processed
-            if (
-                msg.messageId is not None
-                and msg.messageId == self._last_seen_message_id
-            ):
+            for msg in messages:
+                # Stop on a message we have already processed
+                if (
+                    msg.messageId is not None
+                    and msg.messageId == self._last_seen_message_id
+                ):
+                    reached_seen = True
+                    break
+
+                # Stop on a message older than our watermark
+                if (
+                    self._last_seen_message_ts is not None
+                    and getattr(msg, "message_time", None) is not None
+                    and msg.message_time <= self._last_seen_message_ts
+                ):
+                    reached_seen = True
+                    break
+
+                new_messages.append(msg)
+
+            # A short page means we have reached the end of the queue.
+            if len(messages) < page_size:
                 break
-
-            # Stop on a message older than our watermark
-            if (
-                self._last_seen_message_ts is not None
-                and getattr(msg, "message_time", None) is not None
-                and msg.message_time <= self._last_seen_message_ts
-            ):
-                break
-
-            new_messages.append(msg)
-            page += 1
+            fetched += page_size
 
         if not new_messages:
             LOGGER.debug(
@@ -306,14 +512,16 @@ class SAICMGAccountPoller:
             )
             return
 
-        # On the very first successful poll, record the watermark and skip
-        # acting on historical messages — prevents spurious refreshes every
-        # time HA restarts.
+        # On the very first successful poll with no stored watermark (fresh
+        # install, or the store was lost), record the watermark and skip
+        # acting on historical messages — prevents a burst of spurious
+        # refreshes for events that may be weeks old.
         if not self._first_poll_done:
             latest = new_messages[0]
             self._last_seen_message_id = latest.messageId
             self._last_seen_message_ts = getattr(latest, "message_time", None)
             self._first_poll_done = True
+            self._async_save_watermark()
             LOGGER.debug(
                 "AccountPoller %s: first poll — watermarked at id=%s, "
                 "skipping %d historical message(s)",
@@ -335,6 +543,7 @@ class SAICMGAccountPoller:
         latest = new_messages[0]
         self._last_seen_message_id = latest.messageId
         self._last_seen_message_ts = getattr(latest, "message_time", None)
+        self._async_save_watermark()
 
         LOGGER.info(
             "AccountPoller %s: %d new message(s) to process",
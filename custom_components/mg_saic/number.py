@@ -7,7 +7,7 @@ from .const import (
     DOMAIN,
     LOGGER,
 )
-from .utils import create_device_info
+from .snapshot import fields_context
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -15,7 +15,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     client = hass.data[DOMAIN][entry.entry_id]
 
-    if not coordinator.data.get("info"):
+    if coordinator.vin_info is None:
         LOGGER.error("Vehicle info is not available. Numbers cannot be set up.")
         return
 
@@ -39,20 +39,22 @@ class SAICMGTargetSOCNumber(CoordinatorEntity, NumberEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the Target SOC number entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=fields_context("bmsOnBdChrgTrgtSOCDspCmd", "has_charging"),
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._last_valid_value = None
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Target SOC"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_target_soc"
+        self._attr_name = coordinator.identity.name("Target SOC")
+        self._attr_unique_id = coordinator.identity.unique_id("target_soc")
         self._attr_native_min_value = 40
         self._attr_native_max_value = 100
         self._attr_native_step = 10
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_mode = NumberMode.SLIDER
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -62,27 +64,20 @@ class SAICMGTargetSOCNumber(CoordinatorEntity, NumberEntity):
     @property
     def native_value(self):
         """Return the current target SOC value."""
-        charging_data = self.coordinator.data.get("charging")
-        if charging_data:
-            chrg_mgmt_data = getattr(charging_data, "chrgMgmtData", None)
-            if chrg_mgmt_data:
-                soc_cmd = getattr(chrg_mgmt_data, "bmsOnBdChrgTrgtSOCDspCmd", None)
-                # Map the SOC command to percentage
-                soc_mapping = {
-                    1: 40,
-                    2: 50,
-                    3: 60,
-                    4: 70,
-                    5: 80,
-                    6: 90,
-                    7: 100,
-                }
-                soc_value = soc_mapping.get(soc_cmd)
-                if soc_value is not None:
-                    self._last_valid_value = soc_value
-                    return soc_value
-        # Return the last valid value if current data is invalid
-        return self._last_valid_value
+        # Last valid command from the coordinator's retained snapshot, so a
+        # poll without charging data keeps the slider where it was.
+        soc_cmd = self.coordinator.retained.bmsOnBdChrgTrgtSOCDspCmd
+        # Map the SOC command to percentage
+        soc_mapping = {
+            1: 40,
+            2: 50,
+            3: 60,
+            4: 70,
+            5: 80,
+            6: 90,
+            7: 100,
+        }
+        return soc_mapping.get(soc_cmd)
 
     @property
     def icon(self):
@@ -113,7 +108,7 @@ class SAICMGTargetSOCNumber(CoordinatorEntity, NumberEntity):
         """Return True if the number entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("charging") is not None
+            and self.coordinator.data.has_charging
         )
 
     async def async_set_native_value(self, value: float) -> None:
@@ -0,0 +1,318 @@
+# File: refresh_scheduler.py
+"""Account-level fused refresh scheduler.
+
+One instance of SAICMGAccountRefreshScheduler exists per unique
+(username, region) pair, alongside the SAICMGAccountPoller for the same
+account.  Every coordinator on the account routes its data fetches through it
+instead of taking the account lock on its own.
+
+Why fuse refreshes?
+-------------------
+Each coordinator still decides *when* it wants fresh data (its own interval,
+action follow-ups, event-driven refreshes).  Left alone, every one of those
+refreshes takes the shared account lock separately and re-checks the login,
+so a fleet of N cars costs N lock handoffs and N login checks per round, and
+cars whose timers fire a few seconds apart queue behind each other.
+
+The scheduler instead collects requests that arrive within a short batching
+window (FUSED_REFRESH_BATCH_WINDOW) and serves them in one cycle:
+
+  1. take the account lock once,
+  2. check the login once,
+  3. fetch the account's vehicle list once (served from the client cache),
+  4. fetch status + charging for each requested VIN and hand it its slice
+     as soon as its own fetch is done,
+  5. then do the same for siblings pulled forward.
+
+Siblings whose own timer would fire within FUSED_REFRESH_DUE_WINDOW anyway
+are pulled into the same cycle and receive their slice via
+async_set_updated_data, which also re-arms their timer — so their separate
+lock hold a minute later never happens.  Nobody asked for their data, so
+they only get FUSED_REFRESH_PULLED_FORWARD_DEADLINE: a sibling that stalls
+is left to its own timer instead of holding up the batch.
+
+The batching window is skipped when there is nothing to wait for: on a
+single-VIN account, or for an urgent (message event or command follow-up)
+request that should not sit out the delay.
+
+This also replaces the old 5-second sleep that __init__.async_setup_entry
+used to stagger secondary VINs at HA startup: the first refreshes of all
+VINs set up together simply land in the same batch.
+
+Lifecycle
+---------
+Created by __init__.async_setup_entry for the first VIN of an account and
+dropped when the last VIN of that account is unloaded.  Coordinators join
+and leave via register_coordinator / unregister_coordinator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import timedelta
+
+from .const import LOGGER
+from .logic import ReleasableLockHold
+
+# ── Timing ───────────────────────────────────────────────────────────────────
+
+# How long to wait after the first refresh request before running the batch,
+# so that requests from sibling VINs arriving at (almost) the same moment —
+# HA startup, one message poll routing events for several cars — share a cycle.
+FUSED_REFRESH_BATCH_WINDOW = 1.0
+
+# Siblings whose next scheduled refresh falls within this window are pulled
+# into the current batch rather than taking the lock again on their own.
+FUSED_REFRESH_DUE_WINDOW = timedelta(minutes=2)
+
+# Seconds a pulled-forward sibling's fetch may take.  Shorter than
+# RETRY_BACKOFF_FACTOR, so such a fetch is never retried.
+FUSED_REFRESH_PULLED_FORWARD_DEADLINE = 10
+
+
+class SAICMGAccountRefreshScheduler:
+    """Batches vehicle-data fetches for all VINs on one account.
+
+    Thread-safety: all methods are designed to be called from within the HA
+    event loop.  The api_lock is the same asyncio.Lock shared with the
+    account's SAICMGAccountPoller.
+    """
+
+    def __init__(
+        self,
+        hass,
+        client,
+        account_key: tuple[str, str],
+        api_lock: asyncio.Lock,
+    ) -> None:
+        """Initialise the scheduler.
+
+        Args:
+            hass:        Home Assistant instance.
+            client:      the shared SAICMGAPIClient for this account.
+            account_key: (username, region) tuple — used only for logging.
+            api_lock:    asyncio.Lock shared across the account.
+        """
+        self._hass = hass
+        self._client = client
+        self._account_key = account_key
+        self._api_lock = api_lock
+
+        # VIN → coordinator mapping.
+        self._coordinators: dict[str, object] = {}
+
+        # VIN → future resolved with that VIN's raw data for the batch that is
+        # currently being collected.  Dict insertion order is request order.
+        self._pending: dict[str, asyncio.Future] = {}
+        self._batch_task: asyncio.Task | None = None
+        # Set to end the batching window early (see async_request_refresh).
+        self._serve_now = asyncio.Event()
+
+    # ── Registration ─────────────────────────────────────────────────────────
+
+    def register_coordinator(self, vin: str, coordinator) -> None:
+        """Register a coordinator whose fetches this scheduler should serve."""
+        self._coordinators[vin] = coordinator
+        LOGGER.debug(
+            "RefreshScheduler %s: registered VIN %s (%d total)",
+            self._account_key,
+            vin,
+            len(self._coordinators),
+        )
+
+    def unregister_coordinator(self, vin: str) -> None:
+        """Remove a coordinator and fail any request it still has pending."""
+        self._coordinators.pop(vin, None)
+        future = self._pending.pop(vin, None)
+        if future is not None and not future.done():
+            future.cancel()
+        LOGGER.debug(
+            "RefreshScheduler %s: unregistered VIN %s (%d remaining)",
+            self._account_key,
+            vin,
+            len(self._coordinators),
+        )
+
+    @property
+    def has_coordinators(self) -> bool:
+        """Return True if at least one coordinator is still registered."""
+        return bool(self._coordinators)
+
+    # ── Requests ─────────────────────────────────────────────────────────────
+
+    async def async_request_refresh(self, vin: str, urgent: bool = False) -> dict:
+        """Return fresh raw data for *vin*, fetched as part of a fused batch.
+
+        Called from SAICMGDataUpdateCoordinator._async_update_data.  Two
+        requests for the same VIN within one batch share the same result.
+        Exceptions raised while fetching this VIN are re-raised here so the
+        coordinator's normal UpdateFailed handling applies.  An *urgent*
+        request (message event or command follow-up) is served without
+        waiting out the batching window.
+        """
+        future = self._pending.get(vin)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            # Mark any exception as retrieved even if every requester has
+            # already given up, so it isn't logged as "never retrieved".
+            future.add_done_callback(
+                lambda fut: fut.cancelled() or fut.exception()
+            )
+            self._pending[vin] = future
+
+        if urgent or len(self._coordinators) <= 1:
+            self._serve_now.set()
+        if self._batch_task is None or self._batch_task.done():
+            self._start_batch()
+
+        # Shield so one caller timing out (e.g. the startup timeout) doesn't
+        # cancel the shared future for another caller of the same VIN.
+        return await asyncio.shield(future)
+
+    async def async_stop(self) -> None:
+        """Cancel any batch in progress and fail its pending requests."""
+        if self._batch_task is not None and not self._batch_task.done():
+            self._batch_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._batch_task
+        self._batch_task = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+    # ── Batch execution ──────────────────────────────────────────────────────
+
+    def _start_batch(self) -> None:
+        """Start collecting a new batch in the background."""
+        self._batch_task = self._hass.async_create_background_task(
+            self._run_batch(),
+            f"mg_saic_fused_refresh_{self._account_key[0]}",
+        )
+
+    async def _run_batch(self) -> None:
+        """Collect requests for one batching window, then serve them together."""
+        try:
+            await self._serve_batch()
+        finally:
+            # Requests that arrived after this batch was collected are served
+            # by the next one.
+            if self._pending and self._coordinators:
+                self._start_batch()
+            else:
+                self._serve_now.clear()
+
+    async def _serve_batch(self) -> None:
+        """Serve every request collected during the batching window."""
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                self._serve_now.wait(), FUSED_REFRESH_BATCH_WINDOW
+            )
+        self._serve_now.clear()
+
+        requested = self._pending
+        self._pending = {}
+
+        # Requested VINs first, in request order, then due-soon siblings.
+        batch = [
+            (vin, future, self._coordinators.get(vin))
+            for vin, future in requested.items()
+        ]
+        for vin, coordinator in self._coordinators.items():
+            if vin not in requested and coordinator.is_refresh_due_within(
+                FUSED_REFRESH_DUE_WINDOW
+            ):
+                batch.append((vin, None, coordinator))
+
+        LOGGER.debug(
+            "RefreshScheduler %s: fused refresh for %d VIN(s) (%d requested, "
+            "%d pulled forward)",
+            self._account_key,
+            len(batch),
+            len(requested),
+            len(batch) - len(requested),
+        )
+
+        # Fetched data of pulled-forward siblings, applied once the lock is
+        # released.
+        pulled: list[tuple[str, object, dict]] = []
+        try:
+            async with ReleasableLockHold(self._api_lock) as hold:
+                # One login check and one vehicle list for the whole batch.
+                # Failures here are not fatal: each VIN's own fetch retries
+                # through the same (cached, single-flight) client calls.
+                try:
+                    await self._client.ensure_logged_in()
+                    await self._client.get_vehicle_info()
+                except Exception as exc:
+                    LOGGER.debug(
+                        "RefreshScheduler %s: batch pre-check failed: %s",
+                        self._account_key,
+                        exc,
+                    )
+
+                for vin, future, coordinator in batch:
+                    if coordinator is None or (future is not None and future.done()):
+                        # Unregistered meanwhile, or the requester gave up.
+                        continue
+                    if future is None:
+                        data = await self._fetch_pulled_forward(
+                            vin, coordinator, hold
+                        )
+                        if data is not None:
+                            pulled.append((vin, coordinator, data))
+                        continue
+                    # Resolve each requester as soon as its own fetch is done
+                    # so a stalled VIN later in the batch can't hold it up.
+                    try:
+                        data = await coordinator.async_fetch_vehicle_data(hold)
+                    except Exception as exc:
+                        if not future.done():
+                            future.set_exception(exc)
+                    else:
+                        if not future.done():
+                            future.set_result(data)
+        except BaseException as exc:
+            # Cancelled (unload) or an unexpected error: nobody may be left
+            # waiting forever on a future from this batch.
+            for _vin, future, _coordinator in batch:
+                if future is not None and not future.done():
+                    if isinstance(exc, Exception):
+                        future.set_exception(exc)
+                    else:
+                        future.cancel()
+            raise
+
+        # Hand the pulled-forward siblings their slices outside the lock.
+        for vin, coordinator, data in pulled:
+            try:
+                coordinator.async_apply_fused_refresh(data)
+            except Exception as exc:
+                LOGGER.warning(
+                    "RefreshScheduler %s: could not apply fused refresh for "
+                    "VIN %s: %s",
+                    self._account_key,
+                    vin,
+                    exc,
+                )
+
+    async def _fetch_pulled_forward(self, vin: str, coordinator, hold) -> dict | None:
+        """Fetch a sibling nobody requested, within its short deadline.
+
+        Returns None if the fetch failed — the sibling's own timer still
+        fires as scheduled, so that is only noted.
+        """
+        try:
+            return await coordinator.async_fetch_vehicle_data(
+                hold, FUSED_REFRESH_PULLED_FORWARD_DEADLINE
+            )
+        except Exception as exc:
+            LOGGER.debug(
+                "RefreshScheduler %s: pulled-forward refresh for VIN %s "
+                "failed: %s",
+                self._account_key,
+                vin,
+                exc,
+            )
+            return None
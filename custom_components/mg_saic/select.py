@@ -11,7 +11,7 @@ from .const import (
 from saic_ismart_client_ng.api.vehicle_charging import (
     ChargeCurrentLimitCode as ExternalChargeCurrentLimitCode,
 )
-from .utils import create_device_info
+from .snapshot import fields_context
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -19,7 +19,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     client = hass.data[DOMAIN][entry.entry_id]
 
-    if not coordinator.data.get("info"):
+    if coordinator.vin_info is None:
         LOGGER.error("Vehicle info is not available. Select entities cannot be set up.")
         return
 
@@ -69,19 +69,20 @@ class SAICMGChargingCurrentSelect(CoordinatorEntity, SelectEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin, icon):
         """Initialize the Charging Current Limit select entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=fields_context("bmsAltngChrgCrntDspCmd", "has_charging"),
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
         self._icon = icon
 
-        self._attr_name = (
-            f"{vin_info.brandName} {vin_info.modelName} Charging Current Limit"
-        )
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_charging_current_limit"
+        self._attr_name = coordinator.identity.name("Charging Current Limit")
+        self._attr_unique_id = coordinator.identity.unique_id("charging_current_limit")
         self._attr_options = [e.limit for e in ChargeCurrentLimitOption]
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -91,26 +92,20 @@ class SAICMGChargingCurrentSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self):
         """Return the current selected option."""
-        charging_data = self.coordinator.data.get("charging")
-        if charging_data:
-            chrg_mgmt_data = getattr(charging_data, "chrgMgmtData", None)
-            if chrg_mgmt_data:
-                current_limit_code_value = getattr(
-                    chrg_mgmt_data, "bmsAltngChrgCrntDspCmd", None
+        current_limit_code_value = self.coordinator.data.bmsAltngChrgCrntDspCmd
+        if current_limit_code_value is not None:
+            try:
+                external_code = ExternalChargeCurrentLimitCode(
+                    current_limit_code_value
                 )
-                if current_limit_code_value is not None:
-                    try:
-                        external_code = ExternalChargeCurrentLimitCode(
-                            current_limit_code_value
-                        )
-                        for option in ChargeCurrentLimitOption:
-                            if option.value == external_code.value:
-                                return option.limit
-                    except ValueError:
-                        LOGGER.error(
-                            f"Unknown external charge current limit code: {current_limit_code_value}"
-                        )
-                        return None
+                for option in ChargeCurrentLimitOption:
+                    if option.value == external_code.value:
+                        return option.limit
+            except ValueError:
+                LOGGER.error(
+                    f"Unknown external charge current limit code: {current_limit_code_value}"
+                )
+                return None
         return None
 
     @property
@@ -118,7 +113,7 @@ class SAICMGChargingCurrentSelect(CoordinatorEntity, SelectEntity):
         """Return True if the entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("charging") is not None
+            and self.coordinator.data.has_charging
         )
 
     async def async_select_option(self, option: str):
@@ -128,21 +123,13 @@ class SAICMGChargingCurrentSelect(CoordinatorEntity, SelectEntity):
             selected_code = ChargeCurrentLimitOption.to_code(option)
 
             # Get the current target_soc from coordinator's data
-            charging_data = self.coordinator.data.get("charging")
-            if not charging_data:
+            if not self.coordinator.data.has_charging:
                 LOGGER.error(
                     "No charging data available to set charging current limit."
                 )
                 return
 
-            chrg_mgmt_data = getattr(charging_data, "chrgMgmtData", None)
-            if not chrg_mgmt_data:
-                LOGGER.error(
-                    "No charging management data available to set charging current limit."
-                )
-                return
-
-            target_soc_value = getattr(chrg_mgmt_data, "bmsOnBdChrgTrgtSOCDspCmd", None)
+            target_soc_value = self.coordinator.data.bmsOnBdChrgTrgtSOCDspCmd
             if target_soc_value is None:
                 LOGGER.error(
                     "Target SOC value is not available to set charging current limit."
@@ -198,19 +185,21 @@ class SAICMGHeatedSeatLevelSelect(CoordinatorEntity, SelectEntity):
     def __init__(
         self, coordinator, client, entry, vin_info, vin, seat_name, seat_id, icon
     ):
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context(f"{seat_id}SeatHeatLevel")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
         self._seat_id = seat_id
         self._icon = icon
-        self._attr_name = (
-            f"{vin_info.brandName} {vin_info.modelName} Heated Seat {seat_name} Level"
+        self._attr_name = coordinator.identity.name(f"Heated Seat {seat_name} Level")
+        self._attr_unique_id = coordinator.identity.unique_id(
+            f"heated_seat_{seat_id}_level"
         )
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_heated_seat_{seat_id}_level"
         self._attr_options = ["Off", "Low", "Medium", "High"]
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -225,28 +214,22 @@ class SAICMGHeatedSeatLevelSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self):
         """Return the current heating level."""
-        status = self.coordinator.data.get("status")
-        if status:
-            basic_status = getattr(status, "basicVehicleStatus", None)
-            if basic_status:
-                level = getattr(basic_status, f"{self._seat_id}SeatHeatLevel", 0)
-                return {0: "Off", 1: "Low", 2: "Medium", 3: "High"}.get(level, "Off")
-        return "Off"
+        level = getattr(self.coordinator.data, f"{self._seat_id}SeatHeatLevel")
+        return {0: "Off", 1: "Low", 2: "Medium", 3: "High"}.get(level, "Off")
 
     async def async_select_option(self, option: str):
         """Handle user selection to set the heating level."""
         level = {"Off": 0, "Low": 1, "Medium": 2, "High": 3}.get(option, 0)
         try:
             # Get the current level of the opposite seat
-            current_status = self.coordinator.data.get("status", {})
-            basic_status = getattr(current_status, "basicVehicleStatus", {})
+            snapshot = self.coordinator.data
             if self._seat_id == "frontLeft":
-                right_side_level = getattr(basic_status, "frontRightSeatHeatLevel", 0)
+                right_side_level = snapshot.frontRightSeatHeatLevel or 0
                 await self._client.control_heated_seats(
                     self._vin, level, right_side_level
                 )
             elif self._seat_id == "frontRight":
-                left_side_level = getattr(basic_status, "frontLeftSeatHeatLevel", 0)
+                left_side_level = snapshot.frontLeftSeatHeatLevel or 0
                 await self._client.control_heated_seats(
                     self._vin, left_side_level, level
                 )
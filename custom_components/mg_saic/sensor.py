@@ -1,10 +1,38 @@
 # File: sensor.py
-
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+"""MG SAIC sensors.
+
+Every sensor is one SAICMGSensorEntityDescription in SENSORS, served by the
+shared SAICMGSensor entity.  A description carries the unique-ID suffix
+(``key``), the name after the brand/model prefix, the HA metadata and the
+callables that compute availability, value and attributes from the
+coordinator.  The callables are built once at import (see the ``_retained*``
+and ``_charging*`` factories below), so adding a field is one more entry in
+the table rather than another class.
+
+Values come from the coordinator's retained snapshot (the last valid reading
+of each field) unless noted otherwise, so a poll without a valid reading
+holds the last state instead of going Unknown — utility meters and other
+helpers depending on these sensors must not reset to 0.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+)
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfTemperature,
+    UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfLength,
     UnitOfPressure,
@@ -13,2655 +41,873 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfSpeed,
 )
-from .const import (
-    DOMAIN,
-    LOGGER,
-    PRESSURE_TO_BAR,
-    DATA_DECIMAL_CORRECTION,
-    DATA_DECIMAL_CORRECTION_SOC,
-    CHARGING_CURRENT_FACTOR,
-    CHARGING_VOLTAGE_FACTOR,
-    DATA_100_DECIMAL_CORRECTION,
-)
-from .utils import create_device_info
+from .const import DOMAIN, LOGGER, TARGET_SOC_PERCENT
+from .logic import apply_deadband
+from .snapshot import fields_context
 
 
-async def async_setup_entry(hass, entry, async_add_entities):
-    """Set up MG SAIC sensors."""
-    coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
+def _always(coordinator) -> bool:
+    return True
 
-    try:
-        if not coordinator.data.get("info"):
-            LOGGER.error("Failed to retrieve vehicle info.")
-            return
-
-        vin_info = coordinator.vin_info
-        vehicle_type = coordinator.vehicle_type
-
-        sensors = [
-            # Basic Vehicle Sensors
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Ancillary Battery Voltage",
-                "batteryVoltage",
-                "basicVehicleStatus",
-                SensorDeviceClass.VOLTAGE,
-                UnitOfElectricPotential.VOLT,
-                "mdi:car-battery",
-                "measurement",
-                DATA_DECIMAL_CORRECTION,
-                "status",
-            ),
-            SAICMGVehicleDetailSensor(
-                coordinator,
-                entry,
-                "Brand",
-                "brandName",
-                "info",
-            ),
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Exterior Temperature",
-                "exteriorTemperature",
-                "basicVehicleStatus",
-                SensorDeviceClass.TEMPERATURE,
-                UnitOfTemperature.CELSIUS,
-                "mdi:thermometer",
-                "measurement",
-                1.0,
-                "status",
-            ),
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Interior Temperature",
-                "interiorTemperature",
-                "basicVehicleStatus",
-                SensorDeviceClass.TEMPERATURE,
-                UnitOfTemperature.CELSIUS,
-                "mdi:thermometer",
-                "measurement",
-                1.0,
-                "status",
-            ),
-            SAICMGLastKeySeenSensor(
-                coordinator,
-                entry,
-                "Last Key Seen",
-                "mdi:key",
-            ),
-            SAICMGTimestampSensor(
-                coordinator,
-                entry,
-                "Last Powered On",
-                "last_powered_on",
-                SensorDeviceClass.TIMESTAMP,
-                "mdi:power-on",
-                "last_powered_on_time",
-            ),
-            SAICMGTimestampSensor(
-                coordinator,
-                entry,
-                "Last Powered Off",
-                "last_powered_off",
-                SensorDeviceClass.TIMESTAMP,
-                "mdi:power-off",
-                "last_powered_off_time",
-            ),
-            SAICMGLastUpdateSensor(
-                coordinator,
-                entry,
-                "Last Update Time",
-                SensorDeviceClass.TIMESTAMP,
-                None,
-                "mdi:update",
-                None,
-                None,
-            ),
-            SAICMGTimestampSensor(
-                coordinator,
-                entry,
-                "Last Vehicle Activity",
-                "last_vehicle_activity",
-                SensorDeviceClass.TIMESTAMP,
-                "mdi:car-clock",
-                "last_vehicle_activity",
-            ),
-            SAICMGMileageSensor(
-                coordinator,
-                entry,
-                "Mileage",
-                "mileage",
-                "basicVehicleStatus",
-                "rvsChargeStatus",
-                SensorDeviceClass.DISTANCE,
-                UnitOfLength.KILOMETERS,
-                "mdi:counter",
-                "total_increasing",
-                DATA_DECIMAL_CORRECTION,
-                "status",
-            ),
-            SAICMGNextUpdateSensor(
-                coordinator,
-                entry,
-                "Next Update Time",
-                SensorDeviceClass.TIMESTAMP,
-                None,
-                "mdi:update",
-                None,
-                None,
-            ),
-            SAICMGVehicleDetailSensor(
-                coordinator,
-                entry,
-                "Model",
-                "modelName",
-                "info",
-            ),
-            SAICMGVehicleDetailSensor(
-                coordinator,
-                entry,
-                "Model Year",
-                "modelYear",
-                "info",
-            ),
-            SAICMGVINSensor(
-                coordinator,
-                entry,
-            ),
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Power Mode",
-                "powerMode",
-                "basicVehicleStatus",
-                None,
-                None,
-                "mdi:power-settings",
-                None,
-                1.0,
-                "status",
-            ),
-            SAICMGVehicleSpeedSensor(
-                coordinator,
-                entry,
-                "Speed",
-                "speed",
-                "gpsPosition",
-                SensorDeviceClass.SPEED,
-                UnitOfSpeed.KILOMETERS_PER_HOUR,
-                "mdi:speedometer",
-                "measurement",
-                DATA_DECIMAL_CORRECTION,
-                "status",
-            ),
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Tyre Pressure Front Left",
-                "frontLeftTyrePressure",
-                "basicVehicleStatus",
-                SensorDeviceClass.PRESSURE,
-                UnitOfPressure.BAR,
-                "mdi:car-tire-alert",
-                "measurement",
-                PRESSURE_TO_BAR,
-                "status",
-            ),
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Tyre Pressure Front Right",
-                "frontRightTyrePressure",
-                "basicVehicleStatus",
-                SensorDeviceClass.PRESSURE,
-                UnitOfPressure.BAR,
-                "mdi:car-tire-alert",
-                "measurement",
-                PRESSURE_TO_BAR,
-                "status",
-            ),
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Tyre Pressure Rear Left",
-                "rearLeftTyrePressure",
-                "basicVehicleStatus",
-                SensorDeviceClass.PRESSURE,
-                UnitOfPressure.BAR,
-                "mdi:car-tire-alert",
-                "measurement",
-                PRESSURE_TO_BAR,
-                "status",
-            ),
-            SAICMGVehicleSensor(
-                coordinator,
-                entry,
-                "Tyre Pressure Rear Right",
-                "rearRightTyrePressure",
-                "basicVehicleStatus",
-                SensorDeviceClass.PRESSURE,
-                UnitOfPressure.BAR,
-                "mdi:car-tire-alert",
-                "measurement",
-                PRESSURE_TO_BAR,
-                "status",
-            ),
-        ]
-
-        if vehicle_type in ["PHEV", "HEV", "ICE"]:
-            # PHEV, HEV, ICE Sensors
-            sensors.append(
-                SAICMGVehicleSensor(
-                    coordinator,
-                    entry,
-                    "Fuel Level",
-                    "fuelLevelPrc",
-                    "basicVehicleStatus",
-                    SensorDeviceClass.BATTERY,
-                    PERCENTAGE,
-                    "mdi:gas-station",
-                    "measurement",
-                    1.0,
-                    "status",
-                ),
-            )
-
-            sensors.append(
-                SAICMGVehicleSensor(
-                    coordinator,
-                    entry,
-                    "Fuel Range",
-                    "fuelRange",
-                    "basicVehicleStatus",
-                    SensorDeviceClass.DISTANCE,
-                    UnitOfLength.KILOMETERS,
-                    "mdi:gas-station",
-                    "measurement",
-                    DATA_DECIMAL_CORRECTION,
-                    "status",
-                ),
-            )
-
-        if vehicle_type in ["BEV", "PHEV", "HEV"]:
-            # BEV, PHEV, HEV Sensors
-            sensors.append(
-                SAICMGElectricRangeSensor(
-                    coordinator,
-                    entry,
-                    "Electric Range",
-                    "fuelRangeElec",
-                    "basicVehicleStatus",
-                    "rvsChargeStatus",
-                    SensorDeviceClass.DISTANCE,
-                    UnitOfLength.KILOMETERS,
-                    "mdi:car-electric",
-                    "measurement",
-                    DATA_DECIMAL_CORRECTION,
-                    "status",
-                ),
-            )
-
-            sensors.append(
-                SAICMGSOCSensor(
-                    coordinator,
-                    entry,
-                    "State of Charge",
-                    "extendedData1",
-                    "bmsPackSOCDsp",
-                    "basicVehicleStatus",
-                    SensorDeviceClass.BATTERY,
-                    PERCENTAGE,
-                    "mdi:battery",
-                    "measurement",
-                    "charging",
-                )
-            )
-
-            sensors.append(
-                SAICMGChargingSensor(
-                    coordinator,
-                    entry,
-                    "Total Battery Capacity",
-                    "totalBatteryCapacity",
-                    SensorDeviceClass.ENERGY,
-                    UnitOfEnergy.KILO_WATT_HOUR,
-                    "mdi:battery-high",
-                    "total",
-                    DATA_DECIMAL_CORRECTION,
-                    "rvsChargeStatus",
-                    "charging",
-                )
-            )
-
-        if vehicle_type in ["BEV", "PHEV"]:
-            # BEV, PHEV Sensors
-            sensors.extend(
-                [
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Added Electric Range",
-                        "chrgngAddedElecRng",
-                        SensorDeviceClass.DISTANCE,
-                        UnitOfLength.KILOMETERS,
-                        "mdi:map-marker-distance",
-                        "measurement",
-                        DATA_DECIMAL_CORRECTION,
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                    SAICMGChargingCurrentSensor(
-                        coordinator,
-                        entry,
-                        "Charging Current",
-                        "bmsPackCrnt",
-                        SensorDeviceClass.CURRENT,
-                        "A",
-                        "mdi:current-ac",
-                        "measurement",
-                        CHARGING_CURRENT_FACTOR,
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                ]
-            )
-
-            if coordinator.supports_charging_current_limit:
-                sensors.append(
-                    SAICMGChargingCurrentLimitSensor(
-                        coordinator,
-                        entry,
-                        "Charging Current Limit",
-                        "bmsAltngChrgCrntDspCmd",
-                        None,
-                        None,
-                        "mdi:current-ac",
-                        None,
-                        1.0,
-                        "chrgMgmtData",
-                        "charging",
-                    )
-                )
-
-            sensors.extend(
-                [
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Charging Duration",
-                        "chargingDuration",
-                        SensorDeviceClass.DURATION,
-                        UnitOfTime.MINUTES,
-                        "mdi:timer-outline",
-                        "measurement",
-                        DATA_100_DECIMAL_CORRECTION,
-                        "rvsChargeStatus",
-                        "charging",
-                    ),
-                    SAICMGChargingPowerSensor(
-                        coordinator,
-                        entry,
-                        "Charging Power",
-                        SensorDeviceClass.POWER,
-                        UnitOfPower.KILO_WATT,
-                        "mdi:flash",
-                        "measurement",
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Charging Status",
-                        "bmsChrgSts",
-                        None,
-                        None,
-                        "mdi:battery-charging",
-                        None,
-                        1.0,
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Charging Voltage",
-                        "bmsPackVol",
-                        SensorDeviceClass.VOLTAGE,
-                        UnitOfElectricPotential.VOLT,
-                        "mdi:flash",
-                        "measurement",
-                        CHARGING_VOLTAGE_FACTOR,
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Estimated Range After Charging",
-                        "bmsEstdElecRng",
-                        SensorDeviceClass.DISTANCE,
-                        UnitOfLength.KILOMETERS,
-                        "mdi:map-marker-distance",
-                        "measurement",
-                        1.0,
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                    SAICMGInstantPowerSensor(
-                        coordinator,
-                        entry,
-                        "Instant Power",
-                        SensorDeviceClass.POWER,
-                        UnitOfPower.KILO_WATT,
-                        "mdi:lightning-bolt-circle",
-                        "measurement",
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Mileage Since Last Charge",
-                        "mileageSinceLastCharge",
-                        SensorDeviceClass.DISTANCE,
-                        UnitOfLength.KILOMETERS,
-                        "mdi:map-marker-distance",
-                        "measurement",
-                        DATA_DECIMAL_CORRECTION,
-                        "rvsChargeStatus",
-                        "charging",
-                    ),
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Power Usage Since Last Charge",
-                        "powerUsageSinceLastCharge",
-                        SensorDeviceClass.ENERGY,
-                        UnitOfEnergy.KILO_WATT_HOUR,
-                        "mdi:flash",
-                        "total_increasing",
-                        DATA_DECIMAL_CORRECTION,
-                        "rvsChargeStatus",
-                        "charging",
-                    ),
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Remaining Charging Time",
-                        "chrgngRmnngTime",
-                        SensorDeviceClass.DURATION,
-                        UnitOfTime.MINUTES,
-                        "mdi:timer-sand",
-                        "measurement",
-                        1.0,
-                        "chrgMgmtData",
-                        "charging",
-                    ),
-                ]
-            )
-
-            if coordinator.supports_target_soc:
-                sensors.append(
-                    SAICMGChargingSensor(
-                        coordinator,
-                        entry,
-                        "Target SOC",
-                        "bmsOnBdChrgTrgtSOCDspCmd",
-                        SensorDeviceClass.BATTERY,
-                        PERCENTAGE,
-                        "mdi:battery-charging-100",
-                        "measurement",
-                        1.0,
-                        "chrgMgmtData",
-                        "charging",
-                    )
-                )
-
-        if coordinator.has_heated_seats:
-            sensors.extend(
-                [
-                    SAICMGHeatedSeatLevelSensor(
-                        coordinator,
-                        entry,
-                        "Front Left Heated Seat Level",
-                        "frontLeftSeatHeatLevel",
-                        None,
-                        None,
-                        "mdi:car-seat-heater",
-                        None,
-                        None,
-                        "basicVehicleStatus",
-                        "status",
-                    ),
-                    SAICMGHeatedSeatLevelSensor(
-                        coordinator,
-                        entry,
-                        "Front Right Heated Seat Level",
-                        "frontRightSeatHeatLevel",
-                        None,
-                        None,
-                        "mdi:car-seat-heater",
-                        None,
-                        None,
-                        "basicVehicleStatus",
-                        "status",
-                    ),
-                ]
-            )
 
-        if coordinator.has_battery_heating:
-            sensors.append(
-                SAICMGChargingSensor(
-                    coordinator,
-                    entry,
-                    "Battery Heating Status",
-                    "bmsPTCHeatResp",
-                    None,
-                    None,
-                    "mdi:heat-wave",
-                    None,
-                    1.0,
-                    "chrgMgmtData",
-                    "charging",
-                ),
-            )
+@dataclass(frozen=True, kw_only=True)
+class SAICMGSensorEntityDescription(SensorEntityDescription):
+    """Describes an MG SAIC sensor.
 
-        if coordinator.has_steering_wheel_heat:
-            sensors.append(
-                SAICMGSteeringWheelHeatSensor(
-                    coordinator,
-                    entry,
-                    "Steering Wheel Heat",
-                    "steeringHeatLevel",
-                    None,
-                    None,
-                    "mdi:steering",
-                    None,
-                    "basicVehicleStatus",
-                    "status",
-                ),
-            )
+    ``key`` is the unique-ID suffix after ``<entry_id>_<vin>_`` and ``name``
+    the entity name after the brand/model prefix.  The callables take the
+    coordinator.  ``context`` is the coordinator listener context (None
+    updates on every refresh, an empty set never).  ``deadband`` names the
+    SENSOR_DEADBANDS option filtering the value (logic.apply_deadband).
+    """
 
-        # Add sensors
-        async_add_entities(sensors, update_before_add=True)
+    value_fn: Callable[[Any], Any]
+    available_fn: Callable[[Any], bool] = _always
+    attributes_fn: Callable[[Any], dict | None] | None = None
+    exists_fn: Callable[[Any], bool] = _always
+    context: frozenset | None = None
+    deadband: str | None = None
+
+
+# Code → text mappings.  Unknown codes read as "Unknown (<code>)".
+POWER_MODES = {0: "Off", 1: "Accessory", 2: "On", 3: "Start"}
+HEATED_SEAT_LEVELS = {0: "Off", 1: "Low", 2: "Medium", 3: "High"}
+STEERING_WHEEL_HEAT_STATES = {0: "Off", 1: "On"}
+BATTERY_HEATING_STATES = {0: "Off", 1: "On", 2: "Error"}
+CHARGING_CURRENT_LIMITS = {0: "0A (Ignore)", 1: "6A", 2: "8A", 3: "16A", 4: "Max"}
+CHARGING_STATUSES = {
+    0: "Unplugged",
+    1: "Charging (AC)",
+    2: "Charging Finished",
+    3: "Charging",
+    4: "Fault Charging",
+    5: "Connecting",
+    6: "Unrecognized Connection",
+    7: "Plugged In",
+    8: "Charging Stopped",
+    9: "Scheduled Charging",
+    10: "Charging (DC)",
+    11: "Super Offboard Charging",
+    12: "Charging",
+    13: "V2X Discharging",
+}
+
+# Charging fields that read an explicit 0 while the car is not charging.
+# Status 13 (V2X_DISCHARGING) is deliberately not an inactive status — during
+# V2X discharge, voltage and current carry real non-zero readings.
+NOT_CHARGING_ZERO_FIELDS = frozenset(
+    {"bmsPackVol", "chargingDuration", "chrgngRmnngTime", "chrgngAddedElecRng"}
+)
+INACTIVE_CHARGING_STATUSES = frozenset({0, 5})
 
-    except Exception as e:
-        LOGGER.error("Error setting up MG SAIC sensors: %s", e)
+# While actively charging (or finished), bmsPackCrnt oscillates around its
+# zero point and can decode to small negative values (e.g. -1.90 A at
+# raw=20038).  That is measurement noise and is clamped to 0; V2X discharge
+# (13) is excluded so genuine negative current is preserved.
+CLAMP_NEGATIVE_STATUSES = frozenset({1, 2, 3, 9, 10, 12})
 
 
-# GENERAL VEHICLE DETAIL SENSORS
-class SAICMGMileageSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for Mileage, uses data from both VehicleStatusResp and ChrgMgmtDataResp."""
+def _mapped(value, mapping):
+    if value is None:
+        return None
+    return mapping.get(value, f"Unknown ({value})")
 
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        status_type,
-        charging_status_type,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor,
-        data_type,
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._status_type = status_type
-        self._charging_status_type = charging_status_type
-        self._factor = factor
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-        self._vehicle_type = coordinator.vehicle_type
-
-        # Retain last valid mileage so the sensor never drops to Unknown or 0
-        # when the API is unavailable or returns an invalid response. Mileage is
-        # monotonically increasing — it should never go backwards or to zero.
-        self._last_valid_mileage: float | None = None
 
-    @property
-    def unique_id(self):
-        return self._unique_id
+def _retained(field, mapping=None):
+    """Return a value_fn reading *field* from the retained snapshot."""
+    get = attrgetter(field)
+    if mapping is None:
+        return lambda coordinator: get(coordinator.retained)
+    return lambda coordinator: _mapped(get(coordinator.retained), mapping)
 
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
 
-    @property
-    def available(self):
-        """Return True if the entity is available.
+def _retained_available(*fields, data_type):
+    """Return an available_fn for a sensor computed from retained *fields*.
 
-        The sensor remains available as long as we have a last known value,
-        even if the current API poll failed — this prevents utility meters and
-        other helpers that depend on this sensor from resetting to 0.
+    The sensor stays available while all of them have a retained value, so
+    dependant automations/helpers do not lose their reference; before that
+    it needs a successful refresh that returned *data_type*.
+    """
+    getters = tuple(attrgetter(field) for field in fields)
 
-        For HEV vehicles, charging data is never fetched (the coordinator only
-        fetches it for BEV/PHEV), so availability must not depend on it.
-        Mileage for HEV comes from basicVehicleStatus which is always present.
-        """
-        if self._last_valid_mileage is not None:
+    def available(coordinator):
+        retained = coordinator.retained
+        if all(get(retained) is not None for get in getters):
             return True
-        # No retained value yet — fall back to standard availability check
-        if self._vehicle_type == "ICE":
-            return (
-                self.coordinator.last_update_success
-                and self.coordinator.data.get("status") is not None
-            )
-        elif self._vehicle_type == "HEV":
-            # HEV mileage comes from status only — charging data is not fetched
-            # for HEV vehicles so must not be required here.
-            return (
-                self.coordinator.last_update_success
-                and self.coordinator.data.get("status") is not None
-            )
-        elif self._vehicle_type in ["PHEV", "BEV"]:
-            return (
-                self.coordinator.last_update_success
-                and self.coordinator.data.get("status") is not None
-                and self.coordinator.data.get("charging") is not None
-            )
-        else:
-            return False
-
-    @property
-    def native_value(self):
-        # First, try to get mileage from VehicleStatusResp
-        data = self.coordinator.data.get("status")
-        mileage = None
-        if data:
-            status_data = getattr(data, self._status_type, None)
-            if status_data:
-                mileage = getattr(status_data, self._field, None)
-                # Reject zero, None, and any negative value (includes -128 sentinel).
-                # Mileage is always a positive, monotonically increasing odometer
-                # reading — any value <= 0 is invalid API data.
-                if mileage is None or mileage <= 0:
-                    mileage = None
-                else:
-                    mileage = mileage * self._factor
-
-        # If mileage is None or invalid, try to get from ChrgMgmtDataResp
-        if mileage is None:
-            charging_data = self.coordinator.data.get("charging")
-            if charging_data:
-                charging_status_data = getattr(
-                    charging_data, self._charging_status_type, None
-                )
-                if charging_status_data:
-                    mileage = getattr(charging_status_data, self._field, None)
-                    if mileage is None or mileage <= 0:
-                        mileage = None
-                    else:
-                        mileage = mileage * self._factor
-
-        if mileage is not None:
-            # Only update retained value if the new reading is >= the last known
-            # value — prevents a bad API response from moving mileage backwards.
-            if (
-                self._last_valid_mileage is None
-                or mileage >= self._last_valid_mileage
-            ):
-                self._last_valid_mileage = mileage
-            return self._last_valid_mileage
-
-        # API gave nothing valid — return last known value to hold steady
-        if self._last_valid_mileage is not None:
-            LOGGER.debug(
-                "Mileage sensor %s: API returned no valid data, "
-                "retaining last known value %.1f",
-                self._name,
-                self._last_valid_mileage,
-            )
-            return self._last_valid_mileage
-
-        return None
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
+        return coordinator.last_update_success and coordinator.data.has_data(
+            data_type
+        )
 
+    return available
 
-class SAICMGVehicleSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a MG SAIC vehicle sensor."""
 
-    # Fields where 0 is a legitimate value and must NOT be treated as invalid.
-    # These are either enums (powerMode=0 means "Off") or percentage-like values
-    # where zero is a real reading.
-    _ZERO_VALID_FIELDS = {"powerMode", "fuelLevelPrc", "lastKeySeen"}
+def _charging(field, mapping=None):
+    """Return a value_fn for a charging field of the retained snapshot."""
+    get = attrgetter(field)
+    zero_when_idle = field in NOT_CHARGING_ZERO_FIELDS
 
-    # Fields that produce mapped string values — retain the last mapped string
-    # rather than a numeric value.
-    _MAPPED_FIELDS = {"powerMode"}
+    def value_fn(coordinator):
+        snapshot = coordinator.retained
+        if not snapshot.has_charging:
+            return None
+        if zero_when_idle and snapshot.bmsChrgSts in INACTIVE_CHARGING_STATUSES:
+            return 0
+        value = get(snapshot)
+        return value if mapping is None else _mapped(value, mapping)
 
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        status_type,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor,
-        data_type,
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._status_type = status_type
-        self._factor = factor
-        self._data_type = data_type
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Per-field retention for temperature fields (keyed by field name so a
-        # single class instance cannot cross-contaminate different sensors).
-        self._last_valid_temperature: dict[str, float] = {}
-
-        # Generic last-known-good value for all other retainable numeric fields.
-        # Mapped/string fields use _last_valid_mapped instead.
-        self._last_valid_value: float | None = None
-        self._last_valid_mapped: str | None = None
+    return value_fn
 
-    @property
-    def unique_id(self):
-        return self._unique_id
 
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
+def _coordinator_attribute(attribute):
+    """Return a value_fn reading *attribute* of the coordinator itself."""
+    return lambda coordinator: getattr(coordinator, attribute, None)
 
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        # If we have any retained value, keep the sensor available so dependant
-        # automations/helpers do not lose their reference.
-        if self._field in ["interiorTemperature", "exteriorTemperature"]:
-            if self._last_valid_temperature.get(self._field) is not None:
-                return True
-        elif self._field in self._MAPPED_FIELDS:
-            if self._last_valid_mapped is not None:
-                return True
-        else:
-            if self._last_valid_value is not None:
-                return True
-
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
 
-    @property
-    def native_value(self):
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            if self._data_type == "status":
-                status_data = getattr(data, self._status_type, None)
-                if status_data:
-                    raw_value = getattr(status_data, self._field, None)
-                    if raw_value is not None:
-                        # -128 is the SAIC sentinel for "no valid data".
-                        if raw_value == -128:
-                            if self._field in [
-                                "interiorTemperature",
-                                "exteriorTemperature",
-                            ]:
-                                LOGGER.debug(
-                                    "Sensor %s has invalid temperature value -128, "
-                                    "retaining last valid value",
-                                    self._name,
-                                )
-                                return self._last_valid_temperature.get(self._field)
-                            else:
-                                # Return last known numeric value if we have one,
-                                # otherwise None — either way avoids -12.8 etc.
-                                if self._last_valid_value is not None:
-                                    LOGGER.debug(
-                                        "Sensor %s: sentinel -128 received, "
-                                        "retaining last known value %.2f",
-                                        self._name,
-                                        self._last_valid_value,
-                                    )
-                                    return self._last_valid_value
-                                return None
-
-                        # --- Temperature fields ---
-                        if self._field in [
-                            "interiorTemperature", "exteriorTemperature"
-                        ]:
-                            computed = raw_value * self._factor
-                            self._last_valid_temperature[self._field] = computed
-                            return computed
-
-                        # --- Mapped / enum fields ---
-                        if self._field == "powerMode":
-                            mapped = {
-                                0: "Off",
-                                1: "Accessory",
-                                2: "On",
-                                3: "Start",
-                            }.get(raw_value, f"Unknown ({raw_value})")
-                            self._last_valid_mapped = mapped
-                            return mapped
-
-                        # --- Numeric fields ---
-                        # Treat 0 as invalid for fields where it cannot occur
-                        # in practice (e.g. tyre pressures, battery voltage,
-                        # fuel range). Fields listed in _ZERO_VALID_FIELDS skip
-                        # this guard.
-                        if raw_value == 0 and self._field not in self._ZERO_VALID_FIELDS:
-                            if self._last_valid_value is not None:
-                                LOGGER.debug(
-                                    "Sensor %s: zero value received (likely invalid), "
-                                    "retaining last known value %.2f",
-                                    self._name,
-                                    self._last_valid_value,
-                                )
-                                return self._last_valid_value
-                            return None
-
-                        computed = raw_value * self._factor
-                        self._last_valid_value = computed
-                        return computed
-
-            elif self._data_type == "charging":
-                charging_data = getattr(data, self._status_type, None)
-                if charging_data:
-                    raw_value = getattr(charging_data, self._field, None)
-                    if raw_value is not None:
-                        if raw_value == -128:
-                            if self._last_valid_value is not None:
-                                return self._last_valid_value
-                            return None
-                        computed = raw_value * self._factor
-                        self._last_valid_value = computed
-                        return computed
-
-            elif self._data_type == "info":
-                vin_info = data[0]
-                raw_value = getattr(vin_info, self._field, None)
-                if raw_value is not None:
-                    return raw_value
-
-        # Fall through — return whatever we last retained
-        if self._field in ["interiorTemperature", "exteriorTemperature"]:
-            retained = self._last_valid_temperature.get(self._field)
-            if retained is not None:
-                LOGGER.debug(
-                    "Sensor %s: no data from API, retaining last temperature %.1f",
-                    self._name,
-                    retained,
-                )
-            return retained
-        if self._field in self._MAPPED_FIELDS:
-            return self._last_valid_mapped
-        if self._last_valid_value is not None:
-            LOGGER.debug(
-                "Sensor %s: no data from API, retaining last value %.2f",
-                self._name,
-                self._last_valid_value,
-            )
-            return self._last_valid_value
-        return None
+def _refreshed_and_set(value_fn):
+    """Return an available_fn: last refresh succeeded and *value_fn* is set.
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGVehicleDetailSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a sensor for MG SAIC vehicle details.
-
-    NOTE: No value retention applied — Brand, Model, Model Year are static
-    metadata fields that are either present or not.  Retaining a stale name
-    would never cause problems in practice, but it also adds no real benefit.
+    Used for sensors without value retention — a stale "last update" or
+    "last powered on" timestamp would be actively misleading.
     """
+    return lambda coordinator: (
+        coordinator.last_update_success and value_fn(coordinator) is not None
+    )
 
-    def __init__(self, coordinator, entry, name, field, data_type):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}"
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+def _vehicle_types(*types):
+    return lambda coordinator: coordinator.vehicle_type in types
 
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
 
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
+_charging_vehicle = _vehicle_types("BEV", "PHEV")
 
-    @property
-    def native_value(self):
-        data = self.coordinator.data.get(self._data_type)
-        if data:
-            vin_info = data[0]
-            raw_value = getattr(vin_info, self._field, None)
-            if raw_value is not None:
-                # Apply profile override for fields known to be wrong in the API.
-                # Currently only modelYear is overridden (e.g. MGS6 reports 2024
-                # but launched in 2025 — there is no 2024 model year variant).
-                if self._field == "modelYear":
-                    override = getattr(self.coordinator, "model_year_override", None)
-                    if override is not None:
-                        return override
-                return raw_value
-        return None
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
+def _status_sensor(name, field, device_class=None, unit=None, icon=None, **kwargs):
+    """Describe a vehicle status sensor keyed by its API *field*."""
+    kwargs.setdefault("key", field)
+    kwargs.setdefault("state_class", "measurement" if unit else None)
+    kwargs.setdefault("context", fields_context(field, data_type="status"))
+    return SAICMGSensorEntityDescription(
+        name=name,
+        device_class=device_class,
+        native_unit_of_measurement=unit,
+        icon=icon,
+        value_fn=_retained(field, kwargs.pop("mapping", None)),
+        available_fn=_retained_available(field, data_type="status"),
+        **kwargs,
+    )
 
 
-# STATUS SENSORS
-class SAICMGVINSensor(CoordinatorEntity, SensorEntity):
-    """Sensor exposing the vehicle VIN.
-
-    State: masked VIN — first 2 characters visible, middle 10 replaced with
-    asterisks, last 5 visible. e.g. ``LS**********46986``.
-    This keeps the manufacturer/region prefix and the unique suffix visible
+def _tyre_pressure(position, field):
+    return _status_sensor(
+        f"Tyre Pressure {position}",
+        field,
+        SensorDeviceClass.PRESSURE,
+        UnitOfPressure.BAR,
+        "mdi:car-tire-alert",
+        deadband="deadband_tyre_pressure",
+    )
+
+
+def _charging_sensor(name, field, device_class=None, unit=None, icon=None, **kwargs):
+    """Describe a charging sensor; its unique ID ends in ``_charge``."""
+    kwargs.setdefault("state_class", "measurement" if unit else None)
+    kwargs.setdefault("exists_fn", _charging_vehicle)
+    if "value_fn" not in kwargs:
+        kwargs["value_fn"] = _charging(field, kwargs.pop("mapping", None))
+    return SAICMGSensorEntityDescription(
+        key=f"{field}_charge",
+        name=name,
+        device_class=device_class,
+        native_unit_of_measurement=unit,
+        icon=icon,
+        available_fn=_retained_available(field, data_type="charging"),
+        context=fields_context(field, "bmsChrgSts", data_type="charging"),
+        **kwargs,
+    )
+
+
+def _model_year(coordinator):
+    # Profile override for a model year known to be wrong in the API (e.g.
+    # MGS6 reports 2024 but launched in 2025 — there is no 2024 variant).
+    model_year = getattr(coordinator.vin_info, "modelYear", None)
+    override = getattr(coordinator, "model_year_override", None)
+    if model_year is not None and override is not None:
+        return override
+    return model_year
+
+
+def _vehicle_detail(name, field, value_fn=None):
+    """Describe a vehicle info sensor (brand, model …) without retention."""
+    return SAICMGSensorEntityDescription(
+        key=field,
+        name=name,
+        value_fn=value_fn
+        or (lambda coordinator: getattr(coordinator.vin_info, field, None)),
+        available_fn=lambda coordinator: (
+            coordinator.last_update_success and coordinator.vin_info is not None
+        ),
+        context=frozenset(),
+    )
+
+
+def _timestamp(name, key, icon, attribute, **kwargs):
+    """Describe a timestamp sensor read from a coordinator attribute."""
+    value_fn = _coordinator_attribute(attribute)
+    return SAICMGSensorEntityDescription(
+        key=key,
+        name=name,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon=icon,
+        value_fn=value_fn,
+        available_fn=_refreshed_and_set(value_fn),
+        **kwargs,
+    )
+
+
+def _masked_vin(coordinator) -> str:
+    """Return the VIN with the middle masked, e.g. ``LS**********46986``.
+
+    That keeps the manufacturer/region prefix and the unique suffix visible
     (enough to identify a specific car) without exposing the full VIN in
     dashboard screenshots, logs, or voice assistants.
-
-    Extra state attribute ``vin_full``: the complete unmasked VIN for use
-    in automations and HA services that require it as a parameter.
     """
-
-    _attr_icon = "mdi:card-account-details"
-
-    def __init__(self, coordinator, entry):
-        """Initialise the VIN sensor."""
-        super().__init__(coordinator)
-        vin_info = coordinator.vin_info
-        self._vin = vin_info.vin
-        self._attr_unique_id = f"{entry.entry_id}_{vin_info.vin}_vin"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-    @property
-    def name(self):
-        """Return the sensor name."""
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} VIN"
-
-    @property
-    def native_value(self) -> str:
-        """Return masked VIN as the sensor state.
-
-        Format: first 2 chars + 10 asterisks + last 5 chars = 17 chars.
-        Falls back to full VIN if the VIN is shorter than 17 characters
-        (should never happen in practice but handled gracefully).
-        """
-        vin = self._vin
-        if len(vin) == 17:
-            return f"{vin[:2]}{'*' * 10}{vin[-5:]}"
-        # Non-standard length — mask everything except last 4
-        if len(vin) > 4:
-            return f"{'*' * (len(vin) - 4)}{vin[-4:]}"
-        return vin
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Expose the full unmasked VIN as an attribute.
-
-        Use ``{{ state_attr('sensor.<name>_vin', 'vin_full') }}`` in
-        automations and scripts that need to pass the VIN to HA services.
-        """
-        return {"vin_full": self._vin}
-
-    @property
-    def available(self) -> bool:
-        """Always available — VIN is static metadata set at startup."""
+    vin = coordinator.vin_info.vin
+    if len(vin) == 17:
+        return f"{vin[:2]}{'*' * 10}{vin[-5:]}"
+    # Non-standard length — mask everything except last 4
+    if len(vin) > 4:
+        return f"{'*' * (len(vin) - 4)}{vin[-4:]}"
+    return vin
+
+
+def _mileage_available(coordinator):
+    # HEV charging data is never fetched (the coordinator only fetches it for
+    # BEV/PHEV), so only BEV/PHEV require it before a mileage is retained.
+    if coordinator.retained.mileage is not None:
         return True
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-# STATUS SENSORS
-class SAICMGHeatedSeatLevelSensor(CoordinatorEntity, SensorEntity):
-    """Sensor to monitor the current heating level of a heated seat.
-
-    Retention note: 0 maps to "Off" which IS a valid/expected state, so we
-    retain the last mapped string value (including "Off") rather than treating
-    0 as a sentinel.  The sensor only falls back to the retained value when the
-    API returns None or raises an exception.
-    """
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor=None,
-        data_source="basicVehicleStatus",
-        data_type="status",
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._factor = factor
-        self._data_source = data_source
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}_seat_heat_level"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last mapped string value.  "Off" (raw=0) is a legitimate
-        # reading so we always update the retained value when raw is not None.
-        self._last_valid_level: str | None = None
-
-    @property
-    def unique_id(self):
-        """Return the unique ID of the sensor."""
-        return self._unique_id
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_level is not None:
-            return True
-        data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and data is not None
-
-    @property
-    def native_value(self):
-        """Return the mapped heating level value."""
-        try:
-            data = self.coordinator.data.get(self._data_type)
-            if data:
-                vehicle_status = getattr(data, self._data_source, None)
-                if vehicle_status:
-                    raw_value = getattr(vehicle_status, self._field, None)
-                    if raw_value is not None:
-                        mapped = {0: "Off", 1: "Low", 2: "Medium", 3: "High"}.get(
-                            raw_value, f"Unknown ({raw_value})"
-                        )
-                        self._last_valid_level = mapped
-                        return mapped
-        except Exception as e:
-            LOGGER.error("Error retrieving heated seat level for %s: %s", self._name, e)
-
-        # Return last retained value (including "Off") when API gives nothing
-        if self._last_valid_level is not None:
+    data = coordinator.data
+    if coordinator.vehicle_type in ("ICE", "HEV"):
+        return coordinator.last_update_success and data.has_status
+    if coordinator.vehicle_type in ("PHEV", "BEV"):
+        return (
+            coordinator.last_update_success and data.has_status and data.has_charging
+        )
+    return False
+
+
+def _electric_range(coordinator, snapshot):
+    """Return the electric range from *snapshot*, or None."""
+    # For models where the API's fuelRangeElec field is known to be unreliable
+    # (profile flag reliable_fuel_range_elec=False), skip the normal live-range
+    # fields entirely and use imcuVehElecRng from chrgMgmtData instead.
+    # This is the case for the MG HS PHEV (AS33P):
+    #   fuelRangeElec = -128 (sentinel, always)
+    #   bmsEstdElecRng = 120 km (fixed full-charge estimate — NOT live)
+    #   imcuVehElecRng = 111 km (live, tracks SOC — this is what we want)
+    # bmsEstdElecRng is correctly used by the "Estimated Range After Charging"
+    # sensor, so we must not also use it here or both sensors read the same
+    # fixed value regardless of current SOC.
+    if getattr(coordinator, "reliable_fuel_range_elec", True):
+        # Standard path: fuelRangeElec, which the snapshot takes from
+        # RvsChargeStatus first and then from basicVehicleStatus.
+        electric_range = snapshot.fuelRangeElec
+
+        # Last resort for reliable models: bmsEstdElecRng as a secondary source
+        if electric_range is None and snapshot.bmsEstdElecRng not in (None, 0):
+            electric_range = float(snapshot.bmsEstdElecRng)
             LOGGER.debug(
-                "Heated seat sensor %s: no data from API, retaining '%s'",
-                self._name,
-                self._last_valid_level,
+                "Electric range: bmsEstdElecRng fallback = %s km", electric_range
             )
-            return self._last_valid_level
-        return None
+        return electric_range
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGSteeringWheelHeatSensor(CoordinatorEntity, SensorEntity):
-    """Sensor to monitor the current state of the steering wheel heater.
-
-    The iSmart app exposes steering wheel heat as a simple On/Off toggle.
-    The API field steeringHeatLevel reflects the current state:
-      0 = Off
-      1 = On
-    steeringWheelHeatFailureReason carries a fault code (0 = no fault).
-
-    Retention: "Off" (raw=0) is a valid state — retained just like the
-    heated seat sensor so the entity does not go Unknown on a bad poll.
-
-    Control (switch) is NOT yet implemented — the RvcParamsId for steering
-    wheel heat is not defined in saic-python-client-ng 0.9.3.  The param ID
-    needs to be confirmed via mitmproxy capture of the iSmart app before a
-    switch entity can be safely added.  See GitHub issue tracker for progress.
-    """
+    # Unreliable-fuelRangeElec path (e.g. AS33P / MG HS PHEV): imcuVehElecRng,
+    # the live vehicle electric range that tracks SOC.
+    if snapshot.imcuVehElecRng not in (None, 0):
+        electric_range = float(snapshot.imcuVehElecRng)
+        LOGGER.debug(
+            "Electric range: using imcuVehElecRng (live SOC-tracking) = %s km",
+            electric_range,
+        )
+        return electric_range
+    return None
 
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        data_source="basicVehicleStatus",
-        data_type="status",
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._data_source = data_source
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_steering_wheel_heat"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last mapped string value — "Off" (raw=0) is a legitimate
-        # reading and is stored just like the heated seat sensor.
-        self._last_valid_state: str | None = None
 
-    @property
-    def unique_id(self):
-        """Return the unique ID of the sensor."""
-        return self._unique_id
+def _electric_range_value(coordinator):
+    # Prefer this refresh; fall back to the range derived from the retained
+    # (last valid) values when it gave no valid range.
+    electric_range = _electric_range(coordinator, coordinator.data)
+    if electric_range is None:
+        electric_range = _electric_range(coordinator, coordinator.retained)
+    return electric_range
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
 
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_state is not None:
-            return True
-        data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and data is not None
+def _electric_range_available(coordinator):
+    if _electric_range(coordinator, coordinator.retained) is not None:
+        return True
+    return coordinator.last_update_success and (
+        coordinator.data.has_charging or coordinator.data.has_status
+    )
 
-    @property
-    def native_value(self):
-        """Return the current steering wheel heat state."""
-        try:
-            data = self.coordinator.data.get(self._data_type)
-            if data:
-                vehicle_status = getattr(data, self._data_source, None)
-                if vehicle_status:
-                    raw_value = getattr(vehicle_status, self._field, None)
-                    if raw_value is not None:
-                        mapped = {0: "Off", 1: "On"}.get(
-                            raw_value, f"Unknown ({raw_value})"
-                        )
-                        self._last_valid_state = mapped
-                        return mapped
-        except Exception as e:
-            LOGGER.error(
-                "Error retrieving steering wheel heat state for %s: %s",
-                self._name,
-                e,
-            )
 
-        # Return last retained value when API gives nothing
-        if self._last_valid_state is not None:
-            LOGGER.debug(
-                "Steering wheel heat sensor %s: no data from API, retaining '%s'",
-                self._name,
-                self._last_valid_state,
-            )
-            return self._last_valid_state
+def _charging_current(coordinator):
+    snapshot = coordinator.retained
+    if not snapshot.has_charging:
         return None
-
-    @property
-    def extra_state_attributes(self):
-        """Expose the failure reason code as an extra attribute."""
-        try:
-            data = self.coordinator.data.get(self._data_type)
-            if data:
-                vehicle_status = getattr(data, self._data_source, None)
-                if vehicle_status:
-                    failure_reason = getattr(
-                        vehicle_status, "steeringWheelHeatFailureReason", None
-                    )
-                    if failure_reason is not None:
-                        return {"failure_reason": failure_reason}
-        except Exception:
-            pass
-        return {}
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGElectricRangeSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for Electric Range, uses data from both RvsChargeStatus and VehicleStatusResp."""
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        status_type,
-        charging_status_type,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor,
-        data_type,
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._status_type = status_type
-        self._charging_status_type = charging_status_type
-        self._factor = factor
-        self._data_type = data_type
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last valid range so the sensor does not drop to Unknown when
-        # the API is temporarily unavailable. A range of 0 from the API is
-        # treated as invalid (the car is not actually dead) and ignored.
-        self._last_valid_range: float | None = None
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_range is not None:
-            return True
-        return self.coordinator.last_update_success and (
-            self.coordinator.data.get("charging") is not None
-            or self.coordinator.data.get("status") is not None
-        )
-
-    @property
-    def native_value(self):
-        """Return the electric range value, prioritizing charging data."""
-        electric_range = None
-
-        # For models where the API's fuelRangeElec field is known to be unreliable
-        # (profile flag reliable_fuel_range_elec=False), skip the normal live-range
-        # fields entirely and use imcuVehElecRng from chrgMgmtData instead.
-        # This is the case for the MG HS PHEV (AS33P):
-        #   fuelRangeElec = -128 (sentinel, always)
-        #   bmsEstdElecRng = 120 km (fixed full-charge estimate — NOT live)
-        #   imcuVehElecRng = 111 km (live, tracks SOC — this is what we want)
-        # bmsEstdElecRng is correctly used by the "Estimated Range After Charging"
-        # sensor, so we must not also use it here or both sensors read the same
-        # fixed value regardless of current SOC.
-        reliable_fuel_range = getattr(
-            self.coordinator, "reliable_fuel_range_elec", True
-        )
-
-        if reliable_fuel_range:
-            # Standard path: try fuelRangeElec from RvsChargeStatus first
-            charging_data = self.coordinator.data.get("charging")
-            if charging_data:
-                charging_status_data = getattr(
-                    charging_data, self._charging_status_type, None
-                )
-                if charging_status_data:
-                    raw_value = getattr(charging_status_data, self._field, None)
-                    if raw_value not in (None, 0, -128):
-                        electric_range = raw_value * self._factor
-
-            # Then try fuelRangeElec from basicVehicleStatus
-            if electric_range is None:
-                status_data = self.coordinator.data.get("status")
-                if status_data:
-                    basic_status_data = getattr(status_data, self._status_type, None)
-                    if basic_status_data:
-                        raw_value = getattr(basic_status_data, self._field, None)
-                        if raw_value not in (None, 0, -128):
-                            electric_range = raw_value * self._factor
-
-            # Last resort for reliable models: bmsEstdElecRng as a secondary source
-            if electric_range is None:
-                charging_data = self.coordinator.data.get("charging")
-                if charging_data:
-                    chrg_mgmt = getattr(charging_data, "chrgMgmtData", None)
-                    if chrg_mgmt:
-                        raw_estd = getattr(chrg_mgmt, "bmsEstdElecRng", None)
-                        if raw_estd not in (None, 0, -128):
-                            electric_range = float(raw_estd)
-                            LOGGER.debug(
-                                "Electric range sensor %s: bmsEstdElecRng fallback "
-                                "= %s km",
-                                self._name,
-                                electric_range,
-                            )
-        else:
-            # Unreliable-fuelRangeElec path (e.g. AS33P / MG HS PHEV):
-            # Use imcuVehElecRng — the live vehicle electric range that tracks SOC.
-            # Do NOT use bmsEstdElecRng here; that is the fixed full-charge estimate
-            # and is already shown by the "Estimated Range After Charging" sensor.
-            charging_data = self.coordinator.data.get("charging")
-            if charging_data:
-                chrg_mgmt = getattr(charging_data, "chrgMgmtData", None)
-                if chrg_mgmt:
-                    raw_live = getattr(chrg_mgmt, "imcuVehElecRng", None)
-                    if raw_live not in (None, 0, -128):
-                        electric_range = float(raw_live)
-                        LOGGER.debug(
-                            "Electric range sensor %s: using imcuVehElecRng "
-                            "(live SOC-tracking) = %s km",
-                            self._name,
-                            electric_range,
-                        )
-
-        if electric_range is not None:
-            self._last_valid_range = electric_range
-            return electric_range
-
-        # API gave nothing valid — return last known value to hold steady
-        if self._last_valid_range is not None:
-            LOGGER.debug(
-                "Electric range sensor %s: API returned no valid data, "
-                "retaining last known value %.1f",
-                self._name,
-                self._last_valid_range,
-            )
-            return self._last_valid_range
-
+    charging_status = snapshot.bmsChrgSts
+    if charging_status in INACTIVE_CHARGING_STATUSES:
+        return 0
+    # Decoded pack current: positive while charging, negative while
+    # discharging/V2X.
+    current = snapshot.bmsPackCrnt
+    if current is None:
         return None
+    current = round(current, 2)
+    if current < 0 and charging_status in CLAMP_NEGATIVE_STATUSES:
+        return 0.0
+    return current
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGInstantPowerSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for Instant Power when the vehicle is powered on and driving.
 
-    Retention note: 0 kW IS a valid reading (vehicle on but not accelerating /
-    regenerating).  Retention is therefore only applied when the API returns
-    None or raises — not when it returns 0.  When the vehicle is not in power
-    modes 2 or 3 the sensor intentionally returns 0; that explicit 0 is also
-    NOT retained (it would override the last real driving value unhelpfully).
-    """
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        data_source="chrgMgmtData",
-        data_type="charging",
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._device_class = device_class
-        self._unit = unit
-        self._state_class = state_class
-        self._icon = icon
-        self._data_source = data_source
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_instant_power"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last computed power value.  Updated only when a real
-        # calculation succeeds; the "not driving → 0" path does not update it.
-        self._last_valid_power: float | None = None
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_power is not None:
-            return True
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        try:
-            charging_data = getattr(
-                self.coordinator.data.get("charging"), self._data_source, None
-            )
-            if charging_data:
-                # Determine whether there is real power flow to report.
-                # Two active cases:
-                #   1. Vehicle is driving (powerMode 2=On, 3=Start) — traction power
-                #   2. V2X discharging (bmsChrgSts 13) — export power, even though
-                #      powerMode will be 0 (Off) during a stationary V2X session.
-                status_data = self.coordinator.data.get("status")
-                power_mode = getattr(
-                    getattr(status_data, "basicVehicleStatus", None),
-                    "powerMode",
-                    None,
-                )
-                bms_chrg_sts = getattr(charging_data, "bmsChrgSts", None)
-                is_driving = power_mode in [2, 3]
-                is_v2x = bms_chrg_sts == 13
-
-                if is_driving or is_v2x:
-                    # Get raw current and voltage
-                    raw_current = getattr(charging_data, "bmsPackCrnt", None)
-                    raw_voltage = getattr(charging_data, "bmsPackVol", None)
-
-                    if raw_current is not None and raw_voltage is not None:
-                        # SAIC encoding: raw < 20000 => charging (positive current),
-                        # raw > 20000 => discharging/traction (negative current).
-                        # Formula 1000 - (raw * factor) naturally gives:
-                        #   charging:   positive kW  ✓
-                        #   traction/V2X export: negative kW  ✓
-                        # Note: values very close to 20000 (e.g. 20033 while coasting)
-                        # are real small discharge readings — do not filter them out.
-                        decoded_current = 1000 - (raw_current * CHARGING_CURRENT_FACTOR)
-                        decoded_voltage = raw_voltage * CHARGING_VOLTAGE_FACTOR
-
-                        # Power in kW — negative value indicates traction/V2X export.
-                        power = round(decoded_current * decoded_voltage / 1000.0, 2)
-
-                        # Update retention (0 kW is a valid reading)
-                        self._last_valid_power = power
-                        return power
-                    else:
-                        LOGGER.warning(
-                            "Instant Power: Current or Voltage not available in charging data."
-                        )
-                        # Fall through to retention below
-                else:
-                    # No active power flow — report 0 explicitly but do NOT
-                    # update the retained value.
-                    return 0
-            else:
-                LOGGER.error("No charging data available for %s", self._name)
-
-        except Exception as e:
-            LOGGER.error(
-                "Error retrieving instant power for sensor %s: %s", self._name, e
-            )
-
-        # API gave nothing usable — hold the last real power reading
-        if self._last_valid_power is not None:
-            LOGGER.debug(
-                "Instant power sensor %s: no data from API, "
-                "retaining last known value %.2f kW",
-                self._name,
-                self._last_valid_power,
-            )
-            return self._last_valid_power
+def _charging_power(coordinator):
+    snapshot = coordinator.retained
+    if not snapshot.has_charging:
         return None
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGSOCSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for State of Charge."""
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field_basic,
-        field_charging,
-        status_type,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        data_type,
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field_basic = field_basic
-        self._field_charging = field_charging
-        self._status_type = status_type
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field_basic}_soc"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last valid SOC so the sensor does not drop to Unknown when the
-        # API is temporarily unavailable. SOC of 0 from the basic status field
-        # is treated as invalid and ignored (same as -1 sentinel).
-        self._last_valid_soc: float | None = None
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_soc is not None:
-            return True
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
-
-    @property
-    def native_value(self):
-        # First, try to get SOC from charging data (bmsPackSOCDsp)
-        charging = self.coordinator.data.get("charging")
-        soc = None
-        if charging:
-            charging_data = getattr(charging, "chrgMgmtData", None)
-            if charging_data:
-                soc = getattr(charging_data, self._field_charging, None)
-                if soc is not None:
-                    # -128 is the SAIC sentinel for "no valid data" — reject it
-                    # before applying the decimal factor (which would produce -12.8)
-                    if soc == -128:
-                        soc = None
-                    else:
-                        soc = soc * DATA_DECIMAL_CORRECTION_SOC
-
-        # If SOC is None or invalid, try to get from basic vehicle status
-        if soc is None:
-            status = self.coordinator.data.get("status")
-            if status:
-                status_data = getattr(status, self._status_type, None)
-                if status_data:
-                    soc = getattr(status_data, self._field_basic, None)
-                    if soc in (-128, -1, 0):
-                        soc = None
-
-        if soc is not None:
-            self._last_valid_soc = soc
-            return soc
-
-        # API gave nothing valid — return last known value to hold steady
-        if self._last_valid_soc is not None:
-            LOGGER.debug(
-                "SOC sensor %s: API returned no valid data, "
-                "retaining last known value %.1f",
-                self._name,
-                self._last_valid_soc,
-            )
-            return self._last_valid_soc
-
+    charging_status = snapshot.bmsChrgSts
+    if charging_status in INACTIVE_CHARGING_STATUSES:
+        return 0
+    current = snapshot.bmsPackCrnt
+    voltage = snapshot.bmsPackVol
+    if current is None or voltage is None:
         return None
+    power = round(current * voltage / 1000.0, 2)
+    if power < 0 and charging_status in CLAMP_NEGATIVE_STATUSES:
+        return 0.0
+    return power
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-# CHARGING SENSORS
-class SAICMGChargingCurrentSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a MG SAIC charging current sensor.
-
-    Retention note: 0 A IS a legitimate value (not charging / plugged but idle).
-    The early-return path that explicitly sets 0 when bmsChrgSts is 0 or 5 does
-    NOT update the retained value.  Retention is only updated on a successful
-    current calculation, and is only returned as fallback when the API gives
-    nothing usable.
-    """
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor=None,
-        data_source="chrgMgmtData",
-        data_type="charging",
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._device_class = device_class
-        self._unit = unit
-        self._state_class = state_class
-        self._icon = icon
-        self._factor = factor
-        self._data_source = data_source
-        self._data_type = data_type
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}_charge"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last computed current.  Not updated by the "not charging → 0"
-        # explicit path so that the retained value reflects the last real session.
-        self._last_valid_current: float | None = None
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
 
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_current is not None:
-            return True
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        try:
-            charging_data = getattr(
-                self.coordinator.data.get("charging"), self._data_source, None
-            )
-            if charging_data:
-                charging_status = getattr(charging_data, "bmsChrgSts", None)
-
-                if charging_status in [0, 5]:
-                    # Explicitly inactive (unplugged or connecting) — return 0 without updating retention
-                    # Note: status 13 (V2X_DISCHARGING) is NOT suppressed here — real current flows.
-                    return 0
-
-                raw_value = getattr(charging_data, self._field, None)
-
-                # -128 sentinel — fall through to retention
-                if raw_value == -128:
-                    if self._last_valid_current is not None:
-                        LOGGER.debug(
-                            "Charging current sensor %s: sentinel -128, "
-                            "retaining %.2f A",
-                            self._name,
-                            self._last_valid_current,
-                        )
-                        return self._last_valid_current
-                    return None
-
-                if raw_value is not None and self._factor is not None:
-                    # SAIC encoding: raw < 20000 => charging (positive A),
-                    # raw > 20000 => discharging/V2X (negative A).
-                    # Formula 1000 - (raw * factor) gives the correct sign
-                    # for both cases without needing separate branch logic.
-                    calculated_value = round(1000 - (raw_value * self._factor), 2)
-
-                    # During active AC/DC charging or charge-finished state,
-                    # bmsPackCrnt oscillates around 20000 and can produce small
-                    # negative values (e.g. -1.90A at raw=20038). These are
-                    # measurement noise — clamp to 0 rather than show negative.
-                    # V2X discharge (status 13) is intentionally excluded so
-                    # genuine negative discharge current is preserved.
-                    if calculated_value < 0 and charging_status in {1, 2, 3, 9, 10, 12}:
-                        calculated_value = 0.0
-
-                    self._last_valid_current = calculated_value
-                    return calculated_value
-                else:
-                    return None
-            else:
-                LOGGER.error("No charging data available for %s", self._name)
-
-        except Exception as e:
-            LOGGER.error(
-                "Error retrieving charging current sensor %s: %s",
-                self._name,
-                e,
-                exc_info=True,
-            )
-
-        # API gave nothing usable — hold the last real reading
-        if self._last_valid_current is not None:
-            LOGGER.debug(
-                "Charging current sensor %s: no data from API, "
-                "retaining last known value %.2f A",
-                self._name,
-                self._last_valid_current,
-            )
-            return self._last_valid_current
+def _instant_power(coordinator):
+    snapshot = coordinator.retained
+    if not snapshot.has_charging:
         return None
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGChargingPowerSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for Charging Power, calculated from voltage and current.
-
-    Retention note: 0 kW IS legitimate (plugged but not actively charging).
-    Same retention strategy as SAICMGChargingCurrentSensor — the explicit
-    "not charging → 0" path does not update the retained value.
-    """
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        data_source="chrgMgmtData",
-        data_type="charging",
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._device_class = device_class
-        self._unit = unit
-        self._state_class = state_class
-        self._icon = icon
-        self._data_source = data_source
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_charging_power"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last computed charging power.  Not updated by the explicit
-        # "not charging → 0" path.
-        self._last_valid_power: float | None = None
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_power is not None:
-            return True
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        try:
-            charging_data = getattr(
-                self.coordinator.data.get("charging"), self._data_source, None
-            )
-            if charging_data:
-                charging_status = getattr(charging_data, "bmsChrgSts", None)
-
-                if charging_status in [0, 5]:
-                    # Explicitly inactive (unplugged or connecting) — return 0 without updating retention
-                    # Note: status 13 (V2X_DISCHARGING) is NOT suppressed — real power flows.
-                    return 0
-
-                raw_current = getattr(charging_data, "bmsPackCrnt", None)
-                raw_voltage = getattr(charging_data, "bmsPackVol", None)
-
-                # Reject -128 sentinel on either input
-                if raw_current == -128 or raw_voltage == -128:
-                    if self._last_valid_power is not None:
-                        LOGGER.debug(
-                            "Charging power sensor %s: sentinel -128 in input, "
-                            "retaining %.2f kW",
-                            self._name,
-                            self._last_valid_power,
-                        )
-                        return self._last_valid_power
-                    return None
-
-                if raw_current is not None and raw_voltage is not None:
-                    # SAIC encoding: raw < 20000 => charging (positive current/power),
-                    # raw > 20000 => discharging/V2X (negative current/power).
-                    # Formula 1000 - (raw * factor) gives the correct sign for both.
-                    decoded_current = 1000 - (raw_current * CHARGING_CURRENT_FACTOR)
-                    decoded_voltage = raw_voltage * CHARGING_VOLTAGE_FACTOR
-                    power = round(decoded_current * decoded_voltage / 1000.0, 2)
-
-                    # During active AC/DC charging or charge-finished state,
-                    # bmsPackCrnt oscillates around 20000 and can produce small
-                    # negative power values. Clamp to 0.
-                    # V2X discharge (status 13) excluded — negative power is correct.
-                    if power < 0 and charging_status in {1, 2, 3, 9, 10, 12}:
-                        power = 0.0
-
-                    self._last_valid_power = power
-                    return power
-                else:
-                    return None
-            else:
-                LOGGER.error("No charging data available for %s", self._name)
-
-        except Exception as e:
-            LOGGER.error("Error retrieving charging power sensor %s: %s", self._name, e)
-
-        # API gave nothing usable — hold the last real reading
-        if self._last_valid_power is not None:
-            LOGGER.debug(
-                "Charging power sensor %s: no data from API, "
-                "retaining last known value %.2f kW",
-                self._name,
-                self._last_valid_power,
-            )
-            return self._last_valid_power
+    # Two cases have real power flow to report:
+    #   1. Vehicle is driving (powerMode 2=On, 3=Start) — traction power
+    #   2. V2X discharging (bmsChrgSts 13) — export power, even though
+    #      powerMode will be 0 (Off) during a stationary V2X session.
+    # Otherwise 0 kW is reported explicitly — it IS a valid reading.
+    if snapshot.powerMode not in (2, 3) and snapshot.bmsChrgSts != 13:
+        return 0
+
+    # Values very close to zero (e.g. while coasting) are real small
+    # discharge readings — do not filter them out.
+    current = snapshot.bmsPackCrnt
+    voltage = snapshot.bmsPackVol
+    if current is None or voltage is None:
+        LOGGER.debug(
+            "Instant Power: Current or Voltage not available in charging data."
+        )
         return None
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
+    # Negative while driving / V2X export.
+    return round(current * voltage / 1000.0, 2)
 
 
-class SAICMGChargingSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a MG SAIC charging sensor.
-
-    Retention strategy per field:
+def _instant_power_available(coordinator):
+    if coordinator.retained.has_charging:
+        return True
+    return coordinator.last_update_success and coordinator.data.has_charging
 
-    Fields where 0 IS a legitimate value (returned explicitly when not charging):
-      bmsPackVol, bmsPackCrnt, lastChargeEndingPower, bmsChrgOtptCrntReq,
-      chargingDuration, chrgngRmnngTime, chrgngAddedElecRng
-      → The explicit "not charging → 0" return path does NOT update retention.
-        Retention only activates when the API gives nothing at all.
 
-    Mapped/enum fields (bmsOnBdChrgTrgtSOCDspCmd, bmsChrgSts, bmsPTCHeatResp):
-      → Retain last mapped string/int value; None from mapping is not retained.
+_retained_battery_capacity = _charging("totalBatteryCapacity")
 
-    Numeric fields (bmsEstdElecRng, mileageSinceLastCharge, powerUsageSinceLastCharge,
-      totalBatteryCapacity, etc.):
-      → Retain last numeric result; -128 sentinel rejected before factor applied.
 
-    totalBatteryCapacity uses coordinator.known_battery_capacity_kwh when set
-      (no retention needed — the coordinator value is always authoritative).
+def _total_battery_capacity(coordinator):
+    # The profile's known-good capacity is authoritative when set.
+    known_capacity = getattr(coordinator, "known_battery_capacity_kwh", None)
+    if known_capacity is not None:
+        return known_capacity
+    return _retained_battery_capacity(coordinator)
 
-    lastChargeEndingPower: if the coordinator has charging_capacity_correction set
-      (from VEHICLE_PROFILES), the corrected result is returned so models that
-      report inflated energy values (e.g. MG HS PHEV × 1/3) show correctly.
-    """
 
-    # Fields where charging_status in _INACTIVE_CHARGING_STATUSES → explicit 0 return.
-    # These fields must NOT treat that explicit 0 as a retained value.
-    # Status 13 (V2X_DISCHARGING) is intentionally excluded from _INACTIVE_CHARGING_STATUSES
-    # — during V2X discharge, voltage and current carry real non-zero readings.
-    _NOT_CHARGING_ZERO_FIELDS = {
-        "bmsPackVol",
-        "bmsPackCrnt",
-        "lastChargeEndingPower",
-        "bmsChrgOtptCrntReq",
+def _target_soc(coordinator):
+    # An unknown target SOC code reads as None rather than "Unknown".
+    snapshot = coordinator.retained
+    if not snapshot.has_charging:
+        return None
+    return TARGET_SOC_PERCENT.get(snapshot.bmsOnBdChrgTrgtSOCDspCmd)
+
+
+def _last_key_seen(coordinator):
+    # lastKeySeen looks like a key fob identifier / pairing code (e.g. 7859)
+    # rather than a time: it does not change between parked and driving, and
+    # is 0 when the model has no key-position tracking (KEYPOS=0) — shown
+    # as Unknown rather than a misleading zero.
+    raw = coordinator.retained.lastKeySeen
+    return None if raw == 0 else raw
+
+
+def _steering_wheel_heat_attributes(coordinator):
+    failure_reason = coordinator.data.steeringWheelHeatFailureReason
+    if failure_reason is not None:
+        return {"failure_reason": failure_reason}
+    return {}
+
+
+SENSORS: tuple[SAICMGSensorEntityDescription, ...] = (
+    # Basic vehicle sensors
+    _status_sensor(
+        "Ancillary Battery Voltage",
+        "batteryVoltage",
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+        "mdi:car-battery",
+        deadband="deadband_battery_voltage",
+    ),
+    _vehicle_detail("Brand", "brandName"),
+    _status_sensor(
+        "Exterior Temperature",
+        "exteriorTemperature",
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        deadband="deadband_temperature",
+    ),
+    _status_sensor(
+        "Interior Temperature",
+        "interiorTemperature",
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+        deadband="deadband_temperature",
+    ),
+    SAICMGSensorEntityDescription(
+        key="lastKeySeen",
+        name="Last Key Seen",
+        icon="mdi:key",
+        value_fn=_last_key_seen,
+        available_fn=_retained_available("lastKeySeen", data_type="status"),
+        context=fields_context("lastKeySeen", "has_status"),
+    ),
+    _timestamp(
+        "Last Powered On", "last_powered_on", "mdi:power-on", "last_powered_on_time"
+    ),
+    _timestamp(
+        "Last Powered Off",
+        "last_powered_off",
+        "mdi:power-off",
+        "last_powered_off_time",
+    ),
+    _timestamp(
+        "Last Update Time",
+        "last_update_time",
+        "mdi:update",
+        "last_update_time",
+        attributes_fn=lambda coordinator: {
+            # Data restored from the startup snapshot and not yet refreshed.
+            "stale": getattr(coordinator, "is_stale", False)
+        },
+    ),
+    _timestamp(
+        "Last Vehicle Activity",
+        "last_vehicle_activity",
+        "mdi:car-clock",
+        "last_vehicle_activity",
+    ),
+    SAICMGSensorEntityDescription(
+        key="mileage",
+        name="Mileage",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        icon="mdi:counter",
+        state_class="total_increasing",
+        # The snapshot prefers VehicleStatusResp and falls back to
+        # rvsChargeStatus, rejecting any value <= 0; the retained snapshot
+        # never lets this monotonic odometer move backwards.
+        value_fn=_retained("mileage"),
+        available_fn=_mileage_available,
+        context=fields_context("mileage", "has_status", "has_charging"),
+    ),
+    _timestamp(
+        "Next Update Time",
+        "next_update_time",
+        "mdi:update",
+        "next_update_time",
+        attributes_fn=lambda coordinator: {
+            # The pending refresh requests behind the next update.
+            "pending_refreshes": coordinator.pending_refreshes
+        },
+    ),
+    _vehicle_detail("Model", "modelName"),
+    _vehicle_detail("Model Year", "modelYear", _model_year),
+    SAICMGSensorEntityDescription(
+        key="vin",
+        name="VIN",
+        icon="mdi:card-account-details",
+        value_fn=_masked_vin,
+        # The full VIN, for automations and services that need it, e.g.
+        # {{ state_attr('sensor.<name>_vin', 'vin_full') }}.
+        attributes_fn=lambda coordinator: {"vin_full": coordinator.vin_info.vin},
+        context=frozenset(),
+    ),
+    _status_sensor(
+        "Power Mode", "powerMode", icon="mdi:power-settings", mapping=POWER_MODES
+    ),
+    SAICMGSensorEntityDescription(
+        key="speed",
+        name="Speed",
+        device_class=SensorDeviceClass.SPEED,
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        icon="mdi:speedometer",
+        state_class="measurement",
+        # No retention: a stale speed shown as "current speed" would be
+        # actively misleading (e.g. 80 km/h while parked).
+        value_fn=lambda coordinator: coordinator.data.speed,
+        available_fn=lambda coordinator: (
+            coordinator.last_update_success and coordinator.data.has_status
+        ),
+        context=fields_context("speed", data_type="status"),
+    ),
+    _tyre_pressure("Front Left", "frontLeftTyrePressure"),
+    _tyre_pressure("Front Right", "frontRightTyrePressure"),
+    _tyre_pressure("Rear Left", "rearLeftTyrePressure"),
+    _tyre_pressure("Rear Right", "rearRightTyrePressure"),
+    # PHEV, HEV, ICE sensors
+    _status_sensor(
+        "Fuel Level",
+        "fuelLevelPrc",
+        SensorDeviceClass.BATTERY,
+        PERCENTAGE,
+        "mdi:gas-station",
+        exists_fn=_vehicle_types("PHEV", "HEV", "ICE"),
+    ),
+    _status_sensor(
+        "Fuel Range",
+        "fuelRange",
+        SensorDeviceClass.DISTANCE,
+        UnitOfLength.KILOMETERS,
+        "mdi:gas-station",
+        exists_fn=_vehicle_types("PHEV", "HEV", "ICE"),
+    ),
+    # BEV, PHEV, HEV sensors
+    SAICMGSensorEntityDescription(
+        key="fuelRangeElec",
+        name="Electric Range",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        icon="mdi:car-electric",
+        state_class="measurement",
+        value_fn=_electric_range_value,
+        available_fn=_electric_range_available,
+        context=fields_context(
+            "fuelRangeElec",
+            "bmsEstdElecRng",
+            "imcuVehElecRng",
+            "has_status",
+            "has_charging",
+        ),
+        exists_fn=_vehicle_types("BEV", "PHEV", "HEV"),
+    ),
+    SAICMGSensorEntityDescription(
+        key="extendedData1_soc",
+        name="State of Charge",
+        device_class=SensorDeviceClass.BATTERY,
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:battery",
+        state_class="measurement",
+        # The snapshot takes SOC from the charging data (bmsPackSOCDsp) and
+        # falls back to basic vehicle status (extendedData1).
+        value_fn=_retained("soc"),
+        available_fn=_retained_available("soc", data_type="charging"),
+        context=fields_context("soc", data_type="charging"),
+        exists_fn=_vehicle_types("BEV", "PHEV", "HEV"),
+    ),
+    _charging_sensor(
+        "Total Battery Capacity",
+        "totalBatteryCapacity",
+        SensorDeviceClass.ENERGY,
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:battery-high",
+        state_class="total",
+        value_fn=_total_battery_capacity,
+        exists_fn=_vehicle_types("BEV", "PHEV", "HEV"),
+    ),
+    # BEV, PHEV sensors
+    _charging_sensor(
+        "Added Electric Range",
+        "chrgngAddedElecRng",
+        SensorDeviceClass.DISTANCE,
+        UnitOfLength.KILOMETERS,
+        "mdi:map-marker-distance",
+    ),
+    SAICMGSensorEntityDescription(
+        key="bmsPackCrnt_charge",
+        name="Charging Current",
+        device_class=SensorDeviceClass.CURRENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        icon="mdi:current-ac",
+        state_class="measurement",
+        value_fn=_charging_current,
+        available_fn=_retained_available("bmsPackCrnt", data_type="charging"),
+        context=fields_context("bmsChrgSts", "bmsPackCrnt", data_type="charging"),
+        exists_fn=_charging_vehicle,
+    ),
+    SAICMGSensorEntityDescription(
+        key="bmsAltngChrgCrntDspCmd_current_limit",
+        name="Charging Current Limit",
+        icon="mdi:current-ac",
+        value_fn=_retained("bmsAltngChrgCrntDspCmd", CHARGING_CURRENT_LIMITS),
+        available_fn=_retained_available(
+            "bmsAltngChrgCrntDspCmd", data_type="charging"
+        ),
+        context=fields_context("bmsAltngChrgCrntDspCmd", data_type="charging"),
+        exists_fn=lambda coordinator: (
+            _charging_vehicle(coordinator)
+            and coordinator.supports_charging_current_limit
+        ),
+    ),
+    _charging_sensor(
+        "Charging Duration",
         "chargingDuration",
+        SensorDeviceClass.DURATION,
+        UnitOfTime.MINUTES,
+        "mdi:timer-outline",
+    ),
+    SAICMGSensorEntityDescription(
+        key="charging_power",
+        name="Charging Power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        icon="mdi:flash",
+        state_class="measurement",
+        value_fn=_charging_power,
+        deadband="deadband_power",
+        available_fn=_retained_available(
+            "bmsPackCrnt", "bmsPackVol", data_type="charging"
+        ),
+        context=fields_context(
+            "bmsChrgSts", "bmsPackCrnt", "bmsPackVol", data_type="charging"
+        ),
+        exists_fn=_charging_vehicle,
+    ),
+    _charging_sensor(
+        "Charging Status",
+        "bmsChrgSts",
+        icon="mdi:battery-charging",
+        mapping=CHARGING_STATUSES,
+    ),
+    _charging_sensor(
+        "Charging Voltage",
+        "bmsPackVol",
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+        "mdi:flash",
+    ),
+    _charging_sensor(
+        "Estimated Range After Charging",
+        "bmsEstdElecRng",
+        SensorDeviceClass.DISTANCE,
+        UnitOfLength.KILOMETERS,
+        "mdi:map-marker-distance",
+    ),
+    SAICMGSensorEntityDescription(
+        key="instant_power",
+        name="Instant Power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        icon="mdi:lightning-bolt-circle",
+        state_class="measurement",
+        value_fn=_instant_power,
+        deadband="deadband_power",
+        available_fn=_instant_power_available,
+        context=fields_context(
+            "powerMode",
+            "bmsChrgSts",
+            "bmsPackCrnt",
+            "bmsPackVol",
+            data_type="charging",
+        ),
+        exists_fn=_charging_vehicle,
+    ),
+    _charging_sensor(
+        "Mileage Since Last Charge",
+        "mileageSinceLastCharge",
+        SensorDeviceClass.DISTANCE,
+        UnitOfLength.KILOMETERS,
+        "mdi:map-marker-distance",
+    ),
+    _charging_sensor(
+        "Power Usage Since Last Charge",
+        "powerUsageSinceLastCharge",
+        SensorDeviceClass.ENERGY,
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:flash",
+        state_class="total_increasing",
+    ),
+    _charging_sensor(
+        "Remaining Charging Time",
         "chrgngRmnngTime",
-        "chrgngAddedElecRng",
-    }
-    # Status codes where there is genuinely no charge/discharge activity and the
-    # _NOT_CHARGING_ZERO_FIELDS above should return 0 explicitly.
-    # V2X_DISCHARGING (13) is deliberately absent — it has live current/voltage data.
-    _INACTIVE_CHARGING_STATUSES = frozenset({0, 5})
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor=None,
-        data_source="chrgMgmtData",
-        data_type="charging",
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._device_class = device_class
-        self._unit = unit
-        self._state_class = state_class
-        self._icon = icon
-        self._factor = factor
-        self._data_source = data_source
-        self._data_type = data_type
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}_charge"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Generic last-known-good value.  Holds a float for numeric fields or a
-        # string for mapped fields.  None until a valid value has been seen.
-        self._last_valid_value: float | str | None = None
+        SensorDeviceClass.DURATION,
+        UnitOfTime.MINUTES,
+        "mdi:timer-sand",
+    ),
+    _charging_sensor(
+        "Target SOC",
+        "bmsOnBdChrgTrgtSOCDspCmd",
+        SensorDeviceClass.BATTERY,
+        PERCENTAGE,
+        "mdi:battery-charging-100",
+        value_fn=_target_soc,
+        exists_fn=lambda coordinator: (
+            _charging_vehicle(coordinator) and coordinator.supports_target_soc
+        ),
+    ),
+    # Optional equipment
+    _status_sensor(
+        "Front Left Heated Seat Level",
+        "frontLeftSeatHeatLevel",
+        icon="mdi:car-seat-heater",
+        mapping=HEATED_SEAT_LEVELS,
+        key="frontLeftSeatHeatLevel_seat_heat_level",
+        exists_fn=lambda coordinator: coordinator.has_heated_seats,
+    ),
+    _status_sensor(
+        "Front Right Heated Seat Level",
+        "frontRightSeatHeatLevel",
+        icon="mdi:car-seat-heater",
+        mapping=HEATED_SEAT_LEVELS,
+        key="frontRightSeatHeatLevel_seat_heat_level",
+        exists_fn=lambda coordinator: coordinator.has_heated_seats,
+    ),
+    _charging_sensor(
+        "Battery Heating Status",
+        "bmsPTCHeatResp",
+        icon="mdi:heat-wave",
+        mapping=BATTERY_HEATING_STATES,
+        exists_fn=lambda coordinator: coordinator.has_battery_heating,
+    ),
+    # Control is not implemented yet: the RvcParamsId for steering wheel heat
+    # is not defined in saic-python-client-ng 0.9.3.
+    _status_sensor(
+        "Steering Wheel Heat",
+        "steeringHeatLevel",
+        icon="mdi:steering",
+        mapping=STEERING_WHEEL_HEAT_STATES,
+        key="steering_wheel_heat",
+        attributes_fn=_steering_wheel_heat_attributes,
+        context=fields_context(
+            "steeringHeatLevel",
+            "steeringWheelHeatFailureReason",
+            data_type="status",
+        ),
+        exists_fn=lambda coordinator: coordinator.has_steering_wheel_heat,
+    ),
+)
 
-    @property
-    def unique_id(self):
-        return self._unique_id
 
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up MG SAIC sensors."""
+    coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
 
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_value is not None:
-            return True
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
+    try:
+        if coordinator.vin_info is None:
+            LOGGER.error("Failed to retrieve vehicle info.")
+            return
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        # Total Battery Capacity: prefer coordinator's known-good value when set.
-        if self._field == "totalBatteryCapacity":
-            known_capacity = getattr(
-                self.coordinator, "known_battery_capacity_kwh", None
-            )
-            if known_capacity is not None:
-                return known_capacity
+        sensors = [
+            SAICMGSensor(coordinator, entry, description)
+            for description in SENSORS
+            if description.exists_fn(coordinator)
+        ]
 
-        try:
-            charging_data = getattr(
-                self.coordinator.data.get("charging"), self._data_source, None
-            )
+        # Add sensors
+        async_add_entities(sensors, update_before_add=True)
 
-            if charging_data:
-                charging_status = getattr(charging_data, "bmsChrgSts", None)
-
-                # --- Fields that return explicit 0 when not charging ---
-                if self._field in self._NOT_CHARGING_ZERO_FIELDS:
-                    if charging_status in self._INACTIVE_CHARGING_STATUSES:
-                        # Explicit "not charging" zero — do NOT update retention
-                        return 0
-                    raw_value = getattr(charging_data, self._field, None)
-                    if raw_value == -128:
-                        if self._last_valid_value is not None:
-                            return self._last_valid_value
-                        return None
-                    if raw_value is not None:
-                        result = raw_value * self._factor
-                        # lastChargeEndingPower: some models (e.g. HS PHEV) report
-                        # this field inflated by ~3× relative to the true kWh value.
-                        # Apply the profile's charging_capacity_correction factor
-                        # when set so the displayed value matches the real battery.
-                        if self._field == "lastChargeEndingPower":
-                            correction = getattr(
-                                self.coordinator, "charging_capacity_correction", None
-                            )
-                            if correction is not None:
-                                result = result * correction
-                        self._last_valid_value = result
-                        return result
-                    return None
-
-                # --- Target SOC mapping ---
-                elif self._field == "bmsOnBdChrgTrgtSOCDspCmd":
-                    raw_value = getattr(charging_data, self._field, None)
-                    mapped = {
-                        1: 40,
-                        2: 50,
-                        3: 60,
-                        4: 70,
-                        5: 80,
-                        6: 90,
-                        7: 100,
-                    }.get(raw_value)
-                    if mapped is not None:
-                        self._last_valid_value = mapped
-                        return mapped
-                    # Unknown code — fall through to retention
-                    if self._last_valid_value is not None:
-                        return self._last_valid_value
-                    return None
-
-                # --- Charging status string mapping ---
-                elif self._field == "bmsChrgSts":
-                    raw_value = getattr(charging_data, self._field, None)
-                    mapped = {
-                        0: "Unplugged",
-                        1: "Charging (AC)",
-                        2: "Charging Finished",
-                        3: "Charging",
-                        4: "Fault Charging",
-                        5: "Connecting",
-                        6: "Unrecognized Connection",
-                        7: "Plugged In",
-                        8: "Charging Stopped",
-                        9: "Scheduled Charging",
-                        10: "Charging (DC)",
-                        11: "Super Offboard Charging",
-                        12: "Charging",
-                        13: "V2X Discharging",
-                    }.get(raw_value, f"Unknown ({raw_value})" if raw_value is not None else None)
-                    if mapped is not None:
-                        self._last_valid_value = mapped
-                        return mapped
-                    if self._last_valid_value is not None:
-                        return self._last_valid_value
-                    return None
-
-                # --- Battery heating status mapping ---
-                elif self._field == "bmsPTCHeatResp":
-                    raw_value = getattr(charging_data, self._field, None)
-                    mapped = {
-                        0: "Off",
-                        1: "On",
-                        2: "Error",
-                    }.get(raw_value, f"Unknown ({raw_value})" if raw_value is not None else None)
-                    if mapped is not None:
-                        self._last_valid_value = mapped
-                        return mapped
-                    if self._last_valid_value is not None:
-                        return self._last_valid_value
-                    return None
-
-                # --- Generic numeric fields ---
-                else:
-                    raw_value = getattr(charging_data, self._field, None)
-                    if raw_value == -128:
-                        if self._last_valid_value is not None:
-                            LOGGER.debug(
-                                "Charging sensor %s: sentinel -128, "
-                                "retaining last known value",
-                                self._name,
-                            )
-                            return self._last_valid_value
-                        return None
-                    if raw_value is not None:
-                        result = raw_value * self._factor if self._factor is not None else raw_value
-                        self._last_valid_value = result
-                        return result
-                    # raw_value is None — fall through to retention below
-
-            else:
-                LOGGER.error("No charging data available for %s", self._name)
-
-        except Exception as e:
-            LOGGER.error("Error retrieving charging sensor %s: %s", self._name, e)
-
-        # API gave nothing usable — return last retained value
-        if self._last_valid_value is not None:
-            LOGGER.debug(
-                "Charging sensor %s: no data from API, retaining last known value",
-                self._name,
-            )
-            return self._last_valid_value
-        return None
+    except Exception as e:
+        LOGGER.error("Error setting up MG SAIC sensors: %s", e)
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
 
+class SAICMGSensor(CoordinatorEntity, SensorEntity):
+    """MG SAIC sensor computed by its SAICMGSensorEntityDescription.
 
-class SAICMGChargingCurrentLimitSensor(CoordinatorEntity, SensorEntity):
-    """Sensor to show the charging current limit.
+    Name, unique ID and device info are fixed for the life of the entity and
+    set once here; device class, unit, icon and state class come from the
+    description.
 
-    Retention note: code 0 maps to "0A (Ignore)" which is a valid state —
-    retention stores the mapped string and returns it on API failure.
+    HA reads availability, value and attributes several times per state
+    write.  Each is computed once per coordinator.data_version and served
+    from the cache until the coordinator notifies again.  A coordinator
+    update that leaves all three unchanged — including a reading held by the
+    description's deadband — writes no state.
     """
 
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor=None,
-        data_source="chrgMgmtData",
-        data_type="charging",
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._device_class = device_class
-        self._unit = unit
-        self._icon = icon
-        self._state_class = state_class
-        self._factor = factor
-        self._data_source = data_source
-        self._data_type = data_type
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}_current_limit"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-        # Retain last mapped string.  Code 0 → "0A (Ignore)" is valid, so we
-        # always store the result when the API gives a known code.
-        self._last_valid_limit: str | None = None
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        if self._last_valid_limit is not None:
-            return True
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
-
-    @property
-    def native_value(self):
-        """Return the current charging limit."""
-        try:
-            charging_data = getattr(
-                self.coordinator.data.get("charging"), self._data_source, None
-            )
-            if charging_data:
-                current_limit_code = getattr(charging_data, self._field, None)
-                if current_limit_code is not None:
-                    mapped = {
-                        0: "0A (Ignore)",
-                        1: "6A",
-                        2: "8A",
-                        3: "16A",
-                        4: "Max",
-                    }.get(current_limit_code, f"Unknown ({current_limit_code})")
-                    self._last_valid_limit = mapped
-                    return mapped
-
-        except Exception as e:
-            LOGGER.error(
-                "Error retrieving charging current limit for %s: %s", self._name, e
-            )
-
-        # Return last retained value when API gives nothing
-        if self._last_valid_limit is not None:
-            LOGGER.debug(
-                "Charging current limit sensor %s: no data from API, "
-                "retaining '%s'",
-                self._name,
-                self._last_valid_limit,
-            )
-            return self._last_valid_limit
-        return None
+    entity_description: SAICMGSensorEntityDescription
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-# LAST UPDATE TIME DATA SENSOR
-class SAICMGLastUpdateSensor(CoordinatorEntity, SensorEntity):
-    """Sensor to display the timestamp of the last successful data update.
-
-    NOTE: No value retention — retaining a stale "last update" timestamp would
-    be actively misleading (it would imply the data is more recent than it is).
-    """
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        data_type,
-    ):
+    def __init__(self, coordinator, entry, description):
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._device_class = device_class
-        self._unit = unit
-        self._icon = icon
-        self._state_class = state_class
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._vin_info = vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_last_update_time"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        return f"{self._vin_info.brandName} {self._vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and hasattr(self.coordinator, "last_update_time")
-            and self.coordinator.last_update_time is not None
+        super().__init__(coordinator, context=description.context)
+        self.entity_description = description
+        self._attr_name = coordinator.identity.name(description.name)
+        self._attr_unique_id = coordinator.identity.unique_id(description.key)
+        self._attr_device_info = coordinator.identity.device_info
+        self._cache_version = None
+        self._cache = {}
+        self._published_value = None
+        self._written_state = None
+
+    def _memoized(self, fn):
+        """Return *fn*(coordinator), computed once per data version.
+
+        Computed lazily per property: HA only reads the value of an available
+        entity, and value_fns may rely on availability having been checked.
+        """
+        version = self.coordinator.data_version
+        if version != self._cache_version:
+            self._cache_version = version
+            self._cache = {}
+        try:
+            return self._cache[fn]
+        except KeyError:
+            result = self._cache[fn] = fn(self.coordinator)
+            return result
+
+    def _filtered_value(self, coordinator):
+        """Return the value, held within the description's deadband."""
+        description = self.entity_description
+        value = description.value_fn(coordinator)
+        if description.deadband is None:
+            return value
+        value = apply_deadband(
+            self._published_value, value, coordinator.deadbands[description.deadband]
         )
-
-    @property
-    def native_value(self):
-        """Return the timestamp of the last successful data update."""
-        return self.coordinator.last_update_time
-
-    @property
-    def device_class(self):
-        return self._device_class
-
-    @property
-    def icon(self):
-        return self._icon
-
-    @property
-    def native_unit_of_measurement(self):
-        return self._unit
-
-    @property
-    def state_class(self):
-        return self._state_class
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-# NEXT UPDATE TIME DATA SENSOR
-class SAICMGNextUpdateSensor(CoordinatorEntity, SensorEntity):
-    """Sensor to display the timestamp of the next scheduled data update.
-
-    NOTE: No value retention — same rationale as SAICMGLastUpdateSensor.
-    """
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        data_type,
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._device_class = device_class
-        self._unit = unit
-        self._icon = icon
-        self._state_class = state_class
-        self._data_type = data_type
-        vin_info = self.coordinator.vin_info
-        self._vin_info = vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_next_update_time"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        return f"{self._vin_info.brandName} {self._vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and hasattr(self.coordinator, "next_update_time")
-            and self.coordinator.next_update_time is not None
+        self._published_value = value
+        return value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when it changed."""
+        available = self.available
+        state = (
+            available,
+            self.native_value if available else None,
+            self.extra_state_attributes,
         )
-
-    @property
-    def native_value(self):
-        """Return the timestamp of the next scheduled data update."""
-        return self.coordinator.next_update_time
-
-    @property
-    def device_class(self):
-        return self._device_class
-
-    @property
-    def icon(self):
-        return self._icon
-
-    @property
-    def native_unit_of_measurement(self):
-        return self._unit
-
-    @property
-    def state_class(self):
-        return self._state_class
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGLastKeySeenSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for Last Key Seen.
-
-    The SAIC API field lastKeySeen contains a raw integer that appears to be a
-    key fob identifier or pairing code (e.g. 7859) rather than a timestamp or
-    elapsed time.  Evidence from real vehicle logs:
-      - The same value (7859) appears consistently whether the car is parked or
-        actively being driven (powerMode=2), ruling out elapsed-seconds semantics.
-      - The vehicleModelConfiguration entry KEYPOS indicates key-position tracking
-        is a per-model capability; when KEYPOS=0 (e.g. HS PHEV) the field is 0.
-
-    This sensor therefore displays the raw integer value as-is.  When the value
-    is 0 (key not present / model does not support key tracking) it returns None
-    so the sensor shows as Unknown rather than a misleading zero.
-
-    Value retention is applied so the sensor stays available between polls.
-    """
-
-    def __init__(self, coordinator, entry, name, icon):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._attr_icon = icon
-        self._attr_device_class = None
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = None
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_lastKeySeen"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-        self._last_valid_value: int | None = None
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
+        if state == self._written_state:
+            return
+        self._written_state = state
+        super()._handle_coordinator_update()
 
     @property
     def available(self):
         """Return True if the entity is available."""
-        if self._last_valid_value is not None:
-            return True
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data.get("status") is not None
-        )
+        return self._memoized(self.entity_description.available_fn)
 
     @property
     def native_value(self):
-        """Return the raw key ID integer, or None when 0 / unavailable."""
-        try:
-            status_data = self.coordinator.data.get("status")
-            if not status_data:
-                return self._last_valid_value
-
-            basic = getattr(status_data, "basicVehicleStatus", None)
-            if not basic:
-                return self._last_valid_value
-
-            raw = getattr(basic, "lastKeySeen", None)
-            if raw is None:
-                return self._last_valid_value
-            if raw == 0:
-                # 0 = key not present or model does not support key tracking
-                return None
-            self._last_valid_value = raw
-            return raw
-
-        except Exception as e:
-            LOGGER.error("Error reading Last Key Seen sensor: %s", e)
-            return self._last_valid_value
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGTimestampSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a timestamp sensor for MG SAIC vehicles.
-
-    NOTE: No value retention — retaining a stale timestamp (last powered on/off,
-    last vehicle activity) would be misleading rather than helpful.
-    """
-
-    def __init__(self, coordinator, entry, name, field, device_class, icon, attribute):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._attr_device_class = device_class
-        self._attr_icon = icon
-        self._attribute = attribute  # Attribute name to fetch from the coordinator
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-    @property
-    def unique_id(self):
-        """Return the unique ID of the sensor."""
-        return self._unique_id
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        return self.coordinator.last_update_success and self.native_value is not None
+        """Return the state of the sensor."""
+        return self._memoized(self._filtered_value)
 
     @property
-    def native_value(self):
-        """Return the timestamp value from the coordinator."""
-        try:
-            return getattr(self.coordinator, self._attribute, None)
-        except AttributeError as e:
-            LOGGER.error(
-                "Error retrieving attribute '%s' for sensor '%s': %s",
-                self._attribute,
-                self._name,
-                e,
-            )
+    def extra_state_attributes(self):
+        """Return the description's extra attributes, if any."""
+        attributes_fn = self.entity_description.attributes_fn
+        if attributes_fn is None:
             return None
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
-
-
-class SAICMGVehicleSpeedSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for Vehicle Speed.
-
-    NOTE: No value retention intentionally — a stale speed value displayed as
-    "current speed" would be actively misleading (e.g. showing 80 km/h when
-    the car is parked).  HA showing Unknown when data is unavailable is the
-    correct behaviour here.
-    """
-
-    def __init__(
-        self,
-        coordinator,
-        entry,
-        name,
-        field,
-        status_type,
-        device_class,
-        unit,
-        icon,
-        state_class,
-        factor,
-        data_type,
-    ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._name = name
-        self._field = field
-        self._status_type = status_type
-        self._factor = factor
-        self._data_type = data_type
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        vin_info = self.coordinator.vin_info
-        self._unique_id = f"{entry.entry_id}_{vin_info.vin}_{field}"
-
-        self._device_info = create_device_info(coordinator, entry.entry_id)
-
-    @property
-    def unique_id(self):
-        return self._unique_id
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        vin_info = self.coordinator.vin_info
-        return f"{vin_info.brandName} {vin_info.modelName} {self._name}"
-
-    @property
-    def available(self):
-        """Return True if the entity is available."""
-        required_data = self.coordinator.data.get(self._data_type)
-        return self.coordinator.last_update_success and required_data is not None
-
-    @property
-    def native_value(self):
-        """Return the speed value."""
-        try:
-            data = self.coordinator.data.get(self._data_type)
-            if data:
-                gps = getattr(data, self._status_type, None)
-                if gps and gps.wayPoint:
-                    speed = gps.wayPoint.speed
-                    return speed * self._factor if speed else 0
-        except AttributeError as e:
-            LOGGER.error("Error retrieving speed for sensor '%s': %s", self._name, e)
-        return None
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self._device_info
+        return self._memoized(attributes_fn)
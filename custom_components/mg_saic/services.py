@@ -386,21 +386,13 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             selected_code = ChargeCurrentLimitOption.to_code(current_limit)
 
             # Get the current target_soc from coordinator's data
-            charging_data = coordinator.data.get("charging")
-            if not charging_data:
+            if not coordinator.data.has_charging:
                 LOGGER.error(
                     "No charging data available to set charging current limit."
                 )
                 return
 
-            chrg_mgmt_data = getattr(charging_data, "chrgMgmtData", None)
-            if not chrg_mgmt_data:
-                LOGGER.error(
-                    "No charging management data available to set charging current limit."
-                )
-                return
-
-            target_soc_value = getattr(chrg_mgmt_data, "bmsOnBdChrgTrgtSOCDspCmd", None)
+            target_soc_value = coordinator.data.bmsOnBdChrgTrgtSOCDspCmd
             if target_soc_value is None:
                 LOGGER.error(
                     "Target SOC value is not available to set charging current limit."
@@ -0,0 +1,101 @@
+# File: session_store.py
+"""Encrypted persistence of the SAIC session token.
+
+Without it every Home Assistant restart starts with a full login per account
+before any coordinator can refresh, which adds seconds to startup and piles
+logins onto the SAIC backend.  SAICMGSessionStore keeps the last session
+token, its issue time and lifetime in an HA Store (one file per account under
+.storage/), so SAICMGAPIClient can restore the session instead.
+
+The token is a bearer credential, so it is never written in clear text: the
+payload is encrypted with AES-GCM under a key derived (PBKDF2-SHA256) from the
+account credentials and a random per-file salt.  A changed password, a
+corrupted file or a file copied from another install simply fails to decrypt
+and is treated as "no stored session".
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+
+from Crypto.Cipher import AES
+from homeassistant.helpers.storage import Store
+
+from .const import LOGGER
+from .utils import account_storage_key
+
+SESSION_STORAGE_VERSION = 1
+SESSION_KEY_ITERATIONS = 100_000
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+class SAICMGSessionStore:
+    """Load and save one account's session token, encrypted at rest."""
+
+    def __init__(self, hass, account_key: tuple[str, str], password: str) -> None:
+        """Initialise the store for *account_key* ((username, region))."""
+        self._hass = hass
+        self._secret = "|".join((*account_key, password)).encode("utf-8")
+        self._store = Store(
+            hass,
+            SESSION_STORAGE_VERSION,
+            account_storage_key("session", account_key),
+        )
+        self._salt: bytes | None = None
+        self._key: bytes | None = None
+
+    async def _async_key(self, salt: bytes) -> bytes:
+        """Return the AES key for *salt*, deriving it in the executor once."""
+        if self._key is None or salt != self._salt:
+            self._key = await self._hass.async_add_executor_job(
+                hashlib.pbkdf2_hmac, "sha256", self._secret, salt, SESSION_KEY_ITERATIONS
+            )
+            self._salt = salt
+        return self._key
+
+    async def async_load(self) -> dict | None:
+        """Return the stored session, or None if absent or undecryptable."""
+        try:
+            stored = await self._store.async_load()
+            if not stored:
+                return None
+            salt = base64.b64decode(stored["salt"])
+            cipher = AES.new(
+                await self._async_key(salt),
+                AES.MODE_GCM,
+                nonce=base64.b64decode(stored["nonce"]),
+            )
+            plaintext = cipher.decrypt_and_verify(
+                base64.b64decode(stored["ciphertext"]),
+                base64.b64decode(stored["tag"]),
+            )
+            return json.loads(plaintext)
+        except Exception as exc:
+            LOGGER.debug("Stored session could not be restored: %s", exc)
+            return None
+
+    async def async_save(self, session: dict) -> None:
+        """Encrypt and persist *session* (token, issued_at, lifetime)."""
+        salt = self._salt or os.urandom(16)
+        cipher = AES.new(await self._async_key(salt), AES.MODE_GCM)
+        ciphertext, tag = cipher.encrypt_and_digest(
+            json.dumps(session).encode("utf-8")
+        )
+        await self._store.async_save(
+            {
+                "salt": _b64(salt),
+                "nonce": _b64(cipher.nonce),
+                "ciphertext": _b64(ciphertext),
+                "tag": _b64(tag),
+            }
+        )
+
+    async def async_remove(self) -> None:
+        """Delete the stored session."""
+        await self._store.async_remove()
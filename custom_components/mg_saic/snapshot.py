@@ -0,0 +1,332 @@
+# File: snapshot.py
+"""Decoded per-refresh vehicle snapshot.
+
+The library returns deeply nested response objects (status →
+basicVehicleStatus / gpsPosition, charging → chrgMgmtData / rvsChargeStatus)
+carrying raw integers: scaled by per-field factors and using -128 (and, for
+some fields, 0) to mean "no valid data".  Every entity used to walk those
+objects and re-apply the factors and sentinel checks on each state write.
+
+VehicleSnapshot decodes one refresh once, in the coordinator, into a flat
+__slots__ object of pre-scaled values with ``None`` wherever the API gave no
+valid reading.  It becomes coordinator.data and is what every platform reads.
+
+Attribute names follow the API field they are decoded from, so entity field
+keys (and the unique IDs built from them) stay as they were.  The exceptions
+are values merged from several sources: ``mileage`` and ``fuelRangeElec``
+(vehicle status, falling back to / preferring rvsChargeStatus), ``soc`` and
+the GPS fix (``latitude``, ``longitude``, ``speed`` …).
+
+The coordinator also keeps a second, long-lived snapshot of the last valid
+value of every field (VehicleSnapshot.retain), which entities read so a poll
+without a valid reading holds the last one instead of going Unknown.
+"""
+
+from __future__ import annotations
+
+from .const import (
+    CHARGING_CURRENT_FACTOR,
+    CHARGING_VOLTAGE_FACTOR,
+    DATA_100_DECIMAL_CORRECTION,
+    DATA_DECIMAL_CORRECTION,
+    DATA_DECIMAL_CORRECTION_SOC,
+    PRESSURE_TO_BAR,
+)
+from .logic import decode_field, decode_fields, decode_pack_current, retain_valid
+
+# (attribute, factor, zero_valid) per response part.  zero_valid=False marks
+# fields where 0 cannot be a real reading and is treated like the sentinel.
+BASIC_STATUS_FIELDS = (
+    ("interiorTemperature", None, True),
+    ("exteriorTemperature", None, True),
+    ("batteryVoltage", DATA_DECIMAL_CORRECTION, False),
+    ("frontLeftTyrePressure", PRESSURE_TO_BAR, False),
+    ("frontRightTyrePressure", PRESSURE_TO_BAR, False),
+    ("rearLeftTyrePressure", PRESSURE_TO_BAR, False),
+    ("rearRightTyrePressure", PRESSURE_TO_BAR, False),
+    ("fuelLevelPrc", None, True),
+    ("fuelRange", DATA_DECIMAL_CORRECTION, False),
+    ("powerMode", None, True),
+    ("lastKeySeen", None, True),
+    ("lockStatus", None, True),
+    ("engineStatus", None, True),
+    ("remoteClimateStatus", None, True),
+    ("rmtHtdRrWndSt", None, True),
+    ("driverDoor", None, True),
+    ("passengerDoor", None, True),
+    ("rearLeftDoor", None, True),
+    ("rearRightDoor", None, True),
+    ("driverWindow", None, True),
+    ("passengerWindow", None, True),
+    ("rearLeftWindow", None, True),
+    ("rearRightWindow", None, True),
+    ("sunroofStatus", None, True),
+    ("bootStatus", None, True),
+    ("bonnetStatus", None, True),
+    ("dippedBeamStatus", None, True),
+    ("mainBeamStatus", None, True),
+    ("sideLightStatus", None, True),
+    ("wheelTyreMonitorStatus", None, True),
+    ("frontLeftSeatHeatLevel", None, True),
+    ("frontRightSeatHeatLevel", None, True),
+    ("steeringHeatLevel", None, True),
+    ("steeringWheelHeatFailureReason", None, True),
+)
+
+CHRG_MGMT_FIELDS = (
+    ("bmsChrgSts", None, True),
+    ("bmsPackVol", CHARGING_VOLTAGE_FACTOR, True),
+    # Target SOC is a 1–7 code; 0 means the car did not report one.
+    ("bmsOnBdChrgTrgtSOCDspCmd", None, False),
+    ("bmsAltngChrgCrntDspCmd", None, True),
+    ("bmsEstdElecRng", None, True),
+    ("chrgngAddedElecRng", DATA_DECIMAL_CORRECTION, True),
+    ("chrgngRmnngTime", None, True),
+    ("bmsPTCHeatResp", None, True),
+    ("ccuEleccLckCtrlDspCmd", None, True),
+    ("imcuVehElecRng", None, True),
+)
+
+RVS_CHARGE_FIELDS = (
+    ("totalBatteryCapacity", DATA_DECIMAL_CORRECTION, True),
+    ("chargingDuration", DATA_100_DECIMAL_CORRECTION, True),
+    ("mileageSinceLastCharge", DATA_DECIMAL_CORRECTION, True),
+    ("powerUsageSinceLastCharge", DATA_DECIMAL_CORRECTION, True),
+    ("chargingGunState", None, True),
+)
+
+# Values merged from more than one source, or from the GPS way point.
+DERIVED_FIELDS = (
+    "statusTime",
+    "mileage",
+    "fuelRangeElec",
+    "soc",
+    "bmsPackCrnt",
+    "latitude",
+    "longitude",
+    "altitude",
+    "hdop",
+    "satellites",
+    "speed",
+    "heading",
+)
+
+# Odometer-style fields whose retained value never moves backwards.
+MONOTONIC_FIELDS = frozenset({"mileage"})
+
+
+def _field_names(*tables):
+    return tuple(name for table in tables for name, _factor, _zero in table)
+
+
+def fields_context(*fields, data_type=None) -> frozenset:
+    """Return the coordinator listener context for an entity reading *fields*.
+
+    The coordinator only updates an entity when one of these fields changed
+    (see SAICMGDataUpdateCoordinator.async_update_listeners).  *data_type*
+    ("status"/"charging") adds the matching ``has_*`` flag, for entities
+    whose availability depends on that response being present.
+    """
+    if data_type in ("status", "charging"):
+        fields = (*fields, f"has_{data_type}")
+    return frozenset(fields)
+
+
+# Decoded fields fingerprinted per response to spot an unchanged poll.  The
+# merged fields (mileage, fuelRangeElec, soc) can come from either response,
+# so they are part of both.
+_MERGED_FIELDS = ("mileage", "fuelRangeElec", "soc")
+STATUS_FINGERPRINT_FIELDS = (
+    *_field_names(BASIC_STATUS_FIELDS),
+    *_MERGED_FIELDS,
+    "latitude",
+    "longitude",
+    "altitude",
+    "hdop",
+    "satellites",
+    "speed",
+    "heading",
+)
+CHARGING_FINGERPRINT_FIELDS = (
+    *_field_names(CHRG_MGMT_FIELDS, RVS_CHARGE_FIELDS),
+    *_MERGED_FIELDS,
+    "bmsPackCrnt",
+)
+
+
+class VehicleSnapshot:
+    """Flat, decoded vehicle data from one refresh.
+
+    ``has_status`` / ``has_charging`` tell whether the refresh returned that
+    response at all; when it did not, all of its fields are ``None``.
+    """
+
+    FIELDS = (
+        *_field_names(BASIC_STATUS_FIELDS, CHRG_MGMT_FIELDS, RVS_CHARGE_FIELDS),
+        *DERIVED_FIELDS,
+    )
+    __slots__ = ("has_status", "has_charging", *FIELDS)
+
+    def __init__(self, has_status=False, has_charging=False, **fields):
+        """Initialise from decoded values; unknown names raise TypeError."""
+        self.has_status = has_status
+        self.has_charging = has_charging
+        for name in self.FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown snapshot fields: {', '.join(fields)}")
+
+    @classmethod
+    def from_responses(cls, status, charging) -> VehicleSnapshot:
+        """Decode a vehicle status and a charging response (either may be None)."""
+        basic = getattr(status, "basicVehicleStatus", None)
+        chrg_mgmt = getattr(charging, "chrgMgmtData", None)
+        rvs = getattr(charging, "rvsChargeStatus", None)
+
+        fields = {
+            **decode_fields(basic, BASIC_STATUS_FIELDS),
+            **decode_fields(chrg_mgmt, CHRG_MGMT_FIELDS),
+            **decode_fields(rvs, RVS_CHARGE_FIELDS),
+        }
+        fields["statusTime"] = getattr(status, "statusTime", None)
+
+        # Mileage is a monotonic odometer: anything <= 0 is invalid.  Vehicle
+        # status first, then the copy in rvsChargeStatus.
+        for source in (basic, rvs):
+            mileage = decode_field(
+                getattr(source, "mileage", None), DATA_DECIMAL_CORRECTION
+            )
+            if mileage is not None and mileage > 0:
+                fields["mileage"] = mileage
+                break
+
+        # Electric range: rvsChargeStatus first, then vehicle status.  0 is
+        # not a real range (the car is not actually flat).
+        for source in (rvs, basic):
+            electric_range = decode_field(
+                getattr(source, "fuelRangeElec", None),
+                DATA_DECIMAL_CORRECTION,
+                zero_valid=False,
+            )
+            if electric_range is not None:
+                fields["fuelRangeElec"] = electric_range
+                break
+
+        # SOC: the BMS display value (tenths of a percent), falling back to
+        # extendedData1 in vehicle status, where -1 and 0 also mean no data.
+        soc = decode_field(
+            getattr(chrg_mgmt, "bmsPackSOCDsp", None), DATA_DECIMAL_CORRECTION_SOC
+        )
+        if soc is None:
+            raw_soc = getattr(basic, "extendedData1", None)
+            if raw_soc not in (None, -128, -1, 0):
+                soc = raw_soc
+        fields["soc"] = soc
+
+        fields["bmsPackCrnt"] = decode_pack_current(
+            getattr(chrg_mgmt, "bmsPackCrnt", None), CHARGING_CURRENT_FACTOR
+        )
+
+        gps = getattr(status, "gpsPosition", None)
+        way_point = getattr(gps, "wayPoint", None)
+        position = getattr(way_point, "position", None)
+        if position is not None and position.latitude is not None:
+            latitude = position.latitude / 1e6
+            longitude = position.longitude / 1e6
+            # 0,0 is what the API sends when it has no fix.
+            if latitude != 0.0 or longitude != 0.0:
+                fields["latitude"] = latitude
+                fields["longitude"] = longitude
+            fields["altitude"] = position.altitude
+        if way_point is not None:
+            fields["hdop"] = way_point.hdop
+            fields["satellites"] = way_point.satellites
+            fields["heading"] = way_point.heading
+            if way_point.speed is not None:
+                fields["speed"] = way_point.speed * DATA_DECIMAL_CORRECTION
+
+        return cls(
+            has_status=status is not None,
+            has_charging=charging is not None,
+            **fields,
+        )
+
+    def has_data(self, data_type: str) -> bool:
+        """Return True if the refresh returned *data_type* ("status"/"charging").
+
+        Vehicle info is not part of the snapshot and always counts as present.
+        """
+        if data_type == "status":
+            return self.has_status
+        if data_type == "charging":
+            return self.has_charging
+        return True
+
+    def fingerprints(self) -> tuple:
+        """Return cheap ``(status, charging)`` fingerprints of this refresh.
+
+        The status fingerprint is its statusTime plus a hash of the decoded
+        status fields; the charging one a hash of the decoded charging
+        fields.  Either is None when that response was not returned.  Two
+        refreshes with equal fingerprints decoded to the same values.
+        """
+        status = charging = None
+        if self.has_status:
+            status = (
+                self.statusTime,
+                hash(tuple(getattr(self, name) for name in STATUS_FINGERPRINT_FIELDS)),
+            )
+        if self.has_charging:
+            charging = hash(
+                tuple(getattr(self, name) for name in CHARGING_FINGERPRINT_FIELDS)
+            )
+        return status, charging
+
+    def diff(self, previous: VehicleSnapshot | None) -> set[str]:
+        """Return the fields (and ``has_*`` flags) that differ from *previous*."""
+        if previous is None:
+            return set(self.__slots__)
+        return {
+            name
+            for name in self.__slots__
+            if getattr(self, name) != getattr(previous, name)
+        }
+
+    def retain(self, fresh: VehicleSnapshot) -> set[str]:
+        """Merge the valid values of *fresh* into this snapshot in place.
+
+        Used on the coordinator's retained snapshot: fields *fresh* has no
+        valid reading for keep their last value, and MONOTONIC_FIELDS never
+        go backwards.  ``has_status`` / ``has_charging`` become True once
+        either response has been seen.  Returns the names of changed fields.
+        """
+        updates = retain_valid(
+            {name: getattr(self, name) for name in self.FIELDS},
+            {name: getattr(fresh, name) for name in self.FIELDS},
+            MONOTONIC_FIELDS,
+        )
+        for name, value in updates.items():
+            setattr(self, name, value)
+        self.has_status = self.has_status or fresh.has_status
+        self.has_charging = self.has_charging or fresh.has_charging
+        return set(updates)
+
+    def as_dict(self) -> dict:
+        """Return the snapshot as a JSON-ready dict, without ``None`` fields."""
+        data = {
+            name: getattr(self, name)
+            for name in self.FIELDS
+            if getattr(self, name) is not None
+        }
+        data["has_status"] = self.has_status
+        data["has_charging"] = self.has_charging
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> VehicleSnapshot:
+        """Rebuild a snapshot from as_dict output, ignoring unknown keys."""
+        return cls(
+            has_status=bool(data.get("has_status")),
+            has_charging=bool(data.get("has_charging")),
+            **{name: data[name] for name in cls.FIELDS if name in data},
+        )
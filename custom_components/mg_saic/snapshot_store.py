@@ -0,0 +1,99 @@
+# File: snapshot_store.py
+"""Persisted last-known vehicle snapshot, for instant startup.
+
+Without it every entry waits on its first real refresh at HA startup (up to
+STARTUP_API_TIMEOUT) and goes into ConfigEntryNotReady when SAIC is slow, so
+every entity stays unavailable until the API recovers.
+
+SAICMGSnapshotStore keeps the vehicle info (in the compact form produced by
+logic.compact_response) and the coordinator's retained VehicleSnapshot — the
+last valid value of every field — of one VIN in an HA Store, so retained
+values also survive a restart.  At startup the coordinator sets up from that
+snapshot straight away — marked stale, with last_update_time set to when it
+was fetched — and runs its first real refresh in the background.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+from .logic import compact_response, restore_response
+from .snapshot import VehicleSnapshot
+
+SNAPSHOT_STORAGE_VERSION = 1
+
+# Saves are coalesced: a refresh every minute while driving costs at most one
+# disk write per delay.  HA flushes pending saves on shutdown.
+SNAPSHOT_SAVE_DELAY = 60
+
+
+class SAICMGSnapshotStore:
+    """Load and save the last good vehicle data for one VIN."""
+
+    def __init__(self, hass, vin: str) -> None:
+        """Initialise the store for *vin*."""
+        self._store = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.snapshot.{vin}"
+        )
+        self._vin = vin
+        # Vehicle info and the retained snapshot as live objects, serialised
+        # only when the delayed save writes.
+        self._info = None
+        self._vehicle: VehicleSnapshot | None = None
+        self._saved_at: datetime | None = None
+
+    async def async_load(self) -> dict | None:
+        """Return the stored snapshot as ``{"saved_at", "info", "vehicle"}``, or None.
+
+        ``info`` is the vehicle list entry for this VIN (in a one-element list,
+        as logic.RestoredResponse objects read like live library responses)
+        and ``vehicle`` a VehicleSnapshot.
+        """
+        try:
+            stored = await self._store.async_load()
+        except Exception as exc:
+            LOGGER.warning("Could not load snapshot for VIN %s: %s", self._vin, exc)
+            return None
+        if not stored or not stored.get("info"):
+            return None
+
+        try:
+            saved_at = datetime.fromisoformat(stored["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        self._info = restore_response(stored["info"])
+        self._vehicle = VehicleSnapshot.from_dict(stored.get("vehicle") or {})
+        self._saved_at = saved_at
+        return {
+            "saved_at": saved_at,
+            "info": [self._info],
+            "vehicle": self._vehicle,
+        }
+
+    def async_schedule_save(self, info, retained: VehicleSnapshot) -> None:
+        """Record a fresh refresh and schedule a save.
+
+        *retained* is the coordinator's retained snapshot, which already
+        keeps the previous value of fields a refresh had no reading for.
+        """
+        if info is not None:
+            self._info = info
+        self._vehicle = retained
+        self._saved_at = datetime.now(timezone.utc)
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return the snapshot in its stored form."""
+        return {
+            "saved_at": self._saved_at.isoformat(),
+            "info": compact_response(self._info),
+            "vehicle": self._vehicle.as_dict() if self._vehicle else {},
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
@@ -8,7 +8,7 @@ from .const import (
     LOGGER,
     CHARGING_STATUS_CODES,
 )
-from .utils import create_device_info
+from .snapshot import fields_context
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -16,7 +16,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
     client = hass.data[DOMAIN][entry.entry_id]
 
-    if not coordinator.data.get("info"):
+    if coordinator.vin_info is None:
         LOGGER.error("Vehicle info is not available. Switches cannot be set up.")
         return
 
@@ -89,19 +89,25 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class SAICMGVehicleSwitch(CoordinatorEntity, SwitchEntity):
     """Base class for MG SAIC switches."""
 
-    def __init__(self, coordinator, client, entry, vin_info, vin, name, icon):
-        """Initialize the switch."""
-        super().__init__(coordinator)
+    def __init__(
+        self, coordinator, client, entry, vin_info, vin, name, icon, context=None
+    ):
+        """Initialize the switch.
+
+        *context* is the set of snapshot fields the switch reads (see
+        snapshot.fields_context); None updates it on every refresh.
+        """
+        super().__init__(coordinator, context=context)
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} {name}"
-        self._attr_unique_id = (
-            f"{entry.entry_id}_{vin}_{name.replace(' ', '_').lower()}_switch"
+        self._attr_name = coordinator.identity.name(name)
+        self._attr_unique_id = coordinator.identity.unique_id(
+            f"{name.replace(' ', '_').lower()}_switch"
         )
         self._attr_icon = icon
 
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -126,7 +132,7 @@ class SAICMGVehicleSwitch(CoordinatorEntity, SwitchEntity):
         """Return True if the switch entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("status") is not None
+            and self.coordinator.data.has_status
         )
 
 
@@ -135,14 +141,16 @@ class SAICMGBatteryHeatingSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the Battery Heating switch entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context("bmsPTCHeatResp", "has_charging")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Battery Heating"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_battery_heating_switch"
+        self._attr_name = coordinator.identity.name("Battery Heating")
+        self._attr_unique_id = coordinator.identity.unique_id("battery_heating_switch")
         self._attr_icon = "mdi:heat-wave"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -152,20 +160,14 @@ class SAICMGBatteryHeatingSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self):
         """Return true if battery heating is active."""
-        charging_data = self.coordinator.data.get("charging")
-        if charging_data:
-            chrgMgmtData = getattr(charging_data, "chrgMgmtData", None)
-            if chrgMgmtData:
-                bmsPTCHeatResp = getattr(chrgMgmtData, "bmsPTCHeatResp", None)
-                return bmsPTCHeatResp == 1
-        return False
+        return self.coordinator.data.bmsPTCHeatResp == 1
 
     @property
     def available(self):
         """Return True if the switch entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("charging") is not None
+            and self.coordinator.data.has_charging
         )
 
     async def async_turn_on(self, **kwargs):
@@ -205,16 +207,18 @@ class SAICMGChargingPortLockSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the Charging Port Lock switch entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context("ccuEleccLckCtrlDspCmd")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = (
-            f"{vin_info.brandName} {vin_info.modelName} Charging Port Lock"
+        self._attr_name = coordinator.identity.name("Charging Port Lock")
+        self._attr_unique_id = coordinator.identity.unique_id(
+            "charging_port_lock_switch"
         )
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_charging_port_lock_switch"
         self._attr_icon = "mdi:lock"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -224,13 +228,8 @@ class SAICMGChargingPortLockSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self):
         """Return true if the charging port is locked."""
-        charging_data = self.coordinator.data.get("charging")
-        if charging_data:
-            lock_status = getattr(
-                charging_data.chrgMgmtData, "ccuEleccLckCtrlDspCmd", None
-            )
-            return lock_status == 1  # Assuming 1 represents locked
-        return False
+        # Assuming 1 represents locked
+        return self.coordinator.data.ccuEleccLckCtrlDspCmd == 1
 
     async def async_turn_on(self, **kwargs):
         """Lock the charging port."""
@@ -269,14 +268,16 @@ class SAICMGChargingSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the Charging switch entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context("bmsChrgSts", "has_charging")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Charging"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_charging_switch"
+        self._attr_name = coordinator.identity.name("Charging")
+        self._attr_unique_id = coordinator.identity.unique_id("charging_switch")
         self._attr_icon = "mdi:ev-station"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -286,20 +287,14 @@ class SAICMGChargingSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self):
         """Return true if charging is active."""
-        charging_data = self.coordinator.data.get("charging")
-        if charging_data:
-            chrgMgmtData = getattr(charging_data, "chrgMgmtData", None)
-            if chrgMgmtData:
-                charging_status = getattr(chrgMgmtData, "bmsChrgSts", None)
-                return charging_status in CHARGING_STATUS_CODES
-        return False
+        return self.coordinator.data.bmsChrgSts in CHARGING_STATUS_CODES
 
     @property
     def available(self):
         """Return True if the switch entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("charging") is not None
+            and self.coordinator.data.has_charging
         )
 
     async def async_turn_on(self, **kwargs):
@@ -339,14 +334,16 @@ class SAICMGFrontDefrostSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the Front Defrost switch entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context("remoteClimateStatus")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Front Defrost"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_front_defrost_switch"
+        self._attr_name = coordinator.identity.name("Front Defrost")
+        self._attr_unique_id = coordinator.identity.unique_id("front_defrost_switch")
         self._attr_icon = "mdi:car-defrost-front"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -356,15 +353,7 @@ class SAICMGFrontDefrostSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self):
         """Return true if front defrost is on."""
-        status = self.coordinator.data.get("status")
-        if status:
-            basic_status = getattr(status, "basicVehicleStatus", None)
-            if basic_status:
-                remote_climate_status = getattr(
-                    basic_status, "remoteClimateStatus", None
-                )
-                return remote_climate_status == 5
-        return False
+        return self.coordinator.data.remoteClimateStatus == 5
 
     async def async_turn_on(self, **kwargs):
         """Start front defrost."""
@@ -421,15 +410,16 @@ class SAICMGHeatedSeatsSwitch(SAICMGVehicleSwitch):
             vin,
             f"Heated Seat {seat_name}",
             "mdi:car-seat-heater",
+            context=fields_context(status_attr, "has_status"),
         )
         self._seat_side = seat_side
         self._status_attr = status_attr
-        self._attr_name = (
-            f"{vin_info.brandName} {vin_info.modelName} Heated Seat {seat_name}"
+        self._attr_name = coordinator.identity.name(f"Heated Seat {seat_name}")
+        self._attr_unique_id = coordinator.identity.unique_id(
+            f"heated_seat_{seat_side}"
         )
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_heated_seat_{seat_side}"
         self._attr_icon = "mdi:car-seat-heater"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -439,24 +429,15 @@ class SAICMGHeatedSeatsSwitch(SAICMGVehicleSwitch):
     @property
     def is_on(self):
         """Return true if heated seats are on."""
-        status = self.coordinator.data.get("status")
-        if status:
-            basic_status = getattr(status, "basicVehicleStatus", None)
-            if basic_status:
-                seat_level = getattr(
-                    basic_status,
-                    self._status_attr,
-                    0,
-                )
-                return seat_level > 0
-        return False
+        seat_level = getattr(self.coordinator.data, self._status_attr)
+        return seat_level is not None and seat_level > 0
 
     @property
     def available(self):
         """Return True if the switch entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data.get("status") is not None
+            and self.coordinator.data.has_status
         )
 
     async def async_turn_on(self, **kwargs):
@@ -466,10 +447,8 @@ class SAICMGHeatedSeatsSwitch(SAICMGVehicleSwitch):
             long_interval = self.coordinator.heated_seats_long_interval
 
             # Fetch current levels to avoid overriding the opposite seat
-            status = self.coordinator.data.get("status", {})
-            basic_status = getattr(status, "basicVehicleStatus", {})
-            left_level = getattr(basic_status, "frontLeftSeatHeatLevel", 0)
-            right_level = getattr(basic_status, "frontRightSeatHeatLevel", 0)
+            left_level = self.coordinator.data.frontLeftSeatHeatLevel or 0
+            right_level = self.coordinator.data.frontRightSeatHeatLevel or 0
 
             if self._seat_side == "left":
                 await self._client.control_heated_seats(self._vin, 2, right_level)
@@ -502,10 +481,8 @@ class SAICMGHeatedSeatsSwitch(SAICMGVehicleSwitch):
             long_interval = self.coordinator.heated_seats_long_interval
 
             # Fetch current levels to avoid overriding the opposite seat
-            status = self.coordinator.data.get("status", {})
-            basic_status = getattr(status, "basicVehicleStatus", {})
-            left_level = getattr(basic_status, "frontLeftSeatHeatLevel", 0)
-            right_level = getattr(basic_status, "frontRightSeatHeatLevel", 0)
+            left_level = self.coordinator.data.frontLeftSeatHeatLevel or 0
+            right_level = self.coordinator.data.frontRightSeatHeatLevel or 0
 
             if self._seat_side == "left":
                 await self._client.control_heated_seats(self._vin, 0, right_level)
@@ -537,16 +514,18 @@ class SAICMGRearWindowDefrostSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the Rear Window Defrost switch entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, context=fields_context("rmtHtdRrWndSt")
+        )
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = (
-            f"{vin_info.brandName} {vin_info.modelName} Rear Window Defrost"
+        self._attr_name = coordinator.identity.name("Rear Window Defrost")
+        self._attr_unique_id = coordinator.identity.unique_id(
+            "rear_window_defrost_switch"
         )
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_rear_window_defrost_switch"
         self._attr_icon = "mdi:car-defrost-rear"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -556,13 +535,7 @@ class SAICMGRearWindowDefrostSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self):
         """Return true if rear window defrost is on."""
-        status = self.coordinator.data.get("status")
-        if status:
-            basic_status = getattr(status, "basicVehicleStatus", None)
-            if basic_status:
-                rear_window_heat_status = getattr(basic_status, "rmtHtdRrWndSt", None)
-                return rear_window_heat_status == 1
-        return False
+        return self.coordinator.data.rmtHtdRrWndSt == 1
 
     async def async_turn_on(self, **kwargs):
         """Turn the rear window defrost on."""
@@ -609,14 +582,14 @@ class SAICMGSunroofSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, client, entry, vin_info, vin):
         """Initialize the Sunroof switch entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=fields_context("sunroofStatus"))
         self._client = client
         self._vin = vin
         self._vin_info = vin_info
-        self._attr_name = f"{vin_info.brandName} {vin_info.modelName} Sunroof"
-        self._attr_unique_id = f"{entry.entry_id}_{vin}_sunroof_switch"
+        self._attr_name = coordinator.identity.name("Sunroof")
+        self._attr_unique_id = coordinator.identity.unique_id("sunroof_switch")
         self._attr_icon = "mdi:car-select"
-        self._device_info = create_device_info(coordinator, entry.entry_id)
+        self._device_info = coordinator.identity.device_info
 
     @property
     def device_info(self):
@@ -626,11 +599,7 @@ class SAICMGSunroofSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self):
         """Return true if the sunroof is open."""
-        status = self.coordinator.data.get("status")
-        if status:
-            sunroof_status = getattr(status.basicVehicleStatus, "sunroofStatus", None)
-            return sunroof_status == 1
-        return False
+        return self.coordinator.data.sunroofStatus == 1
 
     async def async_turn_on(self, **kwargs):
         """Open the sunroof."""
@@ -0,0 +1,67 @@
+# File: usage_store.py
+"""Persisted per-vehicle usage profile and plug-in history.
+
+The coordinator learns when each VIN usually starts, parks and plugs in
+(logic.UsageProfile) and polls more often ahead of those hours, and how long
+after stopping it gets plugged in (logic.PlugInHistory), which shapes the
+post-shutdown refresh sequence.  Both take weeks to build, so
+SAICMGUsageStore keeps them in an HA Store, one file per VIN under .storage/,
+instead of starting from scratch on every restart.
+"""
+
+from __future__ import annotations
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+from .logic import PlugInHistory, UsageProfile
+
+USAGE_STORAGE_VERSION = 1
+
+# Events are a handful per day; a delayed save still coalesces a start and
+# the plug-in that follows it into one write.
+USAGE_SAVE_DELAY = 300
+
+
+class SAICMGUsageStore:
+    """Load and save what was learned about one VIN's usage."""
+
+    def __init__(self, hass, vin: str) -> None:
+        """Initialise the store for *vin*."""
+        self._store = Store(hass, USAGE_STORAGE_VERSION, f"{DOMAIN}.usage.{vin}")
+        self._vin = vin
+        self._profile: UsageProfile | None = None
+        self._plug_in: PlugInHistory | None = None
+
+    async def async_load(self) -> dict:
+        """Return ``{"profile", "plug_in"}`` as stored, or empty ones."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as exc:
+            LOGGER.warning(
+                "Could not load usage profile for VIN %s: %s", self._vin, exc
+            )
+            stored = None
+        stored = stored or {}
+        self._profile = UsageProfile.from_dict(stored.get("profile"))
+        self._plug_in = PlugInHistory.from_dict(stored.get("plug_in"))
+        return {"profile": self._profile, "plug_in": self._plug_in}
+
+    def async_schedule_save(
+        self, profile: UsageProfile, plug_in: PlugInHistory
+    ) -> None:
+        """Schedule a save after the profile or plug-in history learned."""
+        self._profile = profile
+        self._plug_in = plug_in
+        self._store.async_delay_save(self._data_to_save, USAGE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return the learned data in its stored form."""
+        return {
+            "profile": self._profile.as_dict(),
+            "plug_in": self._plug_in.as_dict(),
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored data."""
+        await self._store.async_remove()
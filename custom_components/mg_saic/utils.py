@@ -1,5 +1,10 @@
 # File: utils.py
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+
 from .const import DOMAIN
 
 
@@ -16,3 +21,47 @@ def create_device_info(coordinator, entry_id):
         }
     except (IndexError, KeyError, AttributeError) as e:
         raise ValueError(f"Failed to create device info: {e}")
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleIdentity:
+    """Device info, name prefix and unique-ID prefix of one VIN's entities.
+
+    Built once per coordinator (SAICMGDataUpdateCoordinator.identity) and
+    shared by every platform, instead of each entity building its own
+    device info dict and name strings.  The device info dict is shared too
+    and must not be modified.
+    """
+
+    device_info: dict
+    name_prefix: str
+    unique_id_prefix: str
+
+    @classmethod
+    def from_coordinator(cls, coordinator, entry_id) -> VehicleIdentity:
+        """Build the identity from the coordinator's vehicle info."""
+        vin_info = coordinator.vin_info
+        return cls(
+            device_info=create_device_info(coordinator, entry_id),
+            name_prefix=f"{vin_info.brandName} {vin_info.modelName}",
+            unique_id_prefix=f"{entry_id}_{vin_info.vin}",
+        )
+
+    def name(self, name: str) -> str:
+        """Return the entity name for *name*, e.g. "MG MG4 Lock"."""
+        return f"{self.name_prefix} {name}"
+
+    def unique_id(self, suffix: str) -> str:
+        """Return the unique ID ``<entry_id>_<vin>_<suffix>``."""
+        return f"{self.unique_id_prefix}_{suffix}"
+
+
+def account_storage_key(kind, account_key):
+    """Return a Store key for per-account data of the given *kind*.
+
+    The account key is (username, region) and the username is usually an
+    e-mail address, so it is hashed rather than used verbatim: that keeps
+    the file name under .storage/ safe and doesn't put the login in it.
+    """
+    digest = hashlib.sha256("|".join(account_key).encode("utf-8")).hexdigest()
+    return f"{DOMAIN}.{kind}.{digest[:16]}"
@@ -1,6 +1,9 @@
 """Unit tests for pure integration logic."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+import asyncio
+import dataclasses
+from types import SimpleNamespace
 import importlib.util
 from pathlib import Path
 import unittest
@@ -96,6 +99,473 @@ class SelectUpdateIntervalTests(unittest.TestCase):
         )
         self.assertEqual(interval, self.default_interval)
 
+    def test_usage_outlook_shapes_the_idle_interval(self):
+        idle = dict(
+            is_powered_on=False,
+            is_charging=False,
+            idle_duration=timedelta(hours=1),
+            activity_duration=timedelta(hours=1),
+        )
+        self.assertEqual(
+            self.select_interval(usage_outlook="likely", **idle), self.grace_interval
+        )
+        self.assertEqual(
+            self.select_interval(usage_outlook="quiet", **idle),
+            self.default_interval,
+        )
+
+
+class ReleasableLockHoldTests(unittest.IsolatedAsyncioTestCase):
+    async def test_other_waiter_runs_during_released_sleep(self):
+        lock = asyncio.Lock()
+        order = []
+
+        async def stalled():
+            async with LOGIC.ReleasableLockHold(lock) as hold:
+                order.append("stalled:start")
+                await hold.sleep_released(0.01)
+                self.assertTrue(hold.held)
+                order.append("stalled:end")
+
+        async def sibling():
+            await asyncio.sleep(0)
+            async with lock:
+                order.append("sibling")
+
+        await asyncio.gather(stalled(), sibling())
+        self.assertEqual(order, ["stalled:start", "sibling", "stalled:end"])
+        self.assertFalse(lock.locked())
+
+    async def test_cancel_while_requeueing_does_not_release_foreign_lock(self):
+        lock = asyncio.Lock()
+        entered = asyncio.Event()
+
+        async def stalled():
+            async with LOGIC.ReleasableLockHold(lock) as hold:
+                entered.set()
+                await hold.sleep_released(0)
+
+        await lock.acquire()
+        task = asyncio.create_task(stalled())
+        await asyncio.sleep(0.01)
+        # Still queued for the initial acquire; now let it in and grab the
+        # lock again while it sleeps so the re-acquire has to wait.
+        lock.release()
+        await entered.wait()
+        await lock.acquire()
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(lock.locked())
+        lock.release()
+
+
+class NextMessagePageTests(unittest.TestCase):
+    def test_first_request_is_a_single_message(self):
+        self.assertEqual(LOGIC.next_message_page(0, 16), (1, 1))
+
+    def test_page_size_doubles_while_messages_are_new(self):
+        fetched = 0
+        sizes = []
+        for _ in range(7):
+            page_num, page_size = LOGIC.next_message_page(fetched, 16)
+            # The requested page always starts right after what we've read.
+            self.assertEqual((page_num - 1) * page_size, fetched)
+            sizes.append(page_size)
+            fetched += page_size
+        self.assertEqual(sizes, [1, 1, 2, 4, 8, 16, 16])
+
+    def test_rejects_misaligned_offset(self):
+        with self.assertRaises(ValueError):
+            LOGIC.next_message_page(3, 16)
+
+
+class SelectMessagePollIntervalTests(unittest.TestCase):
+    def select(self, **overrides):
+        params = {
+            "any_powered_on": False,
+            "any_charging": False,
+            "since_last_activity": timedelta(hours=5),
+            "local_hour": 12,
+            "active_interval": timedelta(seconds=60),
+            "charging_interval": timedelta(minutes=3),
+            "daytime_interval": timedelta(minutes=2),
+            "night_interval": timedelta(minutes=10),
+            "long_idle_interval": timedelta(minutes=15),
+            "recent_activity_window": timedelta(minutes=30),
+            "long_idle_after": timedelta(days=3),
+            "night_start_hour": 23,
+            "night_end_hour": 6,
+        }
+        params.update(overrides)
+        return LOGIC.select_message_poll_interval(**params)
+
+    def test_powered_on_wins(self):
+        interval, reason = self.select(any_powered_on=True, any_charging=True)
+        self.assertEqual(interval, timedelta(seconds=60))
+        self.assertEqual(reason, "vehicle powered on")
+
+    def test_recent_activity_polls_fast(self):
+        interval, _ = self.select(since_last_activity=timedelta(minutes=10))
+        self.assertEqual(interval, timedelta(seconds=60))
+
+    def test_charging(self):
+        interval, _ = self.select(any_charging=True)
+        self.assertEqual(interval, timedelta(minutes=3))
+
+    def test_night_wraps_midnight(self):
+        self.assertEqual(self.select(local_hour=23)[0], timedelta(minutes=10))
+        self.assertEqual(self.select(local_hour=3)[0], timedelta(minutes=10))
+        self.assertEqual(self.select(local_hour=6)[0], timedelta(minutes=2))
+
+    def test_long_idle_backs_off_regardless_of_time(self):
+        interval, _ = self.select(since_last_activity=timedelta(days=4))
+        self.assertEqual(interval, timedelta(minutes=15))
+
+
+class TokenRefreshDelayTests(unittest.TestCase):
+    def test_renews_margin_before_expiry(self):
+        self.assertEqual(LOGIC.token_refresh_delay(3600, 0, 600), 3000)
+        self.assertEqual(LOGIC.token_refresh_delay(3600, 1000, 600), 2000)
+
+    def test_short_lived_token_renews_at_half_life(self):
+        self.assertEqual(LOGIC.token_refresh_delay(600, 0, 600), 300)
+
+    def test_overdue_renewal_is_immediate(self):
+        self.assertEqual(LOGIC.token_refresh_delay(3600, 4000, 600), 0)
+
+
+class IsAuthErrorMessageTests(unittest.TestCase):
+    def test_matches_auth_failures(self):
+        self.assertTrue(LOGIC.is_auth_error_message("return code: 401, message: x"))
+        self.assertTrue(LOGIC.is_auth_error_message("Token Expired"))
+
+    def test_ignores_other_errors(self):
+        self.assertFalse(LOGIC.is_auth_error_message("return code: 8"))
+
+
+class SessionGenerationTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_failures_share_one_login(self):
+        session = LOGIC.SessionGeneration(asyncio.Lock())
+        logins = []
+
+        async def login():
+            await asyncio.sleep(0)
+            logins.append(session.generation)
+            session.advance()
+
+        results = await asyncio.gather(
+            *(session.async_renew(0, login) for _ in range(3))
+        )
+
+        self.assertEqual(logins, [0])
+        self.assertEqual(session.generation, 1)
+        self.assertEqual(results, [True, True, True])
+
+    async def test_stale_generation_does_not_login(self):
+        session = LOGIC.SessionGeneration(asyncio.Lock())
+        session.advance()
+
+        async def login():
+            raise AssertionError("should not log in")
+
+        self.assertFalse(await session.async_renew(0, login))
+
+    async def test_failed_login_is_shared_then_retried(self):
+        session = LOGIC.SessionGeneration(asyncio.Lock())
+        attempts = []
+
+        async def login():
+            attempts.append(1)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            session.async_renew(0, login),
+            session.async_renew(0, login),
+            return_exceptions=True,
+        )
+        self.assertEqual(len(attempts), 1)
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+        with self.assertRaises(RuntimeError):
+            await session.async_renew(0, login)
+        self.assertEqual(len(attempts), 2)
+
+
+class CompactResponseTests(unittest.TestCase):
+    def test_round_trip_drops_none_and_keeps_attribute_access(self):
+        @dataclasses.dataclass
+        class Basic:
+            mileage: int = None
+            powerMode: int = None
+
+        @dataclasses.dataclass
+        class Status:
+            statusTime: int = None
+            basicVehicleStatus: Basic = None
+
+        compact = LOGIC.compact_response(
+            Status(statusTime=5, basicVehicleStatus=Basic(mileage=1234))
+        )
+        self.assertEqual(compact, {"statusTime": 5, "basicVehicleStatus": {"mileage": 1234}})
+
+        restored = LOGIC.restore_response(compact)
+        self.assertEqual(restored.basicVehicleStatus.mileage, 1234)
+        self.assertIsNone(restored.basicVehicleStatus.powerMode)
+        self.assertEqual(LOGIC.compact_response(restored), compact)
+
+    def test_lists_of_objects(self):
+        restored = LOGIC.restore_response([{"vin": "A"}, {"vin": "B"}])
+        self.assertEqual([v.vin for v in restored], ["A", "B"])
+
+
+class DecodeFieldTests(unittest.TestCase):
+    def test_sentinel_and_missing_decode_to_none_before_scaling(self):
+        self.assertIsNone(LOGIC.decode_field(None, 0.1))
+        self.assertIsNone(LOGIC.decode_field(-128, 0.1))
+        self.assertAlmostEqual(LOGIC.decode_field(125, 0.1), 12.5)
+        self.assertEqual(LOGIC.decode_field(3), 3)
+
+    def test_zero_only_rejected_where_it_cannot_be_real(self):
+        self.assertEqual(LOGIC.decode_field(0, 0.1), 0)
+        self.assertIsNone(LOGIC.decode_field(0, 0.1, zero_valid=False))
+
+    def test_decode_fields_reads_a_response_part(self):
+        source = SimpleNamespace(fuelRange=4200, lockStatus=0, batteryVoltage=0)
+        fields = (
+            ("fuelRange", 0.1, False),
+            ("lockStatus", None, True),
+            ("batteryVoltage", 0.1, False),
+            ("sunroofStatus", None, True),
+        )
+        decoded = LOGIC.decode_fields(source, fields)
+        self.assertAlmostEqual(decoded["fuelRange"], 420.0)
+        self.assertEqual(decoded["lockStatus"], 0)
+        self.assertIsNone(decoded["batteryVoltage"])
+        self.assertIsNone(decoded["sunroofStatus"])
+        self.assertEqual(
+            LOGIC.decode_fields(None, fields), dict.fromkeys(decoded)
+        )
+
+    def test_pack_current_sign(self):
+        self.assertAlmostEqual(LOGIC.decode_pack_current(19800, 0.05), 10.0)
+        self.assertAlmostEqual(LOGIC.decode_pack_current(20200, 0.05), -10.0)
+        self.assertIsNone(LOGIC.decode_pack_current(-128, 0.05))
+
+
+class RetainValidTests(unittest.TestCase):
+    def test_missing_readings_keep_the_retained_value(self):
+        retained = {"soc": 80.0, "lockStatus": 1}
+        updates = LOGIC.retain_valid(retained, {"soc": None, "lockStatus": 0})
+        self.assertEqual(updates, {"lockStatus": 0})
+
+    def test_unchanged_values_are_not_reported(self):
+        self.assertEqual(LOGIC.retain_valid({"soc": 80.0}, {"soc": 80.0}), {})
+
+    def test_monotonic_fields_only_move_forward(self):
+        retained = {"mileage": 12000.5}
+        self.assertEqual(
+            LOGIC.retain_valid(retained, {"mileage": 11000.0}, {"mileage"}), {}
+        )
+        self.assertEqual(
+            LOGIC.retain_valid(retained, {"mileage": 12001.0}, {"mileage"}),
+            {"mileage": 12001.0},
+        )
+
+
+class ApplyDeadbandTests(unittest.TestCase):
+    def test_jitter_within_the_band_keeps_the_published_value(self):
+        self.assertEqual(LOGIC.apply_deadband(12.4, 12.5, 0.15), 12.4)
+        self.assertEqual(LOGIC.apply_deadband(12.4, 12.7, 0.15), 12.7)
+
+    def test_drift_is_measured_from_the_published_value(self):
+        published = 20
+        for reading in (21, 20, 21, 22):
+            published = LOGIC.apply_deadband(published, reading, 1.5)
+        self.assertEqual(published, 22)
+        self.assertEqual(LOGIC.apply_deadband(20, 21, 0), 21)
+        self.assertIsNone(LOGIC.apply_deadband(20, None, 1.5))
+
+
+class HaversineDistanceTests(unittest.TestCase):
+    def test_distance_in_metres(self):
+        # One thousandth of a degree of latitude is about 111 m.
+        self.assertAlmostEqual(
+            LOGIC.haversine_distance(51.5, -0.12, 51.501, -0.12), 111.2, delta=0.5
+        )
+        self.assertEqual(LOGIC.haversine_distance(51.5, -0.12, 51.5, -0.12), 0)
+
+    def test_compass_point(self):
+        self.assertEqual(LOGIC.compass_point(0), "N")
+        self.assertEqual(LOGIC.compass_point(100), "E")
+        self.assertEqual(LOGIC.compass_point(350), "N")
+
+
+class ListenersToNotifyTests(unittest.TestCase):
+    def test_only_listeners_reading_a_changed_field_are_notified(self):
+        listeners = [
+            ("soc", frozenset({"soc", "has_charging"})),
+            ("lock", frozenset({"lockStatus"})),
+            ("last_update", None),
+            ("brand", frozenset()),
+        ]
+        self.assertEqual(
+            LOGIC.listeners_to_notify(listeners, {"soc"}), ["soc", "last_update"]
+        )
+        self.assertEqual(LOGIC.listeners_to_notify(listeners, set()), ["last_update"])
+
+    def test_no_changed_set_notifies_everyone(self):
+        listeners = [("soc", frozenset({"soc"})), ("brand", frozenset())]
+        self.assertEqual(
+            LOGIC.listeners_to_notify(listeners, None), ["soc", "brand"]
+        )
+
+
+class RefreshQueueTests(unittest.TestCase):
+    def test_requests_within_the_window_share_one_fetch(self):
+        queue = LOGIC.RefreshQueue(timedelta(seconds=10))
+        now = timedelta(0)
+        queue.request("interval", now + timedelta(seconds=5))
+        queue.request("action", now, priority=2)
+        queue.request("post-shutdown", now + timedelta(minutes=2), priority=1)
+
+        served = queue.take_due(now)
+
+        self.assertEqual([r.reason for r in served], ["action", "interval"])
+        self.assertEqual([r.reason for r in queue.pending()], ["post-shutdown"])
+        self.assertEqual(queue.next_deadline(), timedelta(minutes=2))
+
+    def test_requesting_a_reason_again_moves_its_deadline(self):
+        queue = LOGIC.RefreshQueue(timedelta(seconds=10))
+        queue.request("interval", timedelta(minutes=5))
+        queue.request("interval", timedelta(minutes=15))
+
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.next_deadline(), timedelta(minutes=15))
+        self.assertEqual(queue.take_due(timedelta(0)), [])
+        self.assertEqual(
+            len(queue.take_due(timedelta(0), window=timedelta(minutes=15))), 1
+        )
+        self.assertIsNone(queue.next_deadline())
+
+    def test_a_slow_action_fetch_keeps_its_confirming_refresh(self):
+        queue = LOGIC.RefreshQueue(timedelta(seconds=10))
+        command = timedelta(0)
+        # schedule_action_refresh with the default 15 s after-action delay.
+        queue.request("action", command, priority=4)
+        queue.request("action confirm", command + timedelta(seconds=15), priority=4)
+        queue.request("action follow-up", command + timedelta(minutes=15), priority=4)
+
+        # The fetch started at the command and took 6 s.  Counted from its
+        # end the window would swallow the confirm; counted from its start
+        # the confirm still runs on its own.
+        finished = command + timedelta(seconds=6)
+        self.assertIn("action confirm", [r.reason for r in queue.due(finished)])
+        served = queue.take_due(command)
+
+        self.assertEqual([r.reason for r in served], ["action"])
+        self.assertEqual(queue.next_deadline(), command + timedelta(seconds=15))
+
+    def test_window_stays_below_the_after_action_delay(self):
+        limit = LOGIC.coalesce_window_limit
+        delay = timedelta(seconds=15)
+        self.assertEqual(limit(timedelta(seconds=10), delay), timedelta(seconds=10))
+        self.assertEqual(limit(timedelta(seconds=60), delay), timedelta(seconds=14))
+        self.assertEqual(
+            limit(timedelta(seconds=10), timedelta(seconds=1)), timedelta(0)
+        )
+
+
+class ChargeProgressTests(unittest.TestCase):
+    def test_finish_is_predicted_from_pack_power_at_first(self):
+        progress = LOGIC.ChargeProgress()
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        # 7.4 kW into a 74 kWh pack is 10 % per hour.
+        finish = progress.update(
+            now,
+            soc=50.0,
+            target_soc=80,
+            current=20.0,
+            voltage=370.0,
+            capacity_kwh=74.0,
+        )
+        self.assertEqual(finish, now + timedelta(hours=3))
+
+    def test_observed_rate_takes_over_once_the_soc_has_moved(self):
+        progress = LOGIC.ChargeProgress()
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        kwargs = dict(target_soc=80, current=20.0, voltage=370.0, capacity_kwh=74.0)
+        progress.update(now, soc=50.0, **kwargs)
+        # Only 5 % in the first hour: charging is slower than the pack
+        # power suggests.
+        finish = progress.update(now + timedelta(hours=1), soc=55.0, **kwargs)
+        self.assertEqual(finish, now + timedelta(hours=6))
+        self.assertIsNone(progress.update(now, soc=None, **kwargs))
+
+    def test_polls_get_denser_towards_the_finish(self):
+        floor, ceiling = timedelta(minutes=5), timedelta(minutes=30)
+        poll = LOGIC.charging_poll_interval
+        self.assertEqual(poll(timedelta(hours=5), floor, ceiling), ceiling)
+        self.assertEqual(
+            poll(timedelta(minutes=20), floor, ceiling), timedelta(minutes=10)
+        )
+        self.assertEqual(poll(timedelta(minutes=-3), floor, ceiling), floor)
+
+
+class UsageProfileTests(unittest.TestCase):
+    def test_learns_the_usual_start_hour(self):
+        profile = LOGIC.UsageProfile()
+        self.assertIsNone(profile.outlook(0, 8))
+        for _week in range(3):
+            for weekday in range(5):
+                profile.record("start", weekday, 8)
+
+        self.assertEqual(profile.outlook(0, 8), "likely")
+        self.assertEqual(profile.outlook(0, 3), "quiet")
+        # Sunday 23:00 → Monday 08:00.
+        self.assertEqual(profile.hours_until_likely(6, 23), 9)
+        self.assertIsNone(profile.hours_until_likely(5, 9))
+
+    def test_round_trips_through_its_stored_form(self):
+        profile = LOGIC.UsageProfile()
+        profile.record("plug", 2, 18)
+        restored = LOGIC.UsageProfile.from_dict(profile.as_dict())
+        self.assertEqual(restored.as_dict(), profile.as_dict())
+        self.assertEqual(
+            LOGIC.UsageProfile.from_dict({"plug": [1.0], "other": []}).as_dict(),
+            LOGIC.UsageProfile().as_dict(),
+        )
+
+
+class PlugInHistoryTests(unittest.TestCase):
+    def test_sequence_follows_the_observed_delays(self):
+        history = LOGIC.PlugInHistory()
+        default = [60, 120, 240, 480, 600]
+        for delay in (90, 100, 110):
+            history.record_stop("home", delay)
+        self.assertEqual(history.refresh_sequence(default), default)
+
+        for delay in (120, 130, 600, 900, 1000):
+            history.record_stop("home", delay)
+        # Quantiles at 110, 130, 900 and 1000 s; 130 is within a minute of
+        # the first refresh, so it is dropped.
+        self.assertEqual(history.refresh_sequence(default), [110, 790, 100])
+
+    def test_places_without_plug_ins_are_recognised(self):
+        history = LOGIC.PlugInHistory()
+        for _stop in range(3):
+            history.record_stop("shop", None)
+        history.record_stop("home", None)
+        self.assertTrue(history.never_plugged_in_at("shop"))
+        self.assertFalse(history.never_plugged_in_at("home"))
+
+        history.record_stop("shop", 300)
+        restored = LOGIC.PlugInHistory.from_dict(history.as_dict())
+        self.assertFalse(restored.never_plugged_in_at("shop"))
+        self.assertEqual(restored.delays, [300])
+        self.assertEqual(LOGIC.PlugInHistory.place(51.50012, -0.12), "51.500,-0.120")
+
 
 if __name__ == "__main__":
     unittest.main()